@@ -0,0 +1,93 @@
+"""
+AI path under load, fully offline: AI_BACKEND=fake behind the real pool,
+rate limiter, breaker, caches and duplicate checks.
+
+Every room asks _generate_ai_text for a few items back to back, all rooms
+at once, the way rooms whose lists ran dry would. Reports how many items
+came back, end-to-end latency per item and what the fake backend saw.
+
+    python Benchmarks/bench_ai_load.py
+    python Benchmarks/bench_ai_load.py --rooms 200 --latency lognormal:0.5:0.6 \\
+        --error-rate 0.1 --duplicate-rate 0.2 --max-rps 20
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--rooms", type=int, default=50)
+    ap.add_argument("--items", type=int, default=3, help="items each room asks for")
+    ap.add_argument("--latency", default="0.2-0.6")
+    ap.add_argument("--error-rate", type=float, default=0.02)
+    ap.add_argument("--duplicate-rate", type=float, default=0.1)
+    ap.add_argument("--max-rps", type=float, default=None)
+    ap.add_argument("--concurrency", type=int, default=8, help="AI_CONCURRENCY")
+    ap.add_argument("--rate-per-min", type=int, default=6000, help="AI_RATE_PER_MIN")
+    args = ap.parse_args()
+
+    os.environ.update({
+        "AI_BACKEND": "fake",
+        "AI_FAKE_LATENCY": args.latency,
+        "AI_FAKE_ERROR_RATE": str(args.error_rate),
+        "AI_FAKE_DUPLICATE_RATE": str(args.duplicate_rate),
+        "AI_FAKE_MAX_RPS": "" if args.max_rps is None else str(args.max_rps),
+        "AI_CONCURRENCY": str(args.concurrency),
+        "AI_QUEUE_PER_ROOM": str(args.items + 1),
+        "AI_RATE_PER_MIN": str(args.rate_per_min),
+        "AI_RATE_BURST": str(args.concurrency),
+        "AI_CACHE_PATH": os.path.join(tempfile.mkdtemp(), "bench_ai_cache.sqlite3"),
+    })
+    sys.path.insert(0, ROOT)
+
+    from Model.room import Room
+    from Model.ai_generator import get_ai_generator
+    from Controller.socket_events import helpers
+
+    latencies, misses = [], []
+    lock = threading.Lock()
+
+    def play(i):
+        room = Room(f"R{i:04d}")
+        for n in range(args.items):
+            kind = "truth" if n % 2 == 0 else "dare"
+            t0 = time.perf_counter()
+            text = helpers._generate_ai_text(room, kind, helpers._ai_context(room, kind))
+            dt = time.perf_counter() - t0
+            with lock:
+                (latencies if text else misses).append(dt)
+            if text:
+                (room.add_ai_generated_truth if kind == "truth" else room.add_ai_generated_dare)(text)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=play, args=(i,)) for i in range(args.rooms)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+
+    ai = get_ai_generator()
+    fake = ai.client
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] if latencies else 0
+
+    total = args.rooms * args.items
+    print(f"rooms={args.rooms} items/room={args.items} wall={wall:.1f}s")
+    print(f"served {len(latencies)}/{total}, missed {len(misses)}, "
+          f"{len(latencies) / wall:.1f} items/s")
+    print(f"latency p50={pct(50):.2f}s p95={pct(95):.2f}s p99={pct(99):.2f}s")
+    print(f"backend calls={fake.calls} failures={fake.failures} throttled={fake.throttled}")
+    print(f"breaker={ai.breaker.status()['state']} health={ai.health.snapshot()['latency_ms']}")
+
+
+if __name__ == "__main__":
+    main()
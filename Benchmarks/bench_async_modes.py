@@ -0,0 +1,179 @@
+"""
+Concurrent-room capacity: threading vs eventlet on one worker process.
+
+Every room plays a few short rounds through the real phase pipeline
+(scheduler -> selection -> truth/dare -> preparation) while a background
+task per room emulates a blocking network call (the Gemini request) each
+round. Each mode/room-count pair runs in its own subprocess, since
+eventlet has to monkey-patch before anything else is imported.
+
+    python Benchmarks/bench_async_modes.py
+    python Benchmarks/bench_async_modes.py --rooms 100 500 1000 --io-latency 0.5
+
+A mode "holds" a room count while p99 timer lateness stays under
+--max-lateness-ms and every room finishes its game.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _os_threads():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Threads:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import threading
+    return threading.active_count()
+
+
+def _rss_mb():
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    except ImportError:
+        return 0.0
+
+
+def run_child(mode, n_rooms, rounds, phase_s, io_latency):
+    os.environ["ASYNC_MODE"] = mode
+    sys.path.insert(0, ROOT)
+
+    import time
+    from app import socketio, game_manager
+    from Model.scheduler import get_scheduler
+    from Controller.socket_events.helpers import (
+        schedule_for_room,
+        start_selection_or_minigame,
+    )
+
+    lateness = []
+    sched = get_scheduler()
+    orig_next_due = sched._next_due
+
+    def timed_next_due():
+        t = orig_next_due()
+        lateness.append(time.monotonic() - t.when)
+        return t
+
+    sched._next_due = timed_next_due
+
+    def fake_network_call(rounds_left):
+        # stands in for a Gemini request: blocks its caller, not the process
+        for _ in range(rounds_left):
+            time.sleep(io_latency)
+
+    codes = []
+    for i in range(n_rooms):
+        code = game_manager.create_room()
+        game_manager.add_player_to_room(code, f"{code}-a", "A")
+        game_manager.add_player_to_room(code, f"{code}-b", "B")
+        room = game_manager.get_room(code)
+        room.settings.update({
+            "preparation_duration": phase_s,
+            "selection_duration": phase_s,
+            "truth_dare_duration": phase_s,
+            "minigame_chance": 0,
+            "ai_generation_enabled": False,
+        })
+        room.game_state.max_rounds = rounds
+        codes.append(code)
+
+    peak_threads = _os_threads()
+    t0 = time.monotonic()
+    for code in codes:
+        room = game_manager.get_room(code)
+        room.game_state.start_preparation(phase_s)
+        schedule_for_room(code, room, phase_s, start_selection_or_minigame, code)
+        socketio.start_background_task(fake_network_call, rounds)
+
+    ideal = rounds * 3 * phase_s
+    deadline = t0 + ideal * 4 + 10
+    while time.monotonic() < deadline:
+        peak_threads = max(peak_threads, _os_threads())
+        done = sum(
+            1 for c in codes
+            if game_manager.get_room(c).game_state.phase == "end_game"
+        )
+        if done == len(codes):
+            break
+        socketio.sleep(0.05)
+    elapsed = time.monotonic() - t0
+
+    lateness.sort()
+
+    def pct(p):
+        if not lateness:
+            return 0.0
+        return lateness[min(len(lateness) - 1, int(p * len(lateness)))] * 1000
+
+    print(json.dumps({
+        "mode": mode,
+        "rooms": n_rooms,
+        "finished": done,
+        "elapsed_s": round(elapsed, 2),
+        "ideal_s": round(ideal, 2),
+        "p50_ms": round(pct(0.50), 1),
+        "p99_ms": round(pct(0.99), 1),
+        "max_ms": round(pct(1.0), 1),
+        "peak_threads": peak_threads,
+        "rss_mb": round(_rss_mb(), 1),
+    }))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--modes", nargs="+", default=["threading", "eventlet"])
+    ap.add_argument("--rooms", nargs="+", type=int, default=[50, 200, 500, 1000])
+    ap.add_argument("--rounds", type=int, default=3)
+    ap.add_argument("--phase", type=float, default=0.5, help="seconds per phase")
+    ap.add_argument("--io-latency", type=float, default=0.3,
+                    help="seconds per emulated network call")
+    ap.add_argument("--max-lateness-ms", type=float, default=100.0)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        run_child(args.modes[0], args.rooms[0], args.rounds, args.phase, args.io_latency)
+        return
+
+    header = f"{'mode':<10}{'rooms':>7}{'done':>7}{'elapsed':>9}{'ideal':>7}" \
+             f"{'p50ms':>8}{'p99ms':>8}{'maxms':>9}{'threads':>9}{'rssMB':>8}"
+    print(header)
+    capacity = {}
+    for mode in args.modes:
+        capacity[mode] = 0
+        for n in args.rooms:
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child",
+                 "--modes", mode, "--rooms", str(n),
+                 "--rounds", str(args.rounds), "--phase", str(args.phase),
+                 "--io-latency", str(args.io_latency)],
+                capture_output=True, text=True, cwd=ROOT,
+            )
+            lines = [l for l in out.stdout.splitlines() if l.startswith("{")]
+            if not lines:
+                print(f"{mode:<10}{n:>7}  failed: {out.stderr.strip()[-200:]}")
+                continue
+            r = json.loads(lines[-1])
+            print(f"{r['mode']:<10}{r['rooms']:>7}{r['finished']:>7}{r['elapsed_s']:>9}"
+                  f"{r['ideal_s']:>7}{r['p50_ms']:>8}{r['p99_ms']:>8}{r['max_ms']:>9}"
+                  f"{r['peak_threads']:>9}{r['rss_mb']:>8}")
+            if r["finished"] == n and r["p99_ms"] <= args.max_lateness_ms:
+                capacity[mode] = n
+
+    print()
+    for mode, n in capacity.items():
+        print(f"{mode}: holds {n} concurrent rooms "
+              f"(p99 timer lateness <= {args.max_lateness_ms:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
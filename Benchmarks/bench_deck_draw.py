@@ -0,0 +1,94 @@
+"""
+Draw-and-remove cost per player list: old list scan vs the slot deck.
+
+"old" is what start_truth_dare_phase_handler used to do per round:
+random.choice over the list, rebuild it without the drawn text, then
+regex-normalize the text again to mark it used. "deck" is
+TruthDareList.draw_truth plus mark_truth_used with the item's cached key.
+
+    python Benchmarks/bench_deck_draw.py
+    python Benchmarks/bench_deck_draw.py --sizes 1000 5000 20000 --draws 200
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Model.player import Player
+from Model.truth_dare import Truth
+from Model.truth_dare_deck import SharedDeck
+
+
+def _old_norm(text):
+    return re.sub(r"[^a-z0-9]+", "", text.strip().lower())
+
+
+def bench_old(texts, draws):
+    items = [Truth(t, is_default=True) for t in texts]
+    used = set()
+    t0 = time.perf_counter()
+    for _ in range(draws):
+        ch = random.choice(items)
+        items = [t for t in items if t.text != ch.text]
+        used.add(_old_norm(ch.text))
+    return time.perf_counter() - t0
+
+
+def bench_deck(texts, draws):
+    deck = SharedDeck.from_texts(texts, [])
+    p = Player("bench", "Bench")
+    p.truth_dare_list.use_deck(deck)
+    lst = p.truth_dare_list
+    t0 = time.perf_counter()
+    for _ in range(draws):
+        ch = lst.draw_truth()
+        p.mark_truth_used(ch.text, ch.norm)
+    return time.perf_counter() - t0
+
+
+def player_memory(texts, players, use_deck):
+    deck = SharedDeck.from_texts(texts, [])
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = []
+    for i in range(players):
+        if use_deck:
+            p = Player(f"s{i}", f"P{i}")
+            p.truth_dare_list.use_deck(deck)
+            for _ in range(10):   # a game's worth of draws
+                p.truth_dare_list.draw_truth()
+            keep.append(p)
+        else:
+            keep.append([Truth(t, is_default=True) for t in texts])
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / players
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", nargs="+", type=int, default=[1000, 5000, 20000])
+    ap.add_argument("--draws", type=int, default=200)
+    ap.add_argument("--players", type=int, default=50)
+    args = ap.parse_args()
+
+    print(f"{'items':>7}{'old us/draw':>14}{'deck us/draw':>14}{'speedup':>9}"
+          f"{'old KB/player':>15}{'deck KB/player':>16}")
+    for n in args.sizes:
+        texts = [f"Truth number {i}: what would you do?" for i in range(n)]
+        draws = min(args.draws, n)
+        old = bench_old(texts, draws) / draws * 1e6
+        new = bench_deck(texts, draws) / draws * 1e6
+        old_mem = player_memory(texts, args.players, use_deck=False) / 1024
+        new_mem = player_memory(texts, args.players, use_deck=True) / 1024
+        print(f"{n:>7}{old:>14.1f}{new:>14.1f}{old / new:>8.0f}x"
+              f"{old_mem:>15.1f}{new_mem:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
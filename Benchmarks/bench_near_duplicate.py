@@ -0,0 +1,95 @@
+"""
+Near-duplicate lookup: brute-force pairwise Jaccard vs MinHash/LSH.
+
+"brute" compares the query's word shingles with every stored item's using
+the same is_near() check, the obvious way to catch rewordings. "lsh" is NearDuplicateIndex.find,
+timed with a fresh signature per query (the cached case is cheaper still).
+Queries are stored items with a word swapped or appended, plus unrelated
+texts; recall is measured against the brute-force answer.
+
+    python Benchmarks/bench_near_duplicate.py
+    python Benchmarks/bench_near_duplicate.py --sizes 1000 5000 20000 --queries 500
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Model.near_duplicate import NearDuplicateIndex, DEFAULT_THRESHOLD, is_near, minhash_signature, word_shingles
+from Model.truth_dare import normalize_text
+
+WORDS = ("what who when where would could your most best worst funniest secret fear "
+         "dream job crush friend family school movie song food game trip phone lie "
+         "embarrassing weird favorite never ever done said eaten bought lost found").split()
+
+
+def _sentence(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 10))) + "?"
+
+
+def _queries(rng, texts, n):
+    out = []
+    for i in range(n):
+        if i % 2:
+            out.append(_sentence(rng))   # probably nothing close
+            continue
+        words = rng.choice(texts).rstrip("?").split()
+        if rng.random() < 0.5:
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+        else:
+            words.append(rng.choice(WORDS))
+        out.append(" ".join(words) + "?")
+    return out
+
+
+def bench_brute(stored, queries, threshold):
+    sets = [word_shingles(t) for t in stored.values()]
+    word_shingles.cache_clear()
+    hits = []
+    t0 = time.perf_counter()
+    for q in queries:
+        qs = word_shingles(q)
+        hits.append(any(is_near(qs, s, threshold) for s in sets))
+    return time.perf_counter() - t0, hits
+
+
+def bench_lsh(stored, queries, threshold):
+    idx = NearDuplicateIndex(threshold)
+    for n, t in stored.items():
+        idx.add(t, n)
+    minhash_signature.cache_clear()
+    word_shingles.cache_clear()
+    hits = []
+    t0 = time.perf_counter()
+    for q in queries:
+        hits.append(idx.find(q, normalize_text(q)) is not None)
+    return time.perf_counter() - t0, hits
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--sizes", nargs="+", type=int, default=[1000, 5000, 20000])
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    print(f"{'items':>7}{'brute ms/check':>16}{'lsh ms/check':>14}{'speedup':>9}{'recall':>8}{'extra hits':>12}")
+    for size in args.sizes:
+        texts = [_sentence(rng) for _ in range(size)]
+        stored = {normalize_text(t): t for t in texts}
+        queries = _queries(rng, texts, args.queries)
+        b_t, b_hits = bench_brute(stored, queries, args.threshold)
+        l_t, l_hits = bench_lsh(stored, queries, args.threshold)
+        found = sum(b and l for b, l in zip(b_hits, l_hits))
+        recall = found / max(1, sum(b_hits))
+        extra = sum(l and not b for b, l in zip(b_hits, l_hits))
+        b_ms, l_ms = b_t / len(queries) * 1e3, l_t / len(queries) * 1e3
+        print(f"{size:>7}{b_ms:>16.3f}{l_ms:>14.3f}{b_ms / l_ms:>8.0f}x{recall:>8.2f}{extra:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from flask_socketio import emit
 from flask import request
 
-from Model.ai_generator import get_ai_generator
+from Model.ai_generator import get_ai_generator, get_ai_health_prober
+from Model.ai_usage import over_budget
 
 
 def register_ai_events(socketio, game_manager):
@@ -24,9 +25,12 @@ def register_ai_events(socketio, game_manager):
             ai_gen = get_ai_generator()
             status = ai_gen.get_status()
 
+            # answered from the background prober's last result, never a live call;
+            # run_test just asks it to probe again soon
             test_res = None
             if data.get("run_test", False):
-                test_res = ai_gen.test_generation()
+                get_ai_health_prober().poke()
+                test_res = status["health"]["last_probe"]
 
             emit(
                 "ai_status_result",
@@ -36,6 +40,8 @@ def register_ai_events(socketio, game_manager):
                     "room_ai_enabled": room.settings.get(
                         "ai_generation_enabled", False
                     ),
+                    "room_usage": room.ai_usage.snapshot(),
+                    "room_over_budget": over_budget(room.ai_usage),
                 },
                 to=request.sid,
             )
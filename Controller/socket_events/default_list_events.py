@@ -4,6 +4,20 @@ from flask import request
 import json
 
 
+def _apply_defaults_edit(room, edit, *args):
+    # edit + resync everyone's lists as one mailbox job;
+    # add/edit hand back False when nothing changed
+    ok = edit(*args)
+    if ok is not False:
+        room.update_all_players_defaults()
+    return ok
+
+
+def _replace_defaults(room, truths, dares):
+    room.set_defaults(truths, dares)
+    room.update_all_players_defaults()
+
+
 def register_default_list_events(socketio, game_manager):
 
     @socketio.on("get_default_lists")
@@ -45,11 +59,11 @@ def register_default_list_events(socketio, game_manager):
             if not room.is_host(request.sid):   # only host can edit presets
                 return
 
-            ok = room.add_default_truth(text)
+            ok = room.mailbox.call(
+                _apply_defaults_edit, room, room.add_default_truth, text
+            )
 
             if ok:
-                room.update_all_players_defaults()
-
                 emit(
                     "default_lists_updated",
                     {
@@ -77,11 +91,11 @@ def register_default_list_events(socketio, game_manager):
             if not room.is_host(request.sid):
                 return
 
-            ok = room.add_default_dare(text)
+            ok = room.mailbox.call(
+                _apply_defaults_edit, room, room.add_default_dare, text
+            )
 
             if ok:
-                room.update_all_players_defaults()
-
                 emit(
                     "default_lists_updated",
                     {
@@ -110,11 +124,11 @@ def register_default_list_events(socketio, game_manager):
             if not room.is_host(request.sid):
                 return
 
-            ok = room.edit_default_truth(old_text, new_text)
+            ok = room.mailbox.call(
+                _apply_defaults_edit, room, room.edit_default_truth, old_text, new_text
+            )
 
             if ok:
-                room.update_all_players_defaults()
-
                 emit(
                     "default_lists_updated",
                     {
@@ -143,11 +157,11 @@ def register_default_list_events(socketio, game_manager):
             if not room.is_host(request.sid):
                 return
 
-            ok = room.edit_default_dare(old_text, new_text)
+            ok = room.mailbox.call(
+                _apply_defaults_edit, room, room.edit_default_dare, old_text, new_text
+            )
 
             if ok:
-                room.update_all_players_defaults()
-
                 emit(
                     "default_lists_updated",
                     {
@@ -175,8 +189,9 @@ def register_default_list_events(socketio, game_manager):
             if not room.is_host(request.sid):
                 return
 
-            room.remove_default_truths(to_rm)
-            room.update_all_players_defaults()
+            room.mailbox.call(
+                _apply_defaults_edit, room, room.remove_default_truths, to_rm
+            )
 
             emit(
                 "default_lists_updated",
@@ -205,8 +220,9 @@ def register_default_list_events(socketio, game_manager):
             if not room.is_host(request.sid):
                 return
 
-            room.remove_default_dares(to_rm)
-            room.update_all_players_defaults()
+            room.mailbox.call(
+                _apply_defaults_edit, room, room.remove_default_dares, to_rm
+            )
 
             emit(
                 "default_lists_updated",
@@ -323,14 +339,12 @@ def register_default_list_events(socketio, game_manager):
                 )
                 return
 
-            room.default_truths = [
-                t.strip() for t in preset["truths"] if t.strip()
-            ]
-            room.default_dares = [
-                d.strip() for d in preset["dares"] if d.strip()
-            ]
-
-            room.update_all_players_defaults()
+            room.mailbox.call(
+                _replace_defaults,
+                room,
+                [t.strip() for t in preset["truths"] if t.strip()],
+                [d.strip() for d in preset["dares"] if d.strip()],
+            )
 
             emit(
                 "default_lists_updated",
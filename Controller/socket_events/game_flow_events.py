@@ -1,14 +1,148 @@
-import threading
-import time
-
-from flask_socketio import emit
 from flask import request
 
-from .helpers import start_selection_or_minigame, start_truth_dare_phase_handler
+from .helpers import (
+    schedule_for_room,
+    start_selection_or_minigame,
+    start_truth_dare_phase_handler,
+    rearm_truth_dare_timer,
+    prefetch_ai_items,
+)
 
 
 def register_game_flow_events(socketio, game_manager):
 
+    # everything below the handlers runs inside the room's mailbox, so it only
+    # gets the sid it needs passed in and emits through socketio directly
+
+    def _start_game(room, rc):
+        cdur = room.settings["countdown_duration"]
+        room.game_state.start_countdown(duration=cdur)
+
+        socketio.emit("game_state_update", room.game_state.to_dict(), room=rc)
+
+        # countdown -> prep -> then selection/minigame, all on the shared timer
+        def start_prep():
+            try:
+                pdur = room.settings["preparation_duration"]
+                room.game_state.start_preparation(duration=pdur)
+
+                room.reset_player_round_submissions()
+
+                socketio.emit(
+                    "game_state_update",
+                    room.game_state.to_dict(),
+                    room=rc,
+                    namespace="/",
+                )
+
+                prefetch_ai_items(rc, room)
+                schedule_for_room(rc, room, pdur, start_selection_or_minigame, rc)
+            except Exception as e:
+                print(f"[ERROR] start_preparation: {e}")
+
+        schedule_for_room(rc, room, cdur, start_prep)
+
+    def _restart_game(room, rc):
+        room.reset_for_new_game()
+
+        # just reuse start logic
+        _start_game(room, rc)
+
+    def _select_truth_dare(room, rc, sid, choice):
+        if room.game_state.phase != "selection":
+            return
+
+        player = room.get_player_by_sid(sid)
+        if not player or player.name != room.game_state.selected_player:
+            return
+
+        room.game_state.set_selected_choice(choice)
+
+        socketio.emit("game_state_update", room.game_state.to_dict(), room=rc)
+
+    def _to_selection(room, rc, loser):
+        room.game_state.set_selected_player(loser.name)
+
+        sel_dur = room.settings["selection_duration"]
+        room.game_state.start_selection(duration=sel_dur)
+
+        socketio.emit(
+            "game_state_update",
+            room.game_state.to_dict(),
+            room=rc,
+            namespace="/",
+        )
+
+        # delay then go into truth/dare
+        schedule_for_room(rc, room, sel_dur, start_truth_dare_phase_handler, rc)
+
+    def _minigame_vote(room, rc, sid, voted_player):
+        if room.game_state.phase != "minigame":
+            return
+
+        mg = room.game_state.minigame
+        if not mg:
+            return
+
+        player = room.get_player_by_sid(sid)
+        if not player:
+            return
+
+        names = mg.get_participant_names()
+        if player.name in names:
+            return
+
+        if sid in mg.votes:
+            return
+
+        mg.add_vote(sid, voted_player)
+
+        loser = mg.check_immediate_winner()
+
+        if loser:
+            _to_selection(room, rc, loser)
+        elif mg.check_all_voted():
+            vote_counts = mg.get_vote_counts()
+
+            if len(vote_counts) == 2:
+                counts = list(vote_counts.values())
+                if counts[0] == counts[1]:
+                    loser = mg.handle_tie()
+                else:
+                    loser = mg.determine_loser()
+            else:
+                loser = mg.determine_loser()
+
+            if loser:
+                _to_selection(room, rc, loser)
+        else:
+            socketio.emit("game_state_update", room.game_state.to_dict(), room=rc)
+
+    def _vote_skip(room, rc, sid):
+        if room.game_state.phase != "truth_dare":
+            return
+
+        if room.game_state.skip_activated:
+            return
+
+        player = room.get_player_by_sid(sid)
+        if not player or player.name == room.game_state.selected_player:
+            return
+
+        room.game_state.add_skip_vote(sid)
+
+        others = len(room.players) - 1
+        need = (others + 1) // 2   # half of the others
+
+        if room.game_state.get_skip_vote_count() >= need:
+            room.game_state.activate_skip()
+
+            sk = room.settings["skip_duration"]
+            room.game_state.reduce_timer(sk)
+            rearm_truth_dare_timer(rc, room)
+
+        socketio.emit("game_state_update", room.game_state.to_dict(), room=rc)
+
     @socketio.on("start_game")
     def on_start_game(data):
         try:
@@ -24,45 +158,7 @@ def register_game_flow_events(socketio, game_manager):
             if not room.is_host(request.sid):
                 return
 
-            cdur = room.settings["countdown_duration"]
-            room.game_state.start_countdown(duration=cdur)
-
-            emit("game_state_update", room.game_state.to_dict(), room=rc)
-
-            # countdown -> prep -> then selection/minigame in background
-            def start_prep():
-                try:
-                    time.sleep(cdur)
-                    room_inner = game_manager.get_room(rc)
-                    if room_inner:
-                        pdur = room_inner.settings["preparation_duration"]
-                        room_inner.game_state.start_preparation(duration=pdur)
-
-                        room_inner.reset_player_round_submissions()
-
-                        socketio.emit(
-                            "game_state_update",
-                            room_inner.game_state.to_dict(),
-                            room=rc,
-                            namespace="/",
-                        )
-
-                        def after_prep():
-                            try:
-                                time.sleep(pdur)
-                                start_selection_or_minigame(rc)
-                            except Exception as e:
-                                print(f"[ERROR] after_prep: {e}")
-
-                        t2 = threading.Thread(target=after_prep)
-                        t2.daemon = True
-                        t2.start()
-                except Exception as e:
-                    print(f"[ERROR] start_preparation: {e}")
-
-            t = threading.Thread(target=start_prep)
-            t.daemon = True
-            t.start()
+            room.mailbox.call(_start_game, room, rc)
         except Exception as e:
             print(f"[ERROR] start_game: {e}")
 
@@ -81,15 +177,7 @@ def register_game_flow_events(socketio, game_manager):
             if not room.is_host(request.sid):
                 return
 
-            room.reset_for_new_game()
-
-            cdur = room.settings["countdown_duration"]
-            room.game_state.start_countdown(duration=cdur)
-
-            emit("game_state_update", room.game_state.to_dict(), room=rc)
-
-            # just reuse start logic
-            on_start_game({"room": rc})
+            room.mailbox.call(_restart_game, room, rc)
         except Exception as e:
             print(f"[ERROR] restart_game: {e}")
 
@@ -106,16 +194,7 @@ def register_game_flow_events(socketio, game_manager):
             if not room:
                 return
 
-            if room.game_state.phase != "selection":
-                return
-
-            player = room.get_player_by_sid(request.sid)
-            if not player or player.name != room.game_state.selected_player:
-                return
-
-            room.game_state.set_selected_choice(choice)
-
-            emit("game_state_update", room.game_state.to_dict(), room=rc)
+            room.mailbox.call(_select_truth_dare, room, rc, request.sid, choice)
         except Exception as e:
             print(f"[ERROR] select_truth_dare: {e}")
 
@@ -132,89 +211,7 @@ def register_game_flow_events(socketio, game_manager):
             if not room:
                 return
 
-            if room.game_state.phase != "minigame":
-                return
-
-            mg = room.game_state.minigame
-            if not mg:
-                return
-
-            player = room.get_player_by_sid(request.sid)
-            if not player:
-                return
-
-            names = mg.get_participant_names()
-            if player.name in names:
-                return
-
-            if request.sid in mg.votes:
-                return
-
-            mg.add_vote(request.sid, voted_player)
-
-            loser = mg.check_immediate_winner()
-
-            if loser:
-                room.game_state.set_selected_player(loser.name)
-
-                sel_dur = room.settings["selection_duration"]
-                room.game_state.start_selection(duration=sel_dur)
-
-                socketio.emit(
-                    "game_state_update",
-                    room.game_state.to_dict(),
-                    room=rc,
-                    namespace="/",
-                )
-
-                # delay then go into truth/dare
-                def start_td():
-                    try:
-                        time.sleep(sel_dur)
-                        start_truth_dare_phase_handler(rc)
-                    except Exception as e:
-                        print(f"[ERROR] start_td: {e}")
-
-                td_thread = threading.Thread(target=start_td)
-                td_thread.daemon = True
-                td_thread.start()
-            elif mg.check_all_voted():
-                vote_counts = mg.get_vote_counts()
-
-                if len(vote_counts) == 2:
-                    counts = list(vote_counts.values())
-                    if counts[0] == counts[1]:
-                        loser = mg.handle_tie()
-                    else:
-                        loser = mg.determine_loser()
-                else:
-                    loser = mg.determine_loser()
-
-                if loser:
-                    room.game_state.set_selected_player(loser.name)
-
-                    sel_dur = room.settings["selection_duration"]
-                    room.game_state.start_selection(duration=sel_dur)
-
-                    socketio.emit(
-                        "game_state_update",
-                        room.game_state.to_dict(),
-                        room=rc,
-                        namespace="/",
-                    )
-
-                    def start_td2():
-                        try:
-                            time.sleep(sel_dur)
-                            start_truth_dare_phase_handler(rc)
-                        except Exception as e:
-                            print(f"[ERROR] start_td: {e}")
-
-                    td_thread = threading.Thread(target=start_td2)
-                    td_thread.daemon = True
-                    td_thread.start()
-            else:
-                emit("game_state_update", room.game_state.to_dict(), room=rc)
+            room.mailbox.call(_minigame_vote, room, rc, request.sid, voted_player)
         except Exception as e:
             print(f"[ERROR] minigame_vote: {e}")
 
@@ -230,27 +227,6 @@ def register_game_flow_events(socketio, game_manager):
             if not room:
                 return
 
-            if room.game_state.phase != "truth_dare":
-                return
-
-            if room.game_state.skip_activated:
-                return
-
-            player = room.get_player_by_sid(request.sid)
-            if not player or player.name == room.game_state.selected_player:
-                return
-
-            room.game_state.add_skip_vote(request.sid)
-
-            others = len(room.players) - 1
-            need = (others + 1) // 2   # half of the others
-
-            if room.game_state.get_skip_vote_count() >= need:
-                room.game_state.activate_skip()
-
-                sk = room.settings["skip_duration"]
-                room.game_state.reduce_timer(sk)
-
-            emit("game_state_update", room.game_state.to_dict(), room=rc)
+            room.mailbox.call(_vote_skip, room, rc, request.sid)
         except Exception as e:
             print(f"[ERROR] vote_skip: {e}")
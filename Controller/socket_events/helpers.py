@@ -2,31 +2,57 @@ import threading
 import time
 import random
 import logging
-import re
 
 from Model.scoring_system import ScoringSystem
 from Model.round_record import RoundRecord
 from Model.minigame import StaringContest, ArmWrestlingContest
-from Model.ai_generator import get_ai_generator
-from Model.truth_dare import Truth, Dare
+from Model.ai_generator import get_ai_generator, get_ai_health_prober
+from Model.ai_pool import get_ai_pool, AIPoolFull
+from Model.ai_cache import get_ai_cache
+from Model.ai_content_pool import get_shared_ai_content
+from Model import ai_usage
+from Model.scheduler import get_scheduler
+from Model import room_mailbox
+from Model.truth_dare import Truth, Dare, normalize_text
 
 logger = logging.getLogger(__name__)
 _socketio = None
 _game_mgr = None
 
-_ai_lock = threading.Lock()
+_AI_SLOT_TIMEOUT = 20   # seconds to wait for a free AI slot before giving up
+_AI_BUDGET_SHARE = 0.1   # part of the truth/dare duration the AI gets before the local fallback
+_AI_BUDGET_MIN = 2
+_AI_BUDGET_MAX = 8
+_LOCAL_SOURCE = "Local generator"   # submitted_by for LocalGenerator items
 
 
 def init_socket_helpers(socketio, game_manager):
     global _socketio, _game_mgr
     _socketio = socketio
     _game_mgr = game_manager
+    # timers and room mailboxes run as green threads under eventlet, normal threads otherwise
+    get_scheduler().set_spawner(socketio.start_background_task)
+    room_mailbox.set_spawner(socketio.start_background_task)
+    # AI health is probed in the background, check_ai_status only reads the snapshot
+    get_ai_health_prober().start(socketio.start_background_task)
     print(f"[HELPERS_INIT] SocketIO linked, GameManager id={id(game_manager)}")
 
 
-def _clean_text(txt):
-    """Normalize text for duplicate comparison"""
-    return re.sub(r"[^a-z0-9]+", "", txt.strip().lower())
+def spawn_background(fn, *args):
+    """Start fn in the background using whatever async mode Socket.IO runs in."""
+    if _socketio:
+        return _socketio.start_background_task(fn, *args)
+    t = threading.Thread(target=fn, args=args, daemon=True)
+    t.start()
+    return t
+
+
+def _sleep(seconds):
+    # cooperative under eventlet, plain time.sleep under threading
+    if _socketio:
+        _socketio.sleep(seconds)
+    else:
+        time.sleep(seconds)
 
 
 def _emit_room_state(code, room_obj):
@@ -46,6 +72,27 @@ def _broadcast_room_state(code, room_obj):
     _emit_room_state(code, room_obj)
 
 
+def schedule_for_room(room_code, room, delay, fn, *args):
+    """
+    Run fn(*args) in the room's mailbox after delay, but only if the room
+    still exists and is still on the same game (epoch) it was scheduled for.
+    """
+    return get_scheduler().call_later(
+        delay, room.mailbox.post,
+        _run_if_current, room_code, room, room.game_state.epoch, fn, args,
+        key=room_code,
+    )
+
+
+def _run_if_current(room_code, room, epoch, fn, args):
+    if not _game_mgr:
+        return
+    if _game_mgr.get_room(room_code) is not room or room.game_state.epoch != epoch:
+        logger.info(f"Dropping stale {fn.__name__} timer for room {room_code}")
+        return
+    fn(*args)
+
+
 def start_selection_or_minigame(room_code):
     if not _game_mgr:
         logger.warning("Game manager not available – skipping selection/minigame.")
@@ -90,11 +137,9 @@ def start_selection_or_minigame(room_code):
             _socketio.emit("game_state_update", room.game_state.to_dict(), room=room_code)
 
             # delay then go to truth or dare
-            def later():
-                time.sleep(sel_t)
-                start_truth_dare_phase_handler(room_code)
-
-            threading.Thread(target=later, daemon=True).start()
+            schedule_for_room(
+                room_code, room, sel_t, start_truth_dare_phase_handler, room_code
+            )
 
     except Exception as ex:
         logger.exception(f"start_selection_or_minigame() blew up: {ex}")
@@ -119,207 +164,438 @@ def start_truth_dare_phase_handler(room_code):
         if selected:
             kind = room.game_state.selected_choice
             if kind == "truth":
-                truths = selected.truth_dare_list.truths
-                if truths:
-                    ch = random.choice(truths)
-                    selected.truth_dare_list.remove_truth_by_text(ch.text)
-                    selected.mark_truth_used(ch.text)
-                    room.game_state.set_current_truth_dare(ch.to_dict())
-                else:
-                    no_more = not _try_generate_ai_item(room, selected, "truth")
+                ch = selected.truth_dare_list.draw_truth()
+                if ch:
+                    selected.mark_truth_used(ch.text, ch.norm)
             else:
-                dares = selected.truth_dare_list.dares
-                if dares:
-                    ch = random.choice(dares)
-                    selected.truth_dare_list.remove_dare_by_text(ch.text)
-                    selected.mark_dare_used(ch.text)
-                    room.game_state.set_current_truth_dare(ch.to_dict())
-                else:
-                    no_more = not _try_generate_ai_item(room, selected, "dare")
+                ch = selected.truth_dare_list.draw_dare()
+                if ch:
+                    selected.mark_dare_used(ch.text, ch.norm)
+
+            if ch:
+                room.game_state.set_current_truth_dare(ch.to_dict())
+            elif _serve_buffered_ai_item(room, selected, kind):
+                pass
+            elif _ai_available(room):
+                # list ran dry: phase starts now with a placeholder, AI fills it in later
+                _start_ai_generation(room_code, room, selected, kind)
+                return
+            else:
+                _set_no_more_item(room, selected, kind)
+                no_more = True
 
-        td_time = room.settings["truth_dare_duration"]
-        room.game_state.start_truth_dare(td_time)
+        _begin_truth_dare(room_code, room, no_more)
 
-        if no_more:
-            room.game_state.list_empty = True
-            room.game_state.activate_skip()
-            room.game_state.reduce_timer(room.settings["skip_duration"])
+    except Exception as err:
+        logger.exception(f"Exception in start_truth_dare_phase_handler: {err}")
 
-        _socketio.emit("game_state_update", room.game_state.to_dict(), room=room_code)
 
-        # watch the timer in a cheap while loop
-        threading.Thread(
-            target=lambda: _monitor_truth_dare(room_code),
-            daemon=True
-        ).start()
+def _begin_truth_dare(room_code, room, no_more):
+    td_time = room.settings["truth_dare_duration"]
+    room.game_state.start_truth_dare(td_time)
 
-    except Exception as err:
-        logger.exception(f"Exception in start_truth_dare_phase_handler: {err}")
+    if no_more:
+        room.game_state.list_empty = True
+        room.game_state.activate_skip()
+        room.game_state.reduce_timer(room.settings["skip_duration"])
+
+    _socketio.emit("game_state_update", room.game_state.to_dict(), room=room_code)
+
+    # end of round fires off the phase deadline, skips re-arm it
+    rearm_truth_dare_timer(room_code, room)
+
+
+def _set_no_more_item(room, player, item_type):
+    room.game_state.list_empty = True
+    room.game_state.set_current_truth_dare(
+        {
+            "text": f"{player.name} has no more {item_type}s available!",
+            "type": item_type,
+            "is_default": False,
+            "submitted_by": None,
+        }
+    )
+
+
+def _ai_available(room):
+    if not room.settings.get("ai_generation_enabled", False):
+        logger.info("AI generation is disabled in room settings")
+        return False
+    if not get_ai_generator().enabled:
+        logger.warning("AI generator not enabled")
+        return False
+    return True
 
 
-def _try_generate_ai_item(room, player, item_type):
+def _start_ai_generation(room_code, room, player, item_type):
     """
-    Try to generate AI item with proper duplicate prevention.
-    
-    CRITICAL FIX: Keep original text separate from normalized text.
-    - Pass ORIGINAL text to AI for context
-    - Use NORMALIZED text for duplicate checking
+    Start the truth/dare phase with a placeholder and generate the real item
+    in the background. The phase clock only starts once the item lands, so
+    API latency never eats into the player's time. If the AI takes longer
+    than its budget, a local item is used instead (see _on_ai_budget_expired).
     """
+    logger.info(f"🚨 AI GENERATION TRIGGERED - Player: {player.name}, Type: {item_type}, Round: {room.game_state.current_round}")
+
+    gs = room.game_state
+    gs.set_current_truth_dare(
+        {
+            "text": f"Generating a {item_type} for {player.name}…",
+            "type": item_type,
+            "is_default": False,
+            "submitted_by": None,
+            "generating": True,
+        }
+    )
+    gs.start_generating()
+    # replaced by the real deadline timer if the AI item lands in time
+    room.set_phase_timer(schedule_for_room(
+        room_code, room, _ai_budget(room), _on_ai_budget_expired,
+        room_code, room, gs.current_round, player, item_type,
+    ))
+    _socketio.emit("game_state_update", gs.to_dict(), room=room_code)
+
+    # context is read here, inside the mailbox, the network part runs outside it
+    context = _ai_context(room, item_type)
+    spawn_background(
+        _generate_in_background,
+        room_code, room, gs.epoch, gs.current_round, player, item_type, context,
+    )
+
+
+def _generate_in_background(room_code, room, epoch, round_no, player, item_type, context):
+    generated = None
     try:
-        # Debug logging
-        logger.info(f"🚨 AI GENERATION TRIGGERED - Player: {player.name}, Type: {item_type}, Round: {room.game_state.current_round}")
-        
-        # Track AI calls per game
-        if not hasattr(room, '_ai_call_count'):
-            room._ai_call_count = 0
-        room._ai_call_count += 1
-        logger.info(f"🚨 TOTAL AI CALLS THIS GAME: {room._ai_call_count}")
-        
-        if not room.settings.get("ai_generation_enabled", False):
-            logger.info("AI generation is disabled in room settings")
-            return False
-
-        ai_gen = get_ai_generator()
-        if not ai_gen.enabled:
-            logger.warning("AI generator not enabled")
-            return False
-
-        # ===== FIX #1: Separate ORIGINAL text from NORMALIZED text =====
-        
-        # Collect ORIGINAL text for AI context
-        if item_type == "truth":
-            original_texts = list(room.default_truths)
-            original_texts.extend(room.ai_generated_truths)
-        else:
-            original_texts = list(room.default_dares)
-            original_texts.extend(room.ai_generated_dares)
-        
-        # Collect from all players (original text)
-        for p in room.players:
-            if item_type == "truth":
-                original_texts.extend(p.get_all_used_truths())
-                original_texts.extend([t.text for t in p.truth_dare_list.truths])
-            else:
-                original_texts.extend(p.get_all_used_dares())
-                original_texts.extend([d.text for d in p.truth_dare_list.dares])
-        
-        # Build NORMALIZED set for duplicate checking (separate from originals)
-        existing_normalized = set(_clean_text(txt) for txt in original_texts)
-        
-        # Debug logging
-        logger.info(f"🔍 Total original items collected: {len(original_texts)}")
-        logger.info(f"🔍 First 3 originals: {original_texts[:3]}")
-        logger.info(f"🔍 Normalized set size: {len(existing_normalized)}")
-        logger.info(f"🔍 First 3 normalized: {list(existing_normalized)[:3]}")
-
-        # ===== FIX #2: Reduce retry attempts from 5 to 3 =====
-        for attempt in range(3):  # Reduced from 5 to 3
-            logger.info(f"🔄 AI generation attempt {attempt + 1}/3")
-            
-            # ===== FIX #3: Exponential backoff instead of random delay =====
-            if attempt > 0:
-                # Exponential backoff: 2^attempt + small random jitter
-                delay = min(10, (2 ** attempt) + random.uniform(0, 1))
-                logger.info(f"⏱️ Waiting {delay:.2f}s before retry...")
-                time.sleep(delay)
-            else:
-                # Small initial delay to avoid hitting rate limits
-                time.sleep(random.uniform(0.3, 0.7))
+        generated = _generate_ai_text(room, item_type, context)
+    except Exception as e:
+        logger.exception(f"💥 CRITICAL ERROR in AI generation: {e}")
+    # back into the room's mailbox, dropped if the game was restarted/destroyed meanwhile
+    room.mailbox.post(
+        _run_if_current, room_code, room, epoch,
+        _deliver_ai_item, (room_code, room, round_no, player, item_type, generated),
+    )
+
+
+def _ai_budget(room):
+    # how long the player may stare at the placeholder before we stop waiting on the AI
+    share = room.settings["truth_dare_duration"] * _AI_BUDGET_SHARE
+    return min(_AI_BUDGET_MAX, max(_AI_BUDGET_MIN, share))
+
+
+def _still_waiting_for(room, round_no, player):
+    gs = room.game_state
+    return (gs.phase == gs.PHASE_TRUTH_DARE and gs.generating and not gs.skip_activated
+            and gs.current_round == round_no and gs.selected_player == player.name)
+
+
+def _deliver_ai_item(room_code, room, round_no, player, item_type, generated):
+    if not _still_waiting_for(room, round_no, player):
+        if generated:
+            # the local fallback (or a skip) got there first, keep it for a later round
+            logger.info(f"AI {item_type} for {player.name} arrived late, buffering it")
+            _buffer_ai_item(room, item_type, generated)
+        return
+
+    if not (generated and _apply_ai_item(room, player, item_type, generated)):
+        logger.error(f"❌ AI GENERATION FAILED - No unique {item_type} for {player.name}")
+        _serve_local_item(room_code, room, player, item_type)
+        return
+    _begin_truth_dare(room_code, room, False)
+
+
+def _on_ai_budget_expired(room_code, room, round_no, player, item_type):
+    if not _still_waiting_for(room, round_no, player):
+        return
+    logger.warning(f"⏰ AI {item_type} for {player.name} is over budget, using a local one")
+    _serve_local_item(room_code, room, player, item_type)
+
+
+def _serve_local_item(room_code, room, player, item_type):
+    # runs in the room mailbox, recombines the room's own catalog in milliseconds
+    gen = room.local_generator(item_type)
+    text = gen.generate(item_type, exclude=lambda t, n: room.has_content(item_type, t, n))
+    if text:
+        ai_usage.record(room.ai_usage, "local_fallbacks")
+    no_more = not (text and _apply_ai_item(room, player, item_type, text, local=True))
+    if no_more:
+        _set_no_more_item(room, player, item_type)
+    _begin_truth_dare(room_code, room, no_more)
+
+
+def _ai_context(room, item_type):
+    # the room's rolling window of newest distinct texts, these go to the AI as
+    # "don't repeat these"; same tuple between changes, so the prompt part is cached
+    return room.ai_context(item_type)
+
+
+def _generate_ai_text(room, item_type, context):
+    """
+    Get an item the room doesn't have yet: from the on-disk cache if it has
+    one, otherwise from the AI. Runs outside the room mailbox (it sleeps and
+    waits on the network); returns the text or None.
+    """
+    cached = _cached_ai_items(room, item_type, 1)
+    if cached:
+        logger.info(f"💾 Serving cached AI {item_type}: '{cached[0][:50]}...'")
+        ai_usage.record(room.ai_usage, "cache_hits")
+        return cached[0]
+
+    ai_gen = get_ai_generator()
+
+    # duplicate checks go against the room's content index, no re-normalizing here
+    logger.info(f"🔍 Prompt context items: {len(context)}")
+    logger.info(f"🔍 Distinct {item_type}s in room: {len(room.content_index(item_type))}")
+
+    for attempt in range(3):
+        logger.info(f"🔄 AI generation attempt {attempt + 1}/3")
+
+        if not ai_gen.accepting_requests():
+            # breaker is open, retrying would only burn the backoff sleeps
+            logger.warning("🔌 AI circuit breaker open, giving up on this item")
+            return None
+        if ai_usage.over_budget(room.ai_usage):
+            # the caller falls back to local content
+            logger.warning(f"💸 AI budget used up (room {room.code}), not calling the API")
+            return None
+
+        if attempt > 0:
+            # Exponential backoff: 2^attempt + small random jitter
+            delay = min(10, (2 ** attempt) + random.uniform(0, 1))
+            logger.info(f"⏱️ Waiting {delay:.2f}s before retry...")
+            _sleep(delay)
+
+        try:
+            with get_ai_pool().slot(room.code, timeout=_AI_SLOT_TIMEOUT), \
+                    ai_usage.usage_scope(room.ai_usage):
+                logger.info(f"📡 Making API call to Gemini (attempt {attempt + 1}/3)...")
+
+                if item_type == "truth":
+                    generated = ai_gen.generate_truth(context)
+                else:
+                    generated = ai_gen.generate_dare(context)
+
+                logger.info(f"✅ API call completed successfully")
+
+        except AIPoolFull as e:
+            logger.warning(f"🚦 {e}, not queueing another one")
+            return None
+        except Exception as e:
+            logger.error(f"❌ AI generation API error on attempt {attempt + 1}: {e}", exc_info=True)
+            continue
+
+        if not generated:
+            logger.warning(f"⚠️ AI returned empty result on attempt {attempt + 1}")
+            continue
+
+        logger.info(f"📝 Generated text: '{generated[:50]}...'")
+
+        if room.is_near_duplicate(item_type, generated):
+            logger.warning(f"🔁 Near-duplicate detected: '{generated}' - attempt {attempt + 1}/3")
+            ai_usage.record(room.ai_usage, "duplicates")
+            continue
+
+        _store_ai_items(item_type, [generated])
+        return generated
+
+    return None
+
+
+def _cached_ai_items(room, item_type, n):
+    # items this room hasn't got yet: shared in-memory pool first, then the disk cache
+    picked = []
+    picked_norms = set()
+
+    def exclude(text, norm):
+        # is_near_duplicate covers exact copies too, AI items the room took included
+        return norm in picked_norms or room.is_near_duplicate(item_type, text, norm)
+
+    for source in (get_shared_ai_content, get_ai_cache):
+        if len(picked) >= n:
+            break
+        try:
+            more = source().pick(item_type, n - len(picked), exclude=exclude)
+        except Exception as e:
+            logger.error(f"AI cache lookup failed: {e}")
+            continue
+        picked.extend(more)
+        picked_norms.update(normalize_text(t) for t in more)
+    return picked
+
+
+def _store_ai_items(item_type, texts):
+    shared = get_shared_ai_content()
+    for text in texts:
+        shared.add(item_type, text)
+    try:
+        cache = get_ai_cache()
+        for text in texts:
+            cache.add(item_type, text)
+    except Exception as e:
+        logger.error(f"Could not store AI items in the cache: {e}")
+
+
+def _apply_ai_item(room, player, item_type, generated, local=False):
+    # runs in the room mailbox: the room may have picked up the same text while we waited;
+    # local=True for LocalGenerator output, which is kept apart from the AI's items
+    n = normalize_text(generated)
+    if room.has_content(item_type, generated, n):
+        logger.warning(f"🔁 AI {item_type} showed up in the room meanwhile: '{generated}'")
+        return False
+
+    if local:
+        registered = room.add_local_generated(item_type, generated)
+    elif item_type == "truth":
+        registered = room.add_ai_generated_truth(generated)
+    else:
+        registered = room.add_ai_generated_dare(generated)
+    if not registered:
+        return False
+
+    source = _LOCAL_SOURCE if local else "AI"
+    if item_type == "truth":
+        new_item = Truth(generated, False, source)
+        player.mark_truth_used(generated, n)
+    else:
+        new_item = Dare(generated, False, source)
+        player.mark_dare_used(generated, n)
+
+    room.game_state.set_current_truth_dare(new_item.to_dict())
+    logger.info(f"✨ SUCCESS - Unique {item_type} generated: '{generated}'")
+    return True
+
+
+def prefetch_ai_items(room_code, room):
+    """
+    Top up the room's AI buffer in the background while players prepare, so
+    the truth/dare draw almost never has to wait on the API. Runs in the
+    room mailbox; the generation itself doesn't.
+    """
+    if not room.settings.get("ai_generation_enabled", False) or not get_ai_generator().enabled:
+        return
+
+    epoch = room.game_state.epoch
+    for kind in ("truth", "dare"):
+        want = room.ai_prefetch_wanted(kind)
+        if want <= 0:
+            continue
+        logger.info(f"📦 Prefetching {want} AI {kind}(s) for room {room_code}")
+        room.ai_buffer.in_flight[kind] += want
+        spawn_background(
+            _prefetch_in_background, room_code, room, epoch, kind, want, _ai_context(room, kind)
+        )
 
-            # Random seed to prevent cache collisions
-            unique_tag = f"SEED:{random.randint(1000, 9999)}"
 
+def _prefetch_in_background(room_code, room, epoch, item_type, n, context):
+    # cached items first, then one batched request for the rest, single calls
+    # only if the batch came back empty
+    batch = _cached_ai_items(room, item_type, n)
+    if batch:
+        ai_usage.record(room.ai_usage, "cache_hits", len(batch))
+    pool_full = False
+    if len(batch) < n and not ai_usage.over_budget(room.ai_usage):
+        try:
+            with get_ai_pool().slot(room_code, timeout=_AI_SLOT_TIMEOUT), \
+                    ai_usage.usage_scope(room.ai_usage):
+                ai_gen = get_ai_generator()
+                if item_type == "truth":
+                    fresh = ai_gen.generate_truths(n - len(batch), tuple(batch) + context)
+                else:
+                    fresh = ai_gen.generate_dares(n - len(batch), tuple(batch) + context)
+            _store_ai_items(item_type, fresh)
+            batch += fresh
+        except AIPoolFull as e:
+            logger.info(f"🚦 {e}, skipping prefetch")
+            pool_full = True
+        except Exception as e:
+            logger.exception(f"AI batch prefetch failed: {e}")
+
+    for i in range(n):
+        generated = batch[i] if i < len(batch) else None
+        if generated is None and not batch and not pool_full:
             try:
-                with _ai_lock:
-                    logger.info(f"📡 Making API call to Gemini (attempt {attempt + 1}/3)...")
-                    
-                    # ===== CRITICAL: Pass ORIGINAL text to AI (limit to 30 for token management) =====
-                    context_items = original_texts[:30]
-                    
-                    if item_type == "truth":
-                        generated = ai_gen.generate_truth(context_items + [unique_tag])
-                    else:
-                        generated = ai_gen.generate_dare(context_items + [unique_tag])
-                    
-                    logger.info(f"✅ API call completed successfully")
-                    
+                generated = _generate_ai_text(room, item_type, context)
             except Exception as e:
-                logger.error(f"❌ AI generation API error on attempt {attempt + 1}: {e}", exc_info=True)
-                continue
+                logger.exception(f"AI prefetch failed: {e}")
+            if generated:
+                context = (generated,) + context
+        room.mailbox.post(_stash_prefetched, room_code, room, epoch, item_type, generated)
 
-            if not generated:
-                logger.warning(f"⚠️ AI returned empty result on attempt {attempt + 1}")
-                continue
 
-            logger.info(f"📝 Generated text: '{generated[:50]}...'")
+def _stash_prefetched(room_code, room, epoch, item_type, generated):
+    room.ai_buffer.in_flight[item_type] -= 1
+    if not generated or not _game_mgr:
+        return
+    if _game_mgr.get_room(room_code) is not room or room.game_state.epoch != epoch:
+        return
+    _buffer_ai_item(room, item_type, generated)
 
-            # ===== Check for duplicate using NORMALIZED comparison =====
-            normalized_generated = _clean_text(generated)
-            
-            if normalized_generated in existing_normalized:
-                logger.warning(f"🔁 Duplicate detected (normalized): '{normalized_generated}' - attempt {attempt + 1}/3")
-                continue
 
-            # ===== Success - add to appropriate lists =====
-            logger.info(f"✨ SUCCESS - Unique {item_type} generated: '{generated}'")
-            
+def _buffer_ai_item(room, item_type, generated):
+    # runs in the room mailbox
+    if room.is_near_duplicate(item_type, generated):
+        return
+
+    # registered as the room's AI item now, so nothing else generates it again
+    added = (room.add_ai_generated_truth(generated) if item_type == "truth"
+             else room.add_ai_generated_dare(generated))
+    if added:
+        room.ai_buffer.push(item_type, generated)
+
+
+def _serve_buffered_ai_item(room, player, item_type):
+    # runs in the room mailbox, takes the first buffered item the player hasn't seen;
+    # the ones they already know stay buffered for the next player
+    known = []
+    try:
+        while True:
+            text = room.ai_buffer.pop(item_type)
+            if text is None:
+                return False
             if item_type == "truth":
-                if not room.add_ai_generated_truth(generated):
-                    logger.warning("⚠️ Room rejected AI truth (possible race condition)")
+                if player.knows_truth(text):
+                    known.append(text)
                     continue
-                    
-                new_item = Truth(generated, False, "AI")
-                player.truth_dare_list.add_truth(generated, submitted_by="AI")
-                player.truth_dare_list.remove_truth_by_text(generated)
-                player.mark_truth_used(generated)
+                player.mark_truth_used(text)
+                item = Truth(text, False, "AI")
             else:
-                if not room.add_ai_generated_dare(generated):
-                    logger.warning("⚠️ Room rejected AI dare (possible race condition)")
+                if player.knows_dare(text):
+                    known.append(text)
                     continue
-                    
-                new_item = Dare(generated, False, "AI")
-                player.truth_dare_list.add_dare(generated, submitted_by="AI")
-                player.truth_dare_list.remove_dare_by_text(generated)
-                player.mark_dare_used(generated)
-
-            room.game_state.set_current_truth_dare(new_item.to_dict())
-            logger.info(f"🎉 AI {item_type} successfully integrated into game")
+                player.mark_dare_used(text)
+                item = Dare(text, False, "AI")
+            room.game_state.set_current_truth_dare(item.to_dict())
+            logger.info(f"📦 Served prefetched AI {item_type} to {player.name}")
             return True
+    finally:
+        room.ai_buffer.requeue(item_type, known)
 
-        # ===== All retries failed =====
-        logger.error(f"❌ AI GENERATION FAILED - No unique {item_type} after 3 attempts")
-        room.game_state.list_empty = True
-        room.game_state.set_current_truth_dare(
-            {
-                "text": f"{player.name} has no more {item_type}s available!",
-                "type": item_type,
-                "is_default": False,
-                "submitted_by": None,
-            }
-        )
-        return False
-        
-    except Exception as e:
-        logger.exception(f"💥 CRITICAL ERROR in _try_generate_ai_item: {e}")
-        return False
+
+def rearm_truth_dare_timer(room_code, room):
+    """(Re)schedule the end of the truth/dare phase at its current deadline."""
+    delay = room.game_state.get_seconds_until_deadline()
+    if delay is None:
+        room.set_phase_timer(None)
+        return
+    room.set_phase_timer(
+        schedule_for_room(room_code, room, delay, _on_truth_dare_deadline, room_code)
+    )
 
 
-def _monitor_truth_dare(room_code):
+def _on_truth_dare_deadline(room_code):
     if not _game_mgr:
-        logger.error("Game manager missing in _monitor_truth_dare")
+        logger.error("Game manager missing in _on_truth_dare_deadline")
         return
 
-    try:
-        while True:
-            time.sleep(0.5)
-            room = _game_mgr.get_room(room_code)
-            if not room:
-                break
-            if room.game_state.is_phase_complete():
-                _handle_end_of_truth_dare(room, room_code)
-                break
-    except Exception as e:
-        logger.exception(f"Error in _monitor_truth_dare: {e}")
+    room = _game_mgr.get_room(room_code)
+    if not room or room.game_state.phase != room.game_state.PHASE_TRUTH_DARE:
+        return
+
+    # deadline got pushed back (or clocks disagree a tiny bit) -> wait again
+    if not room.game_state.is_phase_complete():
+        rearm_truth_dare_timer(room_code, room)
+        return
+
+    room.set_phase_timer(None)
+    _handle_end_of_truth_dare(room, room_code)
 
 
 def _handle_end_of_truth_dare(room, code):
@@ -333,7 +609,7 @@ def _handle_end_of_truth_dare(room, code):
             ScoringSystem.award_perform_points(performer)
 
         curr = room.game_state.current_truth_dare
-        if curr:
+        if curr and not curr.get("generating"):   # skipped before the AI item landed
             submitter = (
                 room.get_player_by_name(curr.get("submitted_by"))
                 if curr.get("submitted_by") else None
@@ -365,9 +641,7 @@ def _handle_end_of_truth_dare(room, code):
             room.reset_player_round_submissions()
             _socketio.emit("game_state_update", room.game_state.to_dict(), room=code)
 
-            threading.Thread(
-                target=lambda: (time.sleep(prep_t), start_selection_or_minigame(code)),
-                daemon=True,
-            ).start()
+            prefetch_ai_items(code, room)
+            schedule_for_room(code, room, prep_t, start_selection_or_minigame, code)
     except Exception as e:
         logger.exception(f"Exception in _handle_end_of_truth_dare: {e}")
@@ -20,7 +20,7 @@ def register_settings_events(socketio, game_manager):
             if not room.is_host(request.sid):   # host only
                 return
 
-            room.update_settings(settings)
+            room.mailbox.call(room.update_settings, settings)
 
             emit("settings_updated", {"settings": room.settings}, room=rc)
         except Exception as e:
@@ -0,0 +1,37 @@
+import os
+
+from Model.fake_gemini import FakeGeminiClient
+
+
+class AIBackendUnavailable(Exception):
+    """The backend can't be used here (no API key etc), AI stays off."""
+
+
+def gemini_backend():
+    api_key = os.environ.get('GEMINI_API_KEY')
+    if not api_key:
+        raise AIBackendUnavailable("API key not configured")
+    from google import genai   # only the real backend needs google-genai
+    return genai.Client(api_key=api_key)
+
+
+def fake_backend():
+    # offline stand-in, tuned with the AI_FAKE_* variables (see FakeGeminiClient.from_env)
+    return FakeGeminiClient.from_env()
+
+
+# AI_BACKEND picks one; each returns a client shaped like genai.Client
+BACKENDS = {
+    "gemini": gemini_backend,
+    "fake": fake_backend,
+}
+
+
+def create_ai_client(name):
+    try:
+        factory = BACKENDS[name]
+    except KeyError:
+        raise AIBackendUnavailable(
+            f"Unknown AI_BACKEND '{name}' (use {' or '.join(sorted(BACKENDS))})"
+        ) from None
+    return factory()
@@ -0,0 +1,40 @@
+from collections import deque
+
+
+class AIBuffer:
+    """
+    AI items a room generated ahead of need, waiting to be drawn.
+
+    Bounded per kind. Items in here are already registered as the room's
+    AI items (so nothing else generates them again) but nobody has seen
+    them yet. in_flight counts items being generated right now, so two
+    prefetch passes don't both fill the same gap.
+    """
+
+    KINDS = ("truth", "dare")
+
+    def __init__(self, capacity=3):
+        self.capacity = capacity
+        self._items = {k: deque() for k in self.KINDS}
+        self.in_flight = {k: 0 for k in self.KINDS}
+
+    def push(self, kind, text):
+        q = self._items[kind]
+        if len(q) >= self.capacity:
+            return False
+        q.append(text)
+        return True
+
+    def requeue(self, kind, texts):
+        # put items popped but not used back at the front, in their old order
+        self._items[kind].extendleft(reversed(texts))
+
+    def pop(self, kind):
+        q = self._items[kind]
+        return q.popleft() if q else None
+
+    def count(self, kind):
+        return len(self._items[kind])
+
+    def free_slots(self, kind):
+        return max(0, self.capacity - len(self._items[kind]) - self.in_flight[kind])
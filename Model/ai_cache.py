@@ -0,0 +1,149 @@
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from Model.truth_dare import normalize_text
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "ai_cache.sqlite3",
+)
+
+
+class AIItemCache:
+    """
+    Every truth/dare the AI has produced, kept in SQLite so other rooms (and
+    the next process) can reuse them instead of paying for a new call.
+
+    Keyed by (kind, normalized text), so the same item never gets stored
+    twice. Holds at most max_items per kind, the oldest go first. One
+    connection shared behind a lock; the queries are tiny.
+    """
+
+    KINDS = ("truth", "dare")
+    PICK_OVERSAMPLE = 4   # rows read per item wanted, the rest covers what exclude drops
+
+    def __init__(self, path=CACHE_PATH, max_items=5000, clock=time.time):
+        self.path = path
+        self.max_items = max_items
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS ai_items ("
+            " kind TEXT NOT NULL,"
+            " norm TEXT NOT NULL,"
+            " text TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " PRIMARY KEY (kind, norm))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS ai_items_age ON ai_items (kind, created_at)")
+        self._db.commit()
+        self._counts = {k: self._db.execute(
+            "SELECT COUNT(*) FROM ai_items WHERE kind = ?", (k,)).fetchone()[0] for k in self.KINDS}
+
+    def add(self, kind, text):
+        # True if it wasn't stored yet
+        n = normalize_text(text)
+        if kind not in self.KINDS or not n:
+            return False
+        with self._lock:
+            cur = self._db.execute(
+                "INSERT OR IGNORE INTO ai_items (kind, norm, text, created_at) VALUES (?, ?, ?, ?)",
+                (kind, n, text, self._clock()),
+            )
+            added = cur.rowcount == 1
+            if added:
+                self._counts[kind] += 1
+                if self._counts[kind] > self.max_items:
+                    self._evict(kind, self._counts[kind] - self.max_items)
+            self._db.commit()
+            return added
+
+    def _evict(self, kind, n):
+        # oldest first, caller holds the lock
+        self._db.execute(
+            "DELETE FROM ai_items WHERE rowid IN ("
+            " SELECT rowid FROM ai_items WHERE kind = ? ORDER BY created_at LIMIT ?)",
+            (kind, n),
+        )
+        self._counts[kind] -= n
+
+    def pick(self, kind, n=1, exclude=None):
+        """
+        Up to n stored items of this kind, in random order. exclude(text, norm)
+        says which ones the caller already has (usually room.has_content).
+
+        Reads n * PICK_OVERSAMPLE rows from a random spot in the table
+        (wrapping round) instead of shuffling all of it, and runs exclude
+        after letting go of the lock, since it looks at room state.
+        """
+        out = []
+        if n <= 0:
+            return out
+        want = n * self.PICK_OVERSAMPLE
+        with self._lock:
+            lo, hi = self._db.execute("SELECT MIN(rowid), MAX(rowid) FROM ai_items").fetchone()
+            if lo is None:
+                return out
+            start = random.randint(lo, hi)
+            rows = self._db.execute(
+                "SELECT text, norm FROM ai_items WHERE kind = ? AND rowid >= ? ORDER BY rowid LIMIT ?",
+                (kind, start, want),
+            ).fetchall()
+            if len(rows) < want:
+                rows += self._db.execute(
+                    "SELECT text, norm FROM ai_items WHERE kind = ? AND rowid < ? ORDER BY rowid LIMIT ?",
+                    (kind, start, want - len(rows)),
+                ).fetchall()
+
+        random.shuffle(rows)
+        for text, norm in rows:
+            if exclude is not None and exclude(text, norm):
+                continue
+            out.append(text)
+            if len(out) >= n:
+                break
+        return out
+
+    def recent(self, kind, n):
+        # newest first
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT text FROM ai_items WHERE kind = ? ORDER BY created_at DESC LIMIT ?",
+                (kind, n),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def count(self, kind=None):
+        with self._lock:
+            if kind is None:
+                return self._db.execute("SELECT COUNT(*) FROM ai_items").fetchone()[0]
+            return self._db.execute(
+                "SELECT COUNT(*) FROM ai_items WHERE kind = ?", (kind,)
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_ai_cache = None
+_ai_cache_lock = threading.Lock()
+
+
+def get_ai_cache():
+    global _ai_cache
+    if _ai_cache is None:
+        with _ai_cache_lock:
+            if _ai_cache is None:
+                _ai_cache = AIItemCache(
+                    os.environ.get("AI_CACHE_PATH", CACHE_PATH),
+                    max_items=int(os.environ.get("AI_CACHE_MAX_ITEMS", 5000)),
+                )
+    return _ai_cache
@@ -0,0 +1,96 @@
+import logging
+import os
+import random
+import threading
+from collections import deque
+
+from Model.ai_cache import get_ai_cache
+from Model.truth_dare import normalize_text
+
+logger = logging.getLogger(__name__)
+
+
+class SharedAIContent:
+    """
+    Ready-to-serve AI truths/dares shared by every room in the process.
+
+    Anything the AI produced for one room can be handed to the next one
+    without another API call. Bounded per kind, oldest items fall out first
+    (they're still in the disk cache). Rooms filter out what they already
+    have through pick's exclude, see _cached_ai_items.
+    """
+
+    KINDS = ("truth", "dare")
+
+    def __init__(self, capacity=500):
+        self.capacity = max(1, int(capacity))
+        self._lock = threading.Lock()
+        self._items = {k: deque() for k in self.KINDS}   # (text, norm), oldest first
+        self._norms = {k: set() for k in self.KINDS}
+
+    def add(self, kind, text):
+        n = normalize_text(text)
+        if kind not in self.KINDS or not n:
+            return False
+        with self._lock:
+            norms = self._norms[kind]
+            if n in norms:
+                return False
+            q = self._items[kind]
+            if len(q) >= self.capacity:
+                norms.discard(q.popleft()[1])
+            q.append((text, n))
+            norms.add(n)
+            return True
+
+    def pick(self, kind, n=1, exclude=None):
+        """
+        Up to n items, starting from a random spot so rooms don't all get
+        the same ones. exclude(text, norm) drops items the room already has.
+        """
+        out = []
+        if n <= 0:
+            return out
+        with self._lock:
+            items = list(self._items[kind])
+        if not items:
+            return out
+        start = random.randrange(len(items))
+        for i in range(len(items)):
+            text, norm = items[(start + i) % len(items)]
+            if exclude is not None and exclude(text, norm):
+                continue
+            out.append(text)
+            if len(out) >= n:
+                break
+        return out
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(q) for q in self._items.values())
+
+
+_shared_content = None
+_shared_content_lock = threading.Lock()
+
+
+def get_shared_ai_content():
+    global _shared_content
+    if _shared_content is None:
+        with _shared_content_lock:
+            if _shared_content is None:
+                pool = SharedAIContent(os.environ.get("AI_SHARED_POOL_SIZE", 500))
+                _warm_from_disk(pool)
+                _shared_content = pool
+    return _shared_content
+
+
+def _warm_from_disk(pool):
+    # start with the newest items from the on-disk cache
+    try:
+        cache = get_ai_cache()
+        for kind in pool.KINDS:
+            for text in reversed(cache.recent(kind, pool.capacity)):
+                pool.add(kind, text)
+    except Exception as e:
+        logger.error(f"Could not warm the shared AI pool from disk: {e}")
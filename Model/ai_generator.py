@@ -1,200 +1,428 @@
 import os
+import json
 import logging
 import threading
-from typing import List, Optional
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
 
-from google import genai
+
+from Model.truth_dare import normalize_text
+from Model.ai_throttle import AIUnavailable, CircuitBreaker, TokenBucket
+from Model.ai_health import AIHealth, AIHealthProber
+from Model.ai_backends import AIBackendUnavailable, create_ai_client
+from Model import ai_usage
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# bit long but easier to just keep them as big strings
+TRUTH_PROMPT_HEAD = """You are helping generate questions for a Truth or Dare party game.
+
+Generate ONE new truth question that is:
+- Appropriate for teenagers and young adults (ages 13-25)
+- Fun, interesting, and thought-provoking
+- Not too personal or invasive
+- Safe and appropriate for a party setting
+- Different from all existing questions
+
+IMPORTANT: Output ONLY the question itself, nothing else. No explanations, no prefixes, just the question.
+
+"""
+
+DARE_PROMPT_HEAD = """You are helping generate dares for a Truth or Dare party game.
+
+Generate ONE new dare that is:
+- Appropriate for teenagers and young adults (ages 13-25)
+- Fun, silly, and entertaining
+- Safe and physically harmless
+- Doable in a typical indoor setting
+- Not embarrassing or humiliating
+- Legal and ethical
+- Different from all existing dares
+
+IMPORTANT: Output ONLY the dare itself, nothing else. No explanations, no prefixes, just the dare action.
+
+"""
+
+BATCH_PROMPT_HEAD = """You are helping generate content for a Truth or Dare party game.
+
+Generate {n_truths} new truth questions and {n_dares} new dares. Every item must be:
+- Appropriate for teenagers and young adults (ages 13-25)
+- Fun and safe for a party setting, dares doable indoors and physically harmless
+- Not too personal, embarrassing or humiliating
+- Different from each other and from all existing items
+
+IMPORTANT: Output ONLY a JSON object of the form {{"truths": ["..."], "dares": ["..."]}}, nothing else.
+
+"""
+
+
+@lru_cache(maxsize=1024)
+def _existing_block(title: str, items: tuple) -> str:
+    # rooms pass the same context tuple until something new shows up, so this
+    # numbered list is usually rendered once and reused for every call
+    if not items:
+        return ""
+    lines = [f"{title} (DO NOT duplicate these):"]
+    lines.extend(f"{i}. {t}" for i, t in enumerate(items, 1))
+    return "\n".join(lines) + "\n\n"
+
+
 class AIGenerator:
     MODEL = "gemini-2.0-flash-lite"
+    RATE_WAIT = 5   # seconds a call may wait for a rate limit token
 
     def __init__(self):
-        api_key = os.environ.get('GEMINI_API_KEY')
-        if not api_key:
-            logger.warning("GEMINI_API_KEY not found in env -> AI off")
-            self.enabled = False
-            self.client = None
-            self.initialization_error = "API key not configured"
-            return
-
+        # match AI_RATE_PER_MIN / AI_RATE_BURST to the API quota
+        self.bucket = TokenBucket(
+            rate_per_min=os.environ.get("AI_RATE_PER_MIN", 30),
+            burst=os.environ.get("AI_RATE_BURST", 5),
+        )
+        self.breaker = CircuitBreaker(
+            failure_threshold=os.environ.get("AI_BREAKER_FAILURES", 5),
+            cooldown=float(os.environ.get("AI_BREAKER_COOLDOWN", 30)),
+        )
+        self.health = AIHealth()   # latency / error record, served by get_status()
+
+        self.backend = os.environ.get("AI_BACKEND", "gemini").strip().lower()
         try:
-            self.client = genai.Client(api_key=api_key)
+            self.client = create_ai_client(self.backend)
             self.enabled = True
             self.initialization_error = None
-            logger.info(f"Gemini AI init ok, model={self.MODEL}")
+            logger.info(f"AI init ok, backend={self.backend}, model={self.MODEL}")
+        except AIBackendUnavailable as e:
+            logger.warning(f"AI backend '{self.backend}' unavailable ({e}) -> AI off")
+            self.enabled = False
+            self.client = None
+            self.initialization_error = str(e)
         except Exception as e:
             logger.error(f"Error initializing Gemini AI: {e}", exc_info=True)
             self.enabled = False
             self.client = None
             self.initialization_error = str(e)
 
-    def generate_truth(self, existing_truths: List[str]) -> Optional[str]:
-        if not self.enabled or not self.client:
-            logger.warning(
-                f"Cannot generate truth - AI off. Reason: {self.initialization_error}"
-            )
-            return None
-
-        prompt = self._truth_prompt(existing_truths)
-        logger.info(f"Generating truth with {len(existing_truths)} existing truths")
-
-        try:
-            resp = self.client.models.generate_content(
-                model=self.MODEL,
-                contents=prompt,
-                config={"max_output_tokens": 256}
-            )
-
-            if not resp:
-                logger.error("Empty response from Gemini API")
-                return None
+    def generate_truth(self, existing_truths: Sequence[str]) -> Optional[str]:
+        return self._generate_single("truth", self._truth_prompt, existing_truths)
 
-            txt = None
-            if hasattr(resp, 'text'):
-                txt = resp.text
-            elif hasattr(resp, 'candidates') and resp.candidates:
-                c = resp.candidates[0]
-                if hasattr(c, 'content') and hasattr(c.content, 'parts'):
-                    parts = c.content.parts
-                    if parts and hasattr(parts[0], 'text'):
-                        txt = parts[0].text
+    def generate_dare(self, existing_dares: Sequence[str]) -> Optional[str]:
+        return self._generate_single("dare", self._dare_prompt, existing_dares)
 
-            if not txt:
-                logger.error(f"Could not extract text from response: {type(resp)} {resp}")
-                return None
+    def generate_truths(self, n: int, existing_truths: Sequence[str]) -> List[str]:
+        return self.generate_mixed(n, 0, existing_truths, [])["truths"]
 
-            txt = txt.strip()
+    def generate_dares(self, n: int, existing_dares: Sequence[str]) -> List[str]:
+        return self.generate_mixed(0, n, [], existing_dares)["dares"]
 
-            if not txt or len(txt) < 5:
-                logger.error(f"Generated truth too short/empty: '{txt}'")
-                return None
-
-            if txt.startswith('"') and txt.endswith('"'):
-                txt = txt[1:-1]
-            if txt.startswith("'") and txt.endswith("'"):
-                txt = txt[1:-1]
-
-            if not txt.endswith('?') :
-                txt += '?'
-
-            logger.info(f"Generated truth ok: '{txt[:50]}...'")
-            return txt
+    def generate_mixed(self, n_truths: int, n_dares: int,
+                       existing_truths: Sequence[str], existing_dares: Sequence[str]) -> Dict[str, List[str]]:
+        """
+        Several truths and/or dares in one request. Every item is cleaned the
+        same way the single-item calls do it; duplicates (of each other or of
+        the existing lists, after normalizing) are dropped, so this can
+        return fewer than asked for.
+        """
+        if n_truths <= 0 and n_dares <= 0 or not self._ready("batch"):
+            return {"truths": [], "dares": []}
 
+        prompt = self._batch_prompt(n_truths, n_dares, existing_truths, existing_dares)
+        logger.info(f"Generating batch of {n_truths} truths + {n_dares} dares")
+        try:
+            resp = self._call(prompt, self._batch_config(n_truths, n_dares))
         except Exception as e:
-            logger.error(f"Error generating truth: {e}", exc_info=True)
-            return None
+            self._log_failure("batch", e)
+            resp = None
+        return self._batch_result(resp, n_truths, n_dares, existing_truths, existing_dares)
 
-    def generate_dare(self, existing_dares: List[str]) -> Optional[str]:
-        if not self.enabled or not self.client:
-            logger.warning(
-                f"Cannot generate dare - AI off. Reason: {self.initialization_error}"
-            )
+    def _generate_single(self, kind: str, build_prompt, existing: Sequence[str]) -> Optional[str]:
+        # one truth or dare per request, shared by generate_truth/generate_dare
+        if not self._ready(kind):
             return None
 
-        prompt = self._dare_prompt(existing_dares)
-        logger.info(f"Generating dare with {len(existing_dares)} existing dares")
-
+        logger.info(f"Generating {kind} with {len(existing)} existing {kind}s")
         try:
-            resp = self.client.models.generate_content(
-                model=self.MODEL,
-                contents=prompt,
-                config={"max_output_tokens": 256}
-            )
+            return self._single_text(kind, self._call(build_prompt(existing), {"max_output_tokens": 256}))
+        except Exception as e:
+            self._log_failure(kind, e)
+            return None
 
-            if not resp:
-                logger.error("Empty response from Gemini API")
-                return None
+    # async path: same prompts, bookkeeping and cleanup, but the request goes
+    # through client.aio so many rooms can share one event loop and its connections
 
-            txt = None
-            if hasattr(resp, 'text'):
-                txt = resp.text
-            elif hasattr(resp, 'candidates') and resp.candidates:
-                c = resp.candidates[0]
-                if hasattr(c, 'content') and hasattr(c.content, 'parts'):
-                    parts = c.content.parts
-                    if parts and hasattr(parts[0], 'text'):
-                        txt = parts[0].text
+    async def agenerate_truth(self, existing_truths: Sequence[str]) -> Optional[str]:
+        return await self._agenerate_single("truth", self._truth_prompt, existing_truths)
 
-            if not txt:
-                logger.error(f"Could not extract dare text from response: {type(resp)}")
-                return None
+    async def agenerate_dare(self, existing_dares: Sequence[str]) -> Optional[str]:
+        return await self._agenerate_single("dare", self._dare_prompt, existing_dares)
 
-            txt = txt.strip()
+    async def agenerate_truths(self, n: int, existing_truths: Sequence[str]) -> List[str]:
+        return (await self.agenerate_mixed(n, 0, existing_truths, []))["truths"]
 
-            if not txt or len(txt) < 5:
-                logger.error(f"Generated dare too short/empty: '{txt}'")
-                return None
+    async def agenerate_dares(self, n: int, existing_dares: Sequence[str]) -> List[str]:
+        return (await self.agenerate_mixed(0, n, [], existing_dares))["dares"]
 
-            if txt.startswith('"') and txt.endswith('"'):
-                txt = txt[1:-1]
-            if txt.startswith("'") and txt.endswith("'"):
-                txt = txt[1:-1]
+    async def agenerate_mixed(self, n_truths: int, n_dares: int,
+                              existing_truths: Sequence[str], existing_dares: Sequence[str]) -> Dict[str, List[str]]:
+        if n_truths <= 0 and n_dares <= 0 or not self._ready("batch"):
+            return {"truths": [], "dares": []}
 
-            logger.info(f"Generated dare ok: '{txt[:50]}...'")
-            return txt
+        prompt = self._batch_prompt(n_truths, n_dares, existing_truths, existing_dares)
+        logger.info(f"Generating batch of {n_truths} truths + {n_dares} dares (async)")
+        try:
+            resp = await self._acall(prompt, self._batch_config(n_truths, n_dares))
+        except Exception as e:
+            self._log_failure("batch", e)
+            resp = None
+        return self._batch_result(resp, n_truths, n_dares, existing_truths, existing_dares)
+
+    async def _agenerate_single(self, kind: str, build_prompt, existing: Sequence[str]) -> Optional[str]:
+        if not self._ready(kind):
+            return None
 
+        logger.info(f"Generating {kind} with {len(existing)} existing {kind}s (async)")
+        try:
+            return self._single_text(kind, await self._acall(build_prompt(existing), {"max_output_tokens": 256}))
         except Exception as e:
-            logger.error(f"Error generating dare: {e}", exc_info=True)
+            self._log_failure(kind, e)
             return None
 
-    def _truth_prompt(self, existing_truths: List[str]) -> str:
-        # bit long but easier to just keep it as one big string
-        p = """You are helping generate questions for a Truth or Dare party game.
+    @staticmethod
+    def _log_failure(what: str, e: Exception):
+        if isinstance(e, AIUnavailable):
+            logger.warning(f"Skipped generating {what}: {e}")
+        else:
+            logger.error(f"Error generating {what}: {e}", exc_info=True)
 
-Generate ONE new truth question that is:
-- Appropriate for teenagers and young adults (ages 13-25)
-- Fun, interesting, and thought-provoking
-- Not too personal or invasive
-- Safe and appropriate for a party setting
-- Different from all existing questions
+    def _ready(self, what: str) -> bool:
+        if not self.enabled or not self.client:
+            logger.warning(
+                f"Cannot generate {what} - AI off. Reason: {self.initialization_error}"
+            )
+            return False
+        return True
 
-IMPORTANT: Output ONLY the question itself, nothing else. No explanations, no prefixes, just the question.
+    def _single_text(self, kind: str, resp) -> Optional[str]:
+        if not resp:
+            logger.error("Empty response from Gemini API")
+            return None
 
-"""
-        if existing_truths:
-            p += "Existing truth questions (DO NOT duplicate these):\n"
-            for i, t in enumerate(existing_truths[:30], 1):
-                p += f"{i}. {t}\n"
-            p += "\n"
+        txt = self._extract_text(resp)
+        if not txt:
+            logger.error(f"Could not extract {kind} text from response: {type(resp)}")
+            return None
 
-        p += "Generate ONE new, unique truth question now:"
-        return p
+        txt = self._clean_item(kind, txt)
+        if not txt:
+            logger.error(f"Generated {kind} too short/empty")
+            return None
 
-    def _dare_prompt(self, existing_dares: List[str]) -> str:
-        p = """You are helping generate dares for a Truth or Dare party game.
+        logger.info(f"Generated {kind} ok: '{txt[:50]}...'")
+        return txt
 
-Generate ONE new dare that is:
-- Appropriate for teenagers and young adults (ages 13-25)
-- Fun, silly, and entertaining
-- Safe and physically harmless
-- Doable in a typical indoor setting
-- Not embarrassing or humiliating
-- Legal and ethical
-- Different from all existing dares
-
-IMPORTANT: Output ONLY the dare itself, nothing else. No explanations, no prefixes, just the dare action.
+    @staticmethod
+    def _batch_config(n_truths: int, n_dares: int) -> dict:
+        return {
+            "max_output_tokens": 64 * (n_truths + n_dares) + 64,
+            "response_mime_type": "application/json",
+        }
 
-"""
-        if existing_dares:
-            p += "Existing dares (DO NOT duplicate these):\n"
-            for i, d in enumerate(existing_dares[:30], 1):
-                p += f"{i}. {d}\n"
-            p += "\n"
+    def _batch_result(self, resp, n_truths: int, n_dares: int,
+                      existing_truths: Sequence[str], existing_dares: Sequence[str]) -> Dict[str, List[str]]:
+        # resp is None when the call failed, that's an empty batch
+        data = self._parse_batch(self._extract_text(resp))
+        return self._collect_batch(data, n_truths, n_dares, existing_truths, existing_dares)
+
+    def _collect_batch(self, data: dict, n_truths: int, n_dares: int,
+                       existing_truths: Sequence[str], existing_dares: Sequence[str]) -> Dict[str, List[str]]:
+        out = {"truths": [], "dares": []}
+        for kind, key, n, existing in (("truth", "truths", n_truths, existing_truths),
+                                       ("dare", "dares", n_dares, existing_dares)):
+            seen = {normalize_text(t) for t in existing}
+            for raw in data.get(key, []):
+                if len(out[key]) >= n:
+                    break
+                txt = self._clean_item(kind, raw) if isinstance(raw, str) else None
+                if not txt:
+                    continue
+                norm = normalize_text(txt)
+                if norm in seen:
+                    continue
+                seen.add(norm)
+                out[key].append(txt)
+
+        logger.info(f"Batch ok: {len(out['truths'])} truths, {len(out['dares'])} dares")
+        return out
+
+    def accepting_requests(self) -> bool:
+        # False while the breaker is open, callers should give up instead of retrying
+        return self.enabled and self.breaker.state != CircuitBreaker.OPEN
+
+    def _call(self, contents, config, probe=False):
+        """
+        One Gemini request behind the circuit breaker and the rate limiter.
+        Raises AIUnavailable without calling the API if either says no; API
+        errors count against the breaker and are re-raised.
+
+        probe=True is the health check: it doesn't wait for a rate limit
+        token and isn't charged to usage, so it can't eat into game traffic
+        or the budgets.
+        """
+        self._check_breaker()
+        if not probe and not self.bucket.take(timeout=self.RATE_WAIT):
+            self._rate_limited()
+
+        started = time.monotonic()
+        try:
+            resp = self.client.models.generate_content(
+                model=self.MODEL,
+                contents=contents,
+                config=config
+            )
+        except Exception as e:
+            self._record_failure(contents, started, e, probe)
+            raise
+        self._record_success(contents, resp, started, probe)
+        return resp
+
+    async def _acall(self, contents, config, probe=False):
+        # _call for the async client, waits for rate limit tokens on the event loop
+        self._check_breaker()
+        if not probe and not await self.bucket.atake(timeout=self.RATE_WAIT):
+            self._rate_limited()
+
+        started = time.monotonic()
+        try:
+            resp = await self.client.aio.models.generate_content(
+                model=self.MODEL,
+                contents=contents,
+                config=config
+            )
+        except Exception as e:
+            self._record_failure(contents, started, e, probe)
+            raise
+        self._record_success(contents, resp, started, probe)
+        return resp
+
+    # bookkeeping shared by _call and _acall
+
+    def _check_breaker(self):
+        if not self.breaker.allow():
+            raise AIUnavailable("AI circuit breaker is open")
+
+    def _rate_limited(self):
+        # hand back the half-open probe slot allow() may have given us
+        self.breaker.cancel()
+        raise AIUnavailable("AI rate limit reached")
+
+    def _record_failure(self, contents, started, error, probe):
+        latency = time.monotonic() - started
+        self.breaker.record_failure()
+        self.health.record(latency, False, error)
+        if not probe:
+            ai_usage.record_call(self._estimate_tokens(contents), 0, latency, ok=False)
+
+    def _record_success(self, contents, resp, started, probe):
+        latency = time.monotonic() - started
+        self.breaker.record_success()
+        self.health.record(latency, True)
+        if not probe:
+            ai_usage.record_call(*self._token_counts(contents, resp), latency)
+
+    @staticmethod
+    def _estimate_tokens(text) -> int:
+        # roughly 4 characters per token, for when the API doesn't say
+        return (len(text) + 3) // 4 if text else 0
+
+    def _token_counts(self, contents, resp):
+        # (prompt, response) tokens, from usage_metadata when the API sends it
+        meta = getattr(resp, "usage_metadata", None)
+        prompt = getattr(meta, "prompt_token_count", None)
+        reply = getattr(meta, "candidates_token_count", None)
+        if not isinstance(prompt, int):
+            prompt = self._estimate_tokens(contents)
+        if not isinstance(reply, int):
+            reply = self._estimate_tokens(self._extract_text(resp))
+        return prompt, reply
+
+    @staticmethod
+    def _extract_text(resp) -> Optional[str]:
+        if not resp:
+            return None
+        if hasattr(resp, 'text'):
+            return resp.text
+        if hasattr(resp, 'candidates') and resp.candidates:
+            c = resp.candidates[0]
+            if hasattr(c, 'content') and hasattr(c.content, 'parts'):
+                parts = c.content.parts
+                if parts and hasattr(parts[0], 'text'):
+                    return parts[0].text
+        return None
+
+    @staticmethod
+    def _clean_item(kind: str, txt: Optional[str]) -> Optional[str]:
+        # strip quotes, truths end with '?', anything under 5 chars is junk
+        if not txt:
+            return None
+        txt = txt.strip()
+        if not txt or len(txt) < 5:
+            return None
 
-        p += "Generate ONE new, unique dare now:"
-        return p
+        if txt.startswith('"') and txt.endswith('"'):
+            txt = txt[1:-1]
+        if txt.startswith("'") and txt.endswith("'"):
+            txt = txt[1:-1]
+
+        if kind == "truth" and not txt.endswith('?'):
+            txt += '?'
+        return txt
+
+    @staticmethod
+    def _parse_batch(txt: Optional[str]) -> dict:
+        if not txt:
+            return {}
+        txt = txt.strip()
+        if txt.startswith("```"):
+            # model sometimes wraps it in a code fence anyway
+            txt = txt.strip("`")
+            if txt.startswith("json"):
+                txt = txt[4:]
+        try:
+            data = json.loads(txt)
+        except ValueError:
+            logger.error(f"Batch response is not JSON: '{txt[:80]}...'")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _truth_prompt(self, existing_truths: Sequence[str]) -> str:
+        return (TRUTH_PROMPT_HEAD
+                + _existing_block("Existing truth questions", tuple(existing_truths[:30]))
+                + "Generate ONE new, unique truth question now:")
+
+    def _dare_prompt(self, existing_dares: Sequence[str]) -> str:
+        return (DARE_PROMPT_HEAD
+                + _existing_block("Existing dares", tuple(existing_dares[:30]))
+                + "Generate ONE new, unique dare now:")
+
+    def _batch_prompt(self, n_truths: int, n_dares: int,
+                      existing_truths: Sequence[str], existing_dares: Sequence[str]) -> str:
+        return (BATCH_PROMPT_HEAD.format(n_truths=n_truths, n_dares=n_dares)
+                + _existing_block("Existing truth questions", tuple(existing_truths[:30]))
+                + _existing_block("Existing dares", tuple(existing_dares[:30]))
+                + "Generate the JSON now:")
 
     def get_status(self) -> dict:
         return {
             "enabled": self.enabled,
             "model": self.MODEL,
+            "backend": self.backend,
             "initialization_error": self.initialization_error,
             "has_client": self.client is not None,
-            "api_key_configured": os.environ.get("GEMINI_API_KEY") is not None
+            "api_key_configured": os.environ.get("GEMINI_API_KEY") is not None,
+            "circuit_breaker": self.breaker.status(),
+            "rate_tokens_available": int(self.bucket.available()),
+            "health": self.health.snapshot(),
+            "usage": ai_usage.status(),
         }
 
     def test_generation(self) -> dict:
@@ -206,21 +434,13 @@ IMPORTANT: Output ONLY the dare itself, nothing else. No explanations, no prefix
 
         try:
             logger.info("Running AI generation test...")
-            resp = self.client.models.generate_content(
-                model=self.MODEL,
-                contents="Generate a simple truth question for a party game.",
-                config={"max_output_tokens": 100}
+            resp = self._call(
+                "Generate a simple truth question for a party game.",
+                {"max_output_tokens": 100},
+                probe=True,
             )
 
-            txt = None
-            if hasattr(resp, 'text'):
-                txt = resp.text
-            elif hasattr(resp, 'candidates') and resp.candidates:
-                c = resp.candidates[0]
-                if hasattr(c, 'content') and hasattr(c.content, 'parts'):
-                    parts = c.content.parts
-                    if parts and hasattr(parts[0], 'text'):
-                        txt = parts[0].text
+            txt = self._extract_text(resp)
 
             if txt:
                 logger.info(f"AI test ok: '{txt[:50]}...'")
@@ -245,3 +465,19 @@ def get_ai_generator():
             if _ai_generator is None:
                 _ai_generator = AIGenerator()
     return _ai_generator
+
+
+_ai_health_prober = None
+
+
+def get_ai_health_prober():
+    # one prober for the shared generator, started by init_socket_helpers
+    global _ai_health_prober
+    if _ai_health_prober is None:
+        ai_gen = get_ai_generator()   # outside the lock, it takes the same one
+        with _ai_generator_lock:
+            if _ai_health_prober is None:
+                _ai_health_prober = AIHealthProber(
+                    ai_gen, interval=float(os.environ.get("AI_HEALTH_INTERVAL", 120))
+                )
+    return _ai_health_prober
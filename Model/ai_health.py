@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class AIHealth:
+    """
+    Rolling record of how the Gemini calls have been going.
+
+    AIGenerator records every real call here (latency, ok or not), and the
+    background prober adds its own test calls, so check_ai_status can
+    answer from snapshot() without touching the network.
+    """
+
+    def __init__(self, window=100, clock=time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=window)   # (latency seconds, ok)
+        self.last_error = None
+        self.last_error_at = None
+        self.last_success_at = None
+        self.last_call_at = None
+        self.last_probe = None   # test_generation() result plus when it ran
+
+    def record(self, latency, ok, error=None):
+        now = self._clock()
+        with self._lock:
+            self._samples.append((latency, ok))
+            self.last_call_at = now
+            if ok:
+                self.last_success_at = now
+            else:
+                self.last_error = str(error) if error is not None else "unknown error"
+                self.last_error_at = now
+
+    def record_probe(self, result):
+        with self._lock:
+            self.last_probe = dict(result, checked_at=self._clock())
+
+    @staticmethod
+    def _percentile(sorted_vals, p):
+        if not sorted_vals:
+            return None
+        i = min(len(sorted_vals) - 1, int(round(p / 100.0 * (len(sorted_vals) - 1))))
+        return round(sorted_vals[i] * 1000)
+
+    def snapshot(self):
+        with self._lock:
+            samples = list(self._samples)
+            ok_lat = sorted(lat for lat, ok in samples if ok)
+            return {
+                "calls": len(samples),
+                "success_rate": (round(sum(ok for _, ok in samples) / len(samples), 3)
+                                 if samples else None),
+                "latency_ms": {
+                    "p50": self._percentile(ok_lat, 50),
+                    "p95": self._percentile(ok_lat, 95),
+                    "p99": self._percentile(ok_lat, 99),
+                },
+                "last_error": self.last_error,
+                "last_error_at": self.last_error_at,
+                "last_success_at": self.last_success_at,
+                "last_probe": dict(self.last_probe) if self.last_probe else None,
+            }
+
+
+class AIHealthProber:
+    """
+    Runs ai_gen.test_generation() in the background every `interval`
+    seconds, skipped while real traffic already keeps the numbers fresh.
+    poke() asks for a probe as soon as possible (host pressed "test").
+    """
+
+    def __init__(self, ai_gen, interval=120.0, clock=time.time):
+        self.ai_gen = ai_gen
+        self.interval = interval
+        self._clock = clock
+        self._wake = threading.Event()
+        self._started = False
+        self._lock = threading.Lock()
+
+    def start(self, spawn):
+        # spawn(fn): how to start the loop (socketio.start_background_task)
+        with self._lock:
+            if self._started:
+                return False
+            self._started = True
+        spawn(self._run)
+        return True
+
+    def poke(self):
+        self._wake.set()
+
+    def probe_due(self, forced=False):
+        gen = self.ai_gen
+        if not gen.enabled:
+            return False
+        if forced:
+            return True
+        last = gen.health.last_call_at
+        return last is None or self._clock() - last >= self.interval
+
+    def probe_once(self, forced=False):
+        if not self.probe_due(forced):
+            return None
+        result = self.ai_gen.test_generation()
+        self.ai_gen.health.record_probe(result)
+        return result
+
+    def _run(self):
+        while True:
+            forced = self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.probe_once(forced)
+            except Exception as e:
+                logger.exception(f"AI health probe failed: {e}")
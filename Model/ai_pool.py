@@ -0,0 +1,106 @@
+import os
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+
+class AIPoolFull(Exception):
+    """The room already has as many AI requests waiting as it's allowed."""
+
+
+class AIPoolTimeout(Exception):
+    """Waited too long for a free AI slot."""
+
+
+class AIRequestPool:
+    """
+    Caps how many AI calls run at once across the process.
+
+    Callers that can't get a slot right away wait in a queue per room, and
+    freed slots go to the rooms round-robin, so one room firing off lots of
+    requests can't starve the others. Each room can only have
+    max_queue_per_room requests waiting; past that, acquire raises
+    AIPoolFull instead of piling up more work.
+
+    The caller runs its own call once it has a slot (no worker threads in
+    here), which works the same with eventlet green threads and plain threads.
+    """
+
+    def __init__(self, concurrency=2, max_queue_per_room=4):
+        self.concurrency = max(1, int(concurrency))
+        self.max_queue_per_room = max(1, int(max_queue_per_room))
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queues = OrderedDict()   # room code -> waiting Events, oldest room first
+
+    def acquire(self, room_code, timeout=None):
+        with self._lock:
+            if self._active < self.concurrency and not self._queues:
+                self._active += 1
+                return True
+            q = self._queues.get(room_code)
+            if q is None:
+                q = self._queues[room_code] = deque()
+            if len(q) >= self.max_queue_per_room:
+                raise AIPoolFull(f"room {room_code} has {len(q)} AI requests waiting")
+            ev = threading.Event()
+            q.append(ev)
+
+        if ev.wait(timeout):
+            return True
+
+        with self._lock:
+            if ev.is_set():   # slot got handed over right as we gave up
+                return True
+            q.remove(ev)
+            if not q and self._queues.get(room_code) is q:
+                del self._queues[room_code]
+        return False
+
+    def release(self):
+        with self._lock:
+            if not self._queues:
+                self._active -= 1
+                return
+            # hand the slot straight to the next room in line
+            room_code, q = next(iter(self._queues.items()))
+            ev = q.popleft()
+            if q:
+                self._queues.move_to_end(room_code)
+            else:
+                del self._queues[room_code]
+            ev.set()
+
+    @contextmanager
+    def slot(self, room_code, timeout=None):
+        if not self.acquire(room_code, timeout):
+            raise AIPoolTimeout(f"no AI slot for room {room_code} within {timeout}s")
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "active": self._active,
+                "waiting": {code: len(q) for code, q in self._queues.items()},
+            }
+
+
+_ai_pool = None
+_ai_pool_lock = threading.Lock()
+
+
+def get_ai_pool():
+    global _ai_pool
+    if _ai_pool is None:
+        with _ai_pool_lock:
+            if _ai_pool is None:
+                # tune AI_CONCURRENCY to what the API quota allows
+                _ai_pool = AIRequestPool(
+                    concurrency=os.environ.get("AI_CONCURRENCY", 2),
+                    max_queue_per_room=os.environ.get("AI_QUEUE_PER_ROOM", 4),
+                )
+    return _ai_pool
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+
+
+class AIUnavailable(Exception):
+    """The call wasn't made: the breaker is open or the rate limit ran out."""
+
+
+class TokenBucket:
+    """
+    Client-side rate limit for API calls.
+
+    Holds up to `burst` tokens and refills at `rate_per_min`. take() waits
+    for a token only if one will be there within the timeout; otherwise it
+    returns False right away, so callers don't sit on a request the quota
+    won't let through anyway.
+    """
+
+    def __init__(self, rate_per_min=30, burst=5, clock=time.monotonic, sleep=time.sleep):
+        self.rate = max(0.001, float(rate_per_min)) / 60.0   # tokens per second
+        self.burst = max(1, int(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._stamp = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def try_take(self):
+        # 0 if a token was taken, else how many seconds until the next one
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def take(self, timeout=0.0):
+        deadline = self._clock() + timeout
+        while True:
+            wait = self.try_take()
+            if not wait:
+                return True
+            if self._clock() + wait > deadline:
+                return False
+            self._sleep(wait)
+
+    async def atake(self, timeout=0.0):
+        # same as take() but waits on the event loop
+        deadline = self._clock() + timeout
+        while True:
+            wait = self.try_take()
+            if not wait:
+                return True
+            if self._clock() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+    def available(self):
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class CircuitBreaker:
+    """
+    Stops calling the API after it keeps failing.
+
+    closed: calls go through, `failure_threshold` failures in a row trip it.
+    open: allow() says no until `cooldown` seconds have passed.
+    half_open: one probe call is let through; success closes the breaker,
+    failure opens it for another cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, cooldown=30.0, clock=time.monotonic):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = float(cooldown)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_out = False
+        self.trips = 0
+
+    def _current(self):
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.cooldown:
+            self._state = self.HALF_OPEN
+            self._probe_out = False
+        return self._state
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current()
+
+    def allow(self):
+        with self._lock:
+            state = self._current()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_out:
+                self._probe_out = True
+                return True
+            return False
+
+    def cancel(self):
+        # an allowed call that never went out, let the next one probe instead
+        with self._lock:
+            self._probe_out = False
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_out = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.trips += 1
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probe_out = False
+
+    def status(self):
+        with self._lock:
+            state = self._current()
+            retry_in = 0.0
+            if state == self.OPEN:
+                retry_in = max(0.0, self.cooldown - (self._clock() - self._opened_at))
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "trips": self.trips,
+                "retry_in": round(retry_in, 1),
+            }
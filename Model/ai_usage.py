@@ -0,0 +1,116 @@
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class AIUsage:
+    """
+    What the AI has cost one scope (a room, or the whole process): API
+    calls, tokens each way, time spent waiting, and what we got out of it
+    without a call (cache hits, local fallbacks) or threw away (duplicates).
+    """
+
+    FIELDS = ("calls", "failures", "prompt_tokens", "response_tokens",
+              "duplicates", "cache_hits", "local_fallbacks")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency_total = 0.0
+        for f in self.FIELDS:
+            setattr(self, f, 0)
+
+    @property
+    def tokens(self):
+        return self.prompt_tokens + self.response_tokens
+
+    def record_call(self, prompt_tokens, response_tokens, latency, ok=True):
+        with self._lock:
+            self.calls += 1
+            if not ok:
+                self.failures += 1
+            self.prompt_tokens += prompt_tokens
+            self.response_tokens += response_tokens
+            self.latency_total += latency
+
+    def bump(self, field, n=1):
+        # duplicates / cache_hits / local_fallbacks
+        with self._lock:
+            setattr(self, field, getattr(self, field) + n)
+
+    def snapshot(self):
+        with self._lock:
+            out = {f: getattr(self, f) for f in self.FIELDS}
+            out["tokens"] = self.tokens
+            out["avg_latency_ms"] = (round(self.latency_total / self.calls * 1000)
+                                     if self.calls else None)
+            return out
+
+
+class AIBudget:
+    """Call/token caps for one scope; None means no cap."""
+
+    def __init__(self, max_calls=None, max_tokens=None):
+        self.max_calls = max_calls
+        self.max_tokens = max_tokens
+
+    @classmethod
+    def from_env(cls, prefix):
+        # e.g. AI_ROOM_MAX_CALLS / AI_ROOM_MAX_TOKENS
+        calls = os.environ.get(f"{prefix}_MAX_CALLS")
+        tokens = os.environ.get(f"{prefix}_MAX_TOKENS")
+        return cls(int(calls) if calls else None, int(tokens) if tokens else None)
+
+    def exceeded(self, usage):
+        return ((self.max_calls is not None and usage.calls >= self.max_calls)
+                or (self.max_tokens is not None and usage.tokens >= self.max_tokens))
+
+    def to_dict(self):
+        return {"max_calls": self.max_calls, "max_tokens": self.max_tokens}
+
+
+# usage of whichever room the current thread/green thread/task is calling the AI for
+_current_usage = ContextVar("ai_usage", default=None)
+
+process_usage = AIUsage()
+room_budget = AIBudget.from_env("AI_ROOM")
+global_budget = AIBudget.from_env("AI_GLOBAL")
+
+
+@contextmanager
+def usage_scope(usage):
+    """Charge AI calls made inside the block to `usage` (a room's AIUsage)."""
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
+
+
+def record_call(prompt_tokens, response_tokens, latency, ok=True):
+    # AIGenerator calls this for every request; goes to the process and the current scope
+    process_usage.record_call(prompt_tokens, response_tokens, latency, ok)
+    scoped = _current_usage.get()
+    if scoped is not None:
+        scoped.record_call(prompt_tokens, response_tokens, latency, ok)
+
+
+def record(usage, field, n=1):
+    process_usage.bump(field, n)
+    if usage is not None:
+        usage.bump(field, n)
+
+
+def over_budget(usage):
+    """True once this room or the whole process has used up its AI budget."""
+    return global_budget.exceeded(process_usage) or (
+        usage is not None and room_budget.exceeded(usage))
+
+
+def status():
+    return {
+        "process": process_usage.snapshot(),
+        "room_budget": room_budget.to_dict(),
+        "global_budget": global_budget.to_dict(),
+        "global_over_budget": global_budget.exceeded(process_usage),
+    }
@@ -0,0 +1,101 @@
+from collections import Counter
+
+from Model.truth_dare import normalize_text
+from Model.near_duplicate import NearDuplicateIndex
+from Model.prompt_context import PromptWindow
+
+
+class ContentIndex:
+    """
+    Multiset of normalized texts for one kind (truths or dares).
+
+    Same text can come from several places at once (a default, an AI item,
+    a player's queued submission...), so every source adds/discards its own
+    copy and the text counts as present while any copy is left.
+    Pass norm= when the caller already has it (TruthDare.norm).
+
+    With near_duplicates=True it also keeps an LSH index of the distinct
+    texts, for find_near() and texts(), and with recent=N a PromptWindow of
+    the last N texts added or used, for AI prompts; rooms turn those on,
+    player piles don't need them. add_many() loads a batch (defaults) and
+    only seeds the window with a sample of it. version changes whenever the
+    set of distinct texts does.
+    """
+
+    __slots__ = ("_counts", "_near", "_texts", "_recent", "version")
+
+    def __init__(self, texts=(), near_duplicates=False, threshold=None, recent=0):
+        self._counts = Counter()
+        self._near = NearDuplicateIndex(threshold) if near_duplicates else None
+        self._texts = {} if near_duplicates else None   # norm -> original text
+        self._recent = PromptWindow(recent) if recent else None
+        self.version = 0
+        for t in texts:
+            self.add(t)
+
+    def add(self, text, norm=None):
+        n = normalize_text(text) if norm is None else norm
+        self._counts[n] += 1
+        if self._counts[n] == 1:
+            self.version += 1
+            if self._near is not None:
+                self._near.add(n if text is None else text, n)
+                self._texts[n] = n if text is None else text
+        # every time, not just the first copy: a drawn default is news to the prompt
+        if self._recent is not None and text is not None:
+            self._recent.add(text)
+
+    def add_many(self, texts):
+        # bulk load (a room's defaults, a list): counts and near-duplicate index,
+        # plus a bounded sample as the prompt window's seed
+        for text in texts:
+            n = normalize_text(text)
+            self._counts[n] += 1
+            if self._counts[n] == 1:
+                self.version += 1
+                if self._near is not None:
+                    self._near.add(text, n)
+                    self._texts[n] = text
+        if self._recent is not None:
+            self._recent.seed(texts)
+
+    def discard(self, text, norm=None):
+        n = normalize_text(text) if norm is None else norm
+        c = self._counts.get(n, 0)
+        if c > 1:
+            self._counts[n] = c - 1
+        elif c:
+            del self._counts[n]
+            self.version += 1
+            if self._near is not None:
+                self._near.remove(n)
+                del self._texts[n]
+
+    def replace(self, old_text, new_text):
+        self.discard(old_text)
+        self.add(new_text)
+
+    def has_norm(self, norm):
+        return norm in self._counts
+
+    def texts(self):
+        # one original text per distinct item, needs near_duplicates=True
+        return list(self._texts.values()) if self._texts is not None else []
+
+    def recent(self):
+        # newest distinct texts, same tuple until the window changes
+        return self._recent.items() if self._recent is not None else ()
+
+    def find_near(self, text, norm=None):
+        # normalized text of something close enough to count as the same item, or None
+        n = normalize_text(text) if norm is None else norm
+        if n in self._counts:
+            return n
+        return self._near.find(text, n) if self._near is not None else None
+
+    def __contains__(self, text):
+        return normalize_text(text) in self._counts
+
+    def __len__(self):
+        # distinct texts
+        return len(self._counts)
@@ -0,0 +1,76 @@
+import json
+import os
+import threading
+
+from Model.truth_dare import Truth, Dare
+from Model.truth_dare_deck import SharedDeck
+
+CATALOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "default_truths_dares.json",
+)
+
+# used when the json file is missing or broken
+FALLBACK_TRUTHS = (
+    "What is your biggest fear?",
+    "What is the most embarrassing thing you've ever done?",
+)
+FALLBACK_DARES = ("Do 10 pushups", "Sing a song loudly")
+
+
+class DefaultCatalog:
+    """
+    Parsed default_truths_dares.json, shared by every room and player in
+    the process. Everything in here is a tuple and the Truth/Dare objects
+    are never mutated, so it's safe to hand out references instead of copies.
+    """
+
+    def __init__(self, truth_texts, dare_texts, mtime=None):
+        self.truth_texts = tuple(truth_texts)
+        self.dare_texts = tuple(dare_texts)
+        self.truths = tuple(Truth(t, is_default=True, submitted_by=None) for t in self.truth_texts)
+        self.dares = tuple(Dare(d, is_default=True, submitted_by=None) for d in self.dare_texts)
+        self.deck = SharedDeck(self.truths, self.dares)   # what rooms start out with
+        self.mtime = mtime
+        self._truth_by_text = {t.text: t for t in self.truths}
+        self._dare_by_text = {d.text: d for d in self.dares}
+
+    def default_truth(self, text):
+        # shared Truth for a catalog text, a fresh one for anything host-added
+        t = self._truth_by_text.get(text)
+        return t if t is not None else Truth(text, is_default=True, submitted_by=None)
+
+    def default_dare(self, text):
+        d = self._dare_by_text.get(text)
+        return d if d is not None else Dare(text, is_default=True, submitted_by=None)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def _file_mtime():
+    try:
+        return os.stat(CATALOG_PATH).st_mtime
+    except OSError:
+        return None
+
+
+def get_default_catalog():
+    global _catalog
+    mtime = _file_mtime()
+    cat = _catalog
+    if cat is not None and cat.mtime == mtime:
+        return cat
+
+    with _catalog_lock:
+        if _catalog is not None and _catalog.mtime == mtime:
+            return _catalog
+        try:
+            with open(CATALOG_PATH, "r") as f:
+                data = json.load(f)
+            _catalog = DefaultCatalog(data.get("truths", []), data.get("dares", []), mtime)
+        except Exception as e:
+            print(f"Warning: Could not load default truths/dares: {e}")
+            _catalog = DefaultCatalog(FALLBACK_TRUTHS, FALLBACK_DARES, mtime)
+        return _catalog
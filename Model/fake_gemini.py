@@ -0,0 +1,202 @@
+import asyncio
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+
+
+class FakeGeminiError(Exception):
+    """Simulated API failure (what a 429/503 would look like to the caller)."""
+
+
+# fresh items are one word from each slot, so any two differ in at least one
+# content word and don't look like rewordings of each other to near_duplicate
+_TRUTH_SLOTS = (
+    "strangest funniest weirdest oldest smallest loudest messiest silliest scariest "
+    "sweetest rarest coolest saddest luckiest cheapest fanciest nerdiest spiciest "
+    "tiniest wildest quietest brightest cosiest boldest".split(),
+    "secret habit gift meal song toy lie text photo prank dream rumor nickname "
+    "purchase mistake crush movie book game trip outfit haircut pet hobby".split(),
+    "kept forgot loved hid lost found shared bought broke regretted borrowed faked "
+    "sold wanted ignored invented".split(),
+    ["last summer", "in school", "as a kid", "this year", "on holiday", "at a party",
+     "online", "at work", "last night", "on a date", "at home", "in class",
+     "on the bus", "at a wedding", "at camp", "by accident"],
+)
+_DARE_SLOTS = (
+    "Dance Hop Sing Whisper Crawl Spin March Wiggle Clap Moonwalk Tiptoe Strut "
+    "Waddle Skip Bow Wave".split(),
+    "penguin robot pirate chicken ninja cat frog dinosaur monkey zombie wizard "
+    "astronaut duck snake kangaroo tiger octopus mermaid cowboy ghost llama knight "
+    "parrot giraffe".split(),
+    "slowly loudly silently dramatically backwards proudly nervously happily sadly "
+    "gracefully wildly politely sleepily angrily shyly clumsily".split(),
+    "10 15 20 25 30 40 45 60".split(),
+)
+_STEP = 7919   # prime, coprime with both slot products, so i -> (i * _STEP) % total is a bijection
+
+
+def _combo(slots, i):
+    # i-th word combination, consecutive i land far apart
+    total = 1
+    for words in slots:
+        total *= len(words)
+    k = (i * _STEP) % total
+    out = []
+    for words in slots:
+        k, r = divmod(k, len(words))
+        out.append(words[r])
+    return out
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeModels:
+    def __init__(self, backend, is_async):
+        self._backend = backend
+        self._async = is_async
+
+    def generate_content(self, model=None, contents="", config=None):
+        if self._async:
+            return self._backend._agenerate(contents, config or {})
+        return self._backend._generate(contents, config or {})
+
+
+class _FakeAio:
+    def __init__(self, backend):
+        self.models = _FakeModels(backend, True)
+
+
+class FakeGeminiClient:
+    """
+    Stands in for genai.Client without touching the network.
+
+    Same shape as the real thing for what AIGenerator uses:
+    client.models.generate_content(...) and the awaitable
+    client.aio.models.generate_content(...). Knobs:
+
+    latency: seconds per call, a number, a (low, high) uniform range, or
+        ("lognormal", median, sigma) for a long-tailed API
+    error_rate: chance a call fails with FakeGeminiError
+    duplicate_rate: chance a reply repeats an earlier one instead of a new item
+    max_rps: calls per second the fake "quota" allows, past that calls fail
+        with a 429 like the real API (None = no cap)
+
+    Fresh replies are built from word lists so they never repeat (for the
+    first ~50k of each kind) and read as different items, not rewordings.
+    They come back as JSON when the request asks for it (batch calls).
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, duplicate_rate=0.0, max_rps=None, seed=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.duplicate_rate = duplicate_rate
+        self.max_rps = max_rps
+        self._rng = random.Random(seed)
+        self._made = {"truth": itertools.count(self._rng.randrange(1 << 16)),
+                      "dare": itertools.count(self._rng.randrange(1 << 16))}
+        self._lock = threading.Lock()
+        self._recent_calls = deque()   # monotonic times of calls in the last second
+        self._replies = {"truth": [], "dare": []}
+        self.calls = 0
+        self.failures = 0
+        self.throttled = 0
+        self.models = _FakeModels(self, False)
+        self.aio = _FakeAio(self)
+
+    @classmethod
+    def from_env(cls, env=None):
+        """
+        Built from AI_FAKE_LATENCY ("0.3", "0.1-0.8" or "lognormal:0.4:0.6"),
+        AI_FAKE_ERROR_RATE, AI_FAKE_DUPLICATE_RATE, AI_FAKE_MAX_RPS and
+        AI_FAKE_SEED.
+        """
+        env = os.environ if env is None else env
+        rps = env.get("AI_FAKE_MAX_RPS")
+        seed = env.get("AI_FAKE_SEED")
+        return cls(
+            latency=parse_latency(env.get("AI_FAKE_LATENCY", "0.3")),
+            error_rate=float(env.get("AI_FAKE_ERROR_RATE", 0)),
+            duplicate_rate=float(env.get("AI_FAKE_DUPLICATE_RATE", 0)),
+            max_rps=float(rps) if rps else None,
+            seed=int(seed) if seed else None,
+        )
+
+    def _delay(self):
+        lat = self.latency
+        with self._lock:
+            if isinstance(lat, (tuple, list)):
+                if lat[0] == "lognormal":
+                    _, median, sigma = lat
+                    return median * self._rng.lognormvariate(0, sigma)
+                return self._rng.uniform(lat[0], lat[1])
+            return float(lat)
+
+    def _admit(self):
+        # counts the call; raises like the real API on quota/outage
+        now = time.monotonic()
+        with self._lock:
+            self.calls += 1
+            if self.max_rps is not None:
+                while self._recent_calls and now - self._recent_calls[0] >= 1.0:
+                    self._recent_calls.popleft()
+                if len(self._recent_calls) >= self.max_rps:
+                    self.throttled += 1
+                    raise FakeGeminiError("429 fake quota exceeded")
+                self._recent_calls.append(now)
+            if self._rng.random() < self.error_rate:
+                self.failures += 1
+                raise FakeGeminiError("503 fake backend unavailable")
+
+    def _item(self, kind):
+        # a fresh item, or now and then one handed out before
+        with self._lock:
+            seen = self._replies[kind]
+            if seen and self._rng.random() < self.duplicate_rate:
+                return self._rng.choice(seen)
+            i = next(self._made[kind])
+            if kind == "truth":
+                adj, noun, verb, when = _combo(_TRUTH_SLOTS, i)
+                text = f"What is the {adj} {noun} you {verb} {when}?"
+            else:
+                verb, animal, manner, secs = _combo(_DARE_SLOTS, i)
+                text = f"{verb} like a {animal} {manner} for {secs} seconds"
+            seen.append(text)
+            return text
+
+    def _reply(self, contents, config):
+        if config.get("response_mime_type") == "application/json":
+            count = max(1, (config.get("max_output_tokens", 128) - 64) // 64)
+            return _FakeResponse(json.dumps({
+                "truths": [self._item("truth") for _ in range(count)],
+                "dares": [self._item("dare") for _ in range(count)],
+            }))
+        kind = "dare" if "unique dare" in str(contents) else "truth"   # see AIGenerator._dare_prompt
+        return _FakeResponse(self._item(kind))
+
+    def _generate(self, contents, config):
+        time.sleep(self._delay())
+        self._admit()
+        return self._reply(contents, config)
+
+    async def _agenerate(self, contents, config):
+        await asyncio.sleep(self._delay())
+        self._admit()
+        return self._reply(contents, config)
+
+
+def parse_latency(spec):
+    spec = str(spec).strip()
+    if spec.startswith("lognormal:"):
+        _, median, sigma = spec.split(":")
+        return ("lognormal", float(median), float(sigma))
+    if "-" in spec[1:]:
+        lo, hi = spec.split("-", 1)
+        return (float(lo), float(hi))
+    return float(spec)
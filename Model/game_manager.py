@@ -4,82 +4,101 @@ import threading
 
 from Model.room import Room
 from Model.player import Player
+from Model.room_registry import RoomRegistry
 
 
 class GameManager:
     def __init__(self):
-        self.rooms = {}
-        self._lock = threading.RLock()
+        # sharded, lookups don't take any lock
+        self.rooms = RoomRegistry()
+        self._sid_rooms = {}   # sid -> set of room codes that sid is in
+        self._sid_lock = threading.Lock()   # only ever held for the dict ops on _sid_rooms
 
     def create_room(self):
-        with self._lock:
+        while True:
             code = self._gen_code()
-            self.rooms[code] = Room(code)
-            return code
+            if self.rooms.add_new(code, Room(code)):   # retry on the odd code collision
+                return code
 
     def get_room(self, code):
-        with self._lock:
-            return self.rooms.get(code)
+        return self.rooms.get(code)
 
     def room_exists(self, code):
-        with self._lock:
-            return code in self.rooms
+        return code in self.rooms
 
     def delete_room(self, code):
-        with self._lock:
-            if code in self.rooms:
-                del self.rooms[code]
+        room = self.rooms.pop(code)
+        if room:
+            with self._sid_lock:
+                for p in list(room.players):
+                    self._unindex(p.socket_id, code)
+            self._close_room(room)
+
+    def _close_room(self, room):
+        # anything still scheduled for this room is now pointless
+        room.game_state.bump_epoch()
+        room.cancel_timers()
 
     def add_player_to_room(self, code, socket_id, name):
-        with self._lock:
-            if code not in self.rooms:
-                self.rooms[code] = Room(code)
+        p = Player(socket_id, name)
+        while True:
+            room = self.rooms.get_or_create(code, Room)
 
-            p = Player(socket_id, name)
-            self.rooms[code].add_player(p)
-            return self.rooms[code]
+            room.mailbox.call(room.add_player, p)
 
-    def remove_player_from_room(self, code, socket_id):
-        with self._lock:
-            if code not in self.rooms:
-                return None
+            if self.rooms.get(code) is room:
+                with self._sid_lock:
+                    self._sid_rooms.setdefault(socket_id, set()).add(code)
+                return room
+            # room emptied out and got deleted meanwhile, go again with a fresh one
 
-            room = self.rooms[code]
-            room.remove_player(socket_id)
+    def remove_player_from_room(self, code, socket_id):
+        room = self.rooms.get(code)
+        if room is None:
+            return None
 
-            if room.is_empty():   # kill empty room
-                self.delete_room(code)
-                return None
+        room.mailbox.call(room.remove_player, socket_id)
+        with self._sid_lock:
+            self._unindex(socket_id, code)
 
-            return room
+        if self._drop_if_empty(code, room):   # kill empty room
+            return None
+        return room
 
     def remove_player_from_all_rooms(self, socket_id):
-        with self._lock:
-            codes = list(self.rooms.keys())
-            to_del = []
-            updated = []
-
-            for code in codes:
-                if code not in self.rooms:
-                    continue
-
-                room = self.rooms[code]
-                if any(p.socket_id == socket_id for p in room.players):
-                    room.remove_player(socket_id)
-                    if room.is_empty():
-                        to_del.append(code)
-                    else:
-                        updated.append(code)
-
-            for code in to_del:
-                if code in self.rooms:
-                    del self.rooms[code]
-
-            return updated
+        # only touch the rooms this sid is actually in
+        with self._sid_lock:
+            codes = self._sid_rooms.pop(socket_id, ())
+
+        updated = []
+        for code in codes:
+            room = self.rooms.get(code)
+            if room is None or room.get_player_by_sid(socket_id) is None:
+                continue
+
+            room.mailbox.call(room.remove_player, socket_id)
+            if not self._drop_if_empty(code, room):
+                updated.append(code)
+
+        return updated
+
+    def _unindex(self, socket_id, code):
+        codes = self._sid_rooms.get(socket_id)
+        if codes is not None:
+            codes.discard(code)
+            if not codes:
+                del self._sid_rooms[socket_id]
+
+    def _drop_if_empty(self, code, room):
+        gone = self.rooms.pop_if(code, lambda r: r is room and r.is_empty())
+        if gone is None:
+            return False
+        self._close_room(gone)
+        return True
 
     def _gen_code(self, length=6):
         return ''.join(random.choices(string.ascii_uppercase + string.digits, k=length))
 
     def to_dict(self):
-        with self._lock:
-            return {code: room.to_dict() for code, room in self.rooms.items()}
+        # snapshot first so no shard lock is held while rooms serialize themselves
+        return {code: room.to_dict() for code, room in self.rooms.items()}
@@ -0,0 +1,88 @@
+import random
+from collections import defaultdict
+from typing import Callable, Iterable, Optional
+
+from Model.truth_dare import normalize_text
+
+# last resort when the room's catalog is too small to recombine anything
+TRUTH_TEMPLATES = (
+    "What is the {adj} thing you have ever {verb}?",
+    "Who in this room would you trust to {task}?",
+    "What is something {adj} you have never told anyone?",
+)
+DARE_TEMPLATES = (
+    "Try to {task} while everyone watches",
+    "Let the group pick someone for you to {task} with",
+    "Do your best impression of someone trying to {task}",
+)
+FILLERS = {
+    "adj": ("weirdest", "funniest", "most awkward", "boldest", "silliest", "most surprising"),
+    "verb": ("eaten", "said to a stranger", "done on a dare", "bought", "lied about", "googled"),
+    "task": ("juggle three things", "sing a jingle", "tell a joke", "balance a spoon on your nose",
+             "speak in rhymes for a minute", "walk like a penguin"),
+}
+
+_START = "\x02"
+_END = "\x03"
+
+
+class LocalGenerator:
+    """
+    Instant truths/dares made on this machine, for when the AI is too slow.
+
+    Word-level Markov chain (two words of context) over the texts it's given,
+    usually the room's own catalog, so the output sounds like the rest of the
+    game. Falls back to fixed templates when the chain can't come up with
+    anything new.
+    """
+
+    def __init__(self, texts: Iterable[str], rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+        self._chain = defaultdict(list)
+        self._sources = set()
+        for t in texts:
+            words = t.split()
+            if len(words) < 3:
+                continue
+            self._sources.add(normalize_text(t))
+            seq = [_START, _START] + words + [_END]
+            for i in range(len(seq) - 2):
+                self._chain[(seq[i], seq[i + 1])].append(seq[i + 2])
+
+    def _walk(self, max_words=20):
+        a, b = _START, _START
+        out = []
+        for _ in range(max_words):
+            nxt = self.rng.choice(self._chain[(a, b)])
+            if nxt == _END:
+                return " ".join(out)
+            out.append(nxt)
+            a, b = b, nxt
+        return None
+
+    def generate(self, kind: str, exclude: Callable[[str, str], bool] = None,
+                 attempts: int = 50) -> Optional[str]:
+        """A new item of this kind; exclude(text, norm) rejects ones the room already has."""
+        def ok(txt):
+            if not txt or len(txt) < 10:
+                return None
+            if kind == "truth" and not txt.endswith("?"):
+                txt += "?"
+            n = normalize_text(txt)
+            if n in self._sources or (exclude is not None and exclude(txt, n)):
+                return None
+            return txt
+
+        if self._chain:
+            for _ in range(attempts):
+                txt = ok(self._walk())
+                if txt:
+                    return txt
+
+        templates = TRUTH_TEMPLATES if kind == "truth" else DARE_TEMPLATES
+        for _ in range(attempts):
+            tpl = self.rng.choice(templates)
+            txt = ok(tpl.format(**{k: self.rng.choice(v) for k, v in FILLERS.items()}))
+            if txt:
+                return txt
+        return None
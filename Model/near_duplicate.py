@@ -0,0 +1,167 @@
+import os
+import random
+import re
+import threading
+import zlib
+from functools import lru_cache
+
+NUM_PERM = 64
+BANDS = 16              # 16 bands of 4 rows: pairs around 0.5 similarity start colliding
+ROWS = NUM_PERM // BANDS
+# minimum Jaccard similarity of the content words; for longer texts is_near()
+# raises the bar with length, by an amount that also comes from this setting
+DEFAULT_THRESHOLD = float(os.environ.get("NEAR_DUP_THRESHOLD", 0.7))
+
+_rng = random.Random(0x7D)   # fixed, signatures have to match across rooms and runs
+# one XOR mask per "permutation": min(h ^ mask) over the shingle hashes, the
+# min runs in C through map(), a lot cheaper than (a*h + b) % p in Python
+_MASKS = tuple(_rng.getrandbits(32) for _ in range(NUM_PERM))
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+# words that don't change what a truth/dare is asking for
+_STOPWORDS = frozenset("""
+    a an the and or but of to in on at for with from by about as into over
+    is are was were be been being am do does did done have has had having
+    will would could should can may might must shall
+    i me my mine myself you your yours yourself he him his she her it its
+    we us our they them their this that these those
+    if then than so just ever really actually very
+    thing things something anything someone anyone one some any
+""".split())
+# Gemini's favourite ways of saying the same thing
+_SYNONYMS = {"biggest": "most", "greatest": "most", "largest": "most",
+             "favourite": "favorite"}
+
+
+def _words(text):
+    out = []
+    for w in _WORD.findall(text.lower().replace("’", "'")):
+        base, _, suffix = w.partition("'")
+        if suffix == "t" and base.endswith("n"):
+            # don't / can't / won't: keep the "not", it flips the question
+            out.append("not")
+            base = {"ca": "can", "wo": "will"}.get(base[:-1], base[:-1])
+        if (len(base) > 3 and base.endswith("s") and base not in _STOPWORDS
+                and not base.endswith(("ss", "us", "is"))):
+            base = base[:-1]   # plurals
+        out.append(_SYNONYMS.get(base, base))
+    return out
+
+
+@lru_cache(maxsize=8192)
+def word_shingles(text):
+    """
+    Hashes of the content words of a text: lowercased, contractions split,
+    plurals and a few synonyms folded, filler words dropped. Word order
+    doesn't matter, so "What's your biggest fear?" and "What is the thing
+    you fear most?" come out the same.
+    """
+    words = _words(text)
+    grams = {w for w in words if w not in _STOPWORDS} or set(words) or {text}
+    return frozenset(zlib.crc32(g.encode("utf-8")) for g in grams)
+
+
+@lru_cache(maxsize=8192)
+def minhash_signature(text):
+    """MinHash of a text's word shingles, cached like normalize_text."""
+    hs = word_shingles(text)
+    return tuple(min(map(m.__xor__, hs)) for m in _MASKS)
+
+
+def similarity(sig_a, sig_b):
+    # estimated Jaccard similarity of the two shingle sets
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def is_near(a, b, threshold=DEFAULT_THRESHOLD):
+    """
+    Exact check on two word_shingles() sets. The bar rises with length:
+    for k content words a single swapped word still scores (k-1)/(k+1),
+    0.82 at k=10, so a flat threshold would call long questions that
+    differ in one word the same. The bar is 1 - slack/(k+1), never below
+    threshold, with slack = 5 * (1 - threshold). At the default 0.7 that
+    is 1.5: long texts may differ by one added or dropped word but not a
+    swapped one. Lowering the threshold loosens both parts.
+    """
+    union = len(a | b)
+    if not union:
+        return True
+    slack = 5 * (1 - threshold)
+    return len(a & b) / union >= max(threshold, 1 - slack / (max(len(a), len(b)) + 1))
+
+
+class NearDuplicateIndex:
+    """
+    LSH over MinHash signatures, keyed by normalized text.
+
+    find() only compares against texts that share at least one band with
+    the query, then confirms each candidate with is_near() on the word
+    sets, so a lookup stays about the same cost whether the index holds
+    ten items or thousands. Catches rewordings of the same content words
+    ("What's your biggest fear" / "What is the thing you fear most"),
+    not paraphrases that share none.
+
+    Locked: the room mailbox adds and removes while background AI tasks
+    call find().
+    """
+
+    __slots__ = ("threshold", "_sigs", "_words", "_buckets", "_lock")
+
+    def __init__(self, threshold=None):
+        self.threshold = DEFAULT_THRESHOLD if threshold is None else threshold
+        self._sigs = {}      # norm -> signature
+        self._words = {}     # norm -> word shingles
+        self._buckets = {}   # (band, band values) -> set of norms
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bands(sig):
+        return [(i, sig[i * ROWS:(i + 1) * ROWS]) for i in range(BANDS)]
+
+    def add(self, text, norm):
+        if not norm:
+            return
+        sig = minhash_signature(text)
+        words = word_shingles(text)
+        with self._lock:
+            if norm in self._sigs:
+                return
+            self._sigs[norm] = sig
+            self._words[norm] = words
+            for key in self._bands(sig):
+                self._buckets.setdefault(key, set()).add(norm)
+
+    def remove(self, norm):
+        with self._lock:
+            sig = self._sigs.pop(norm, None)
+            if sig is None:
+                return
+            del self._words[norm]
+            for key in self._bands(sig):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(norm)
+                    if not bucket:
+                        del self._buckets[key]
+
+    def find(self, text, norm):
+        """Normalized text of a stored item close enough to this one, or None."""
+        if not norm:
+            return None
+        sig = minhash_signature(text)
+        words = word_shingles(text)
+        with self._lock:
+            if norm in self._sigs:
+                return norm
+            checked = set()
+            for key in self._bands(sig):
+                for other in self._buckets.get(key, ()):
+                    if other in checked:
+                        continue
+                    checked.add(other)
+                    if is_near(words, self._words[other], self.threshold):
+                        return other
+        return None
+
+    def __len__(self):
+        return len(self._sigs)
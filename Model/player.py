@@ -1,13 +1,8 @@
-import re
-import threading
+from Model.truth_dare import normalize_text
 from Model.truth_dare_list import TruthDareList
 from Model.scoring_system import ScoringSystem
 
 
-def _norm_txt(text: str) -> str:
-    return re.sub(r'[^a-z0-9]+', '', text.strip().lower())
-
-
 class Player:
     def __init__(self, socket_id, name):
         self.socket_id = socket_id
@@ -15,7 +10,6 @@ class Player:
         self.truth_dare_list = TruthDareList()
         self.score = 0
         self.submissions_this_round=0
-        self._lock = threading.RLock()
 
         # keep track so AI doesn't repeat stuff
         self.used_truths = []
@@ -23,70 +17,105 @@ class Player:
         self._used_truths_norm = set()
         self._used_dares_norm = set()
 
+        # room-wide content indexes, set while the player is in a room
+        self._truth_index = None
+        self._dare_index = None
+
     def add_score(self, points):
-        with self._lock:
-            self.score += points
+        self.score += points
 
     def reset_round_submissions(self):
-        with self._lock:
-            self.submissions_this_round = 0
+        self.submissions_this_round = 0
 
     def increment_submissions(self):
-        with self._lock:
-            self.submissions_this_round += 1
+        self.submissions_this_round += 1
 
     def can_submit_more(self):
-        with self._lock:
-            return self.submissions_this_round < ScoringSystem.MAX_SUBMISSIONS_PER_ROUND
+        return self.submissions_this_round < ScoringSystem.MAX_SUBMISSIONS_PER_ROUND
 
     def try_submit(self):
-        # check+increase in one go so it's safe with threads
-        with self._lock:
-            if self.submissions_this_round < ScoringSystem.MAX_SUBMISSIONS_PER_ROUND:
-                self.submissions_this_round += 1
-                return True
-            return False
-
-    def mark_truth_used(self, txt):
-        with self._lock:
-            if not txt: return
-            n = _norm_txt(txt)
-            if n not in self._used_truths_norm:
-                self.used_truths.append(txt)
-                self._used_truths_norm.add(n)
-
-    def mark_dare_used(self, txt):
-        with self._lock:
-            if not txt:
-                return
-            n = _norm_txt(txt)
-            if n not in self._used_dares_norm:
-                self.used_dares.append(txt)
-                self._used_dares_norm.add(n)
+        # check+increase in one go (runs inside the room mailbox, so no lock needed)
+        if self.submissions_this_round < ScoringSystem.MAX_SUBMISSIONS_PER_ROUND:
+            self.submissions_this_round += 1
+            return True
+        return False
+
+    def attach_index(self, truth_index, dare_index):
+        # everything this player has used or has queued counts as in the room
+        self.detach_index()
+        self._truth_index, self._dare_index = truth_index, dare_index
+        for n in self._used_truths_norm:
+            truth_index.add(None, n)
+        for n in self._used_dares_norm:
+            dare_index.add(None, n)
+        self.truth_dare_list.set_room_index(truth_index, dare_index)
+
+    def detach_index(self):
+        self._unindex_used()
+        self._truth_index = self._dare_index = None
+        self.truth_dare_list.set_room_index(None, None)
+
+    def _unindex_used(self):
+        if self._truth_index is not None:
+            for n in self._used_truths_norm:
+                self._truth_index.discard(None, n)
+            for n in self._used_dares_norm:
+                self._dare_index.discard(None, n)
+
+    def mark_truth_used(self, txt, norm=None):
+        # norm: pass item.norm when you have the item, saves re-normalizing
+        if not txt: return
+        n = norm or normalize_text(txt)
+        if n not in self._used_truths_norm:
+            self.used_truths.append(txt)
+            self._used_truths_norm.add(n)
+            if self._truth_index is not None:
+                self._truth_index.add(txt, n)
+
+    def mark_dare_used(self, txt, norm=None):
+        if not txt:
+            return
+        n = norm or normalize_text(txt)
+        if n not in self._used_dares_norm:
+            self.used_dares.append(txt)
+            self._used_dares_norm.add(n)
+            if self._dare_index is not None:
+                self._dare_index.add(txt, n)
+
+    def reset_used(self):
+        self._unindex_used()
+        self.used_truths = []
+        self.used_dares = []
+        self._used_truths_norm = set()
+        self._used_dares_norm = set()
 
     def has_used_truth(self, txt):
-        with self._lock:
-            return _norm_txt(txt) in self._used_truths_norm
+        return normalize_text(txt) in self._used_truths_norm
 
     def has_used_dare(self, txt):
-        with self._lock:
-            return _norm_txt(txt) in self._used_dares_norm
+        return normalize_text(txt) in self._used_dares_norm
+
+    def knows_truth(self, txt, norm=None):
+        # used, queued, or one of their defaults
+        n = norm or normalize_text(txt)
+        return n in self._used_truths_norm or self.truth_dare_list.has_truth(txt, n)
+
+    def knows_dare(self, txt, norm=None):
+        n = norm or normalize_text(txt)
+        return n in self._used_dares_norm or self.truth_dare_list.has_dare(txt, n)
 
     def get_all_used_truths(self):
-        with self._lock:
-            return self.used_truths.copy()
+        return self.used_truths.copy()
 
     def get_all_used_dares(self):
-        with self._lock:
-            return self.used_dares.copy()
+        return self.used_dares.copy()
 
     def to_dict(self):
-        with self._lock:
-            return {
-                "sid": self.socket_id,
-                "name": self.name,
-                "score": self.score,
-            }
+        return {
+            "sid": self.socket_id,
+            "name": self.name,
+            "score": self.score,
+        }
 
     @staticmethod
     def from_dict(data):
@@ -0,0 +1,56 @@
+import itertools
+import random
+from collections import deque
+
+from Model.near_duplicate import is_near, word_shingles
+
+CONTEXT_SIZE = 30          # items the AI gets as "don't repeat these"
+CONTEXT_SIMILARITY = 0.8   # closer than this to an item already in the window -> left out
+
+
+class PromptWindow:
+    """
+    The last few distinct texts that entered a room, newest first, as the
+    "existing items" part of an AI prompt.
+
+    add() only records the text, so content arriving under the room lock
+    stays cheap; seed() sets a sample of the room's defaults that fills in
+    behind whatever was added. Near copies only cost tokens; items() drops
+    them when a prompt is actually built, then hands back the same tuple
+    until something changes, which lets AIGenerator reuse the rendered list.
+    """
+
+    __slots__ = ("size", "_items", "_seeded", "_snapshot")
+
+    def __init__(self, size=CONTEXT_SIZE):
+        self.size = size
+        # newest on the left, with room to spare for near copies items() skips
+        self._items = deque(maxlen=2 * size)
+        self._seeded = ()
+        self._snapshot = ()
+
+    def add(self, text):
+        self._items.appendleft(text)
+        self._snapshot = None
+
+    def seed(self, texts):
+        # texts: a list (defaults), replaces the previous seed
+        self._seeded = tuple(random.sample(texts, min(self.size, len(texts))))
+        self._snapshot = None
+
+    def items(self):
+        if self._snapshot is None:
+            kept, kept_words = [], []
+            for text in itertools.chain(self._items, self._seeded):
+                words = word_shingles(text)
+                if any(is_near(words, w, CONTEXT_SIMILARITY) for w in kept_words):
+                    continue
+                kept.append(text)
+                kept_words.append(words)
+                if len(kept) == self.size:
+                    break
+            self._snapshot = tuple(kept)
+        return self._snapshot
+
+    def __len__(self):
+        return len(self._items)
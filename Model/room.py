@@ -1,13 +1,16 @@
-import json
-import os
-import re
 import threading
 from Model.player import Player
+from Model.truth_dare import normalize_text
+from Model.content_index import ContentIndex
+from Model.prompt_context import CONTEXT_SIZE
+from Model.ai_buffer import AIBuffer
+from Model.ai_usage import AIUsage
+from Model.local_generator import LocalGenerator
 from Model.game_state import GameState
-
-
-def _norm(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", text.strip().lower())
+from Model.default_catalog import get_default_catalog
+from Model.truth_dare_deck import SharedDeck
+from Model.scheduler import get_scheduler
+from Model.room_mailbox import RoomMailbox
 
 
 class Room:
@@ -15,13 +18,23 @@ class Room:
         self.code = code
         self.host_sid = None
         self.players = []
+        self._players_by_sid = {}    # sid -> Player
+        self._players_by_name = {}   # name -> first Player with that name
         self.game_state = GameState()
         self.round_history = []
+        self.phase_timer = None   # pending end-of-phase callback, if any
+        self.mailbox = RoomMailbox()   # every event for this room runs through here, in order
         self._lock = threading.RLock()
 
+        # everything that exists in the room (defaults, AI items, each player's
+        # used + queued items), normalized, kept up to date as things change
+        self.truth_index = ContentIndex(near_duplicates=True, recent=CONTEXT_SIZE)
+        self.dare_index = ContentIndex(near_duplicates=True, recent=CONTEXT_SIZE)
+
         # defaults for this room only
         self.default_truths = []
         self.default_dares = []
+        self._deck = None   # frozen copy of the defaults every player shares
         self._load_defs()
 
         # AI generated stuff for this room
@@ -29,6 +42,11 @@ class Room:
         self.ai_generated_dares = []
         self._ai_truths_norm = set()
         self._ai_dares_norm = set()
+        # made on this machine when the AI was too slow, not credited to the AI
+        self.local_generated = {"truth": [], "dare": []}
+        self._local_gens = {}   # item_type -> (content version, LocalGenerator)
+        self.ai_buffer = AIBuffer()   # generated ahead of need, not shown to anyone yet
+        self.ai_usage = AIUsage()     # calls/tokens this room has cost, checked against the room budget
 
         # basic game config, can be tweaked from UI
         self.settings = {
@@ -43,22 +61,32 @@ class Room:
         }
 
     def _load_defs(self):
-        #load from json, fallback if missing
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            parent_dir = os.path.dirname(current_dir)
-            file_path = os.path.join(parent_dir, "default_truths_dares.json")
-            with open(file_path, "r") as f:
-                data = json.load(f)
-            self.default_truths = data.get("truths", [])
-            self.default_dares = data.get("dares", [])
-        except Exception as e:
-            print(f"Warning: Could not load default truths/dares: {e}")
-            self.default_truths = [
-                "What is your biggest fear?",
-                "What is the most embarrassing thing you've ever done?",
-            ]
-            self.default_dares = ["Do 10 pushups", "Sing a song loudly"]
+        # shared parsed catalog, the lists only copy string references
+        cat = get_default_catalog()
+        self.default_truths = list(cat.truth_texts)
+        self.default_dares = list(cat.dare_texts)
+        self._deck = cat.deck
+        self.truth_index.add_many(self.default_truths)
+        self.dare_index.add_many(self.default_dares)
+
+    def get_deck(self):
+        # rebuilt lazily after the host edits defaults, shared until the next edit
+        with self._lock:
+            if self._deck is None:
+                self._deck = SharedDeck.from_texts(self.default_truths, self.default_dares)
+            return self._deck
+
+    def set_defaults(self, truths, dares):
+        with self._lock:
+            for t in self.default_truths:
+                self.truth_index.discard(t)
+            for d in self.default_dares:
+                self.dare_index.discard(d)
+            self.default_truths = list(truths)
+            self.default_dares = list(dares)
+            self.truth_index.add_many(self.default_truths)
+            self.dare_index.add_many(self.default_dares)
+            self._deck = None
 
     def get_default_truths(self):
         with self._lock:
@@ -72,6 +100,8 @@ class Room:
         with self._lock:
             if text and text not in self.default_truths:
                 self.default_truths.append(text)
+                self.truth_index.add(text)
+                self._deck = None
                 return True
             return False
 
@@ -79,6 +109,8 @@ class Room:
         with self._lock:
             if text and text not in self.default_dares:
                 self.default_dares.append(text)
+                self.dare_index.add(text)
+                self._deck = None
                 return True
             return False
 
@@ -88,6 +120,8 @@ class Room:
                 idx = self.default_truths.index(old_text)
                 if new_text and new_text not in self.default_truths:
                     self.default_truths[idx] = new_text
+                    self.truth_index.replace(old_text, new_text)
+                    self._deck = None
                     return True
             except ValueError:
                 pass
@@ -99,6 +133,8 @@ class Room:
                 idx = self.default_dares.index(old_text)
                 if new_text and new_text not in self.default_dares:
                     self.default_dares[idx] = new_text
+                    self.dare_index.replace(old_text, new_text)
+                    self._deck = None
                     return True
             except ValueError:
                 pass
@@ -109,44 +145,99 @@ class Room:
             for t in texts_to_remove:
                 if t in self.default_truths:
                     self.default_truths.remove(t)
+                    self.truth_index.discard(t)
+                    self._deck = None
 
     def remove_default_dares(self, texts_to_remove):
         with self._lock:
             for t in texts_to_remove:
                 if t in self.default_dares:
                     self.default_dares.remove(t)
+                    self.dare_index.discard(t)
+                    self._deck = None
 
     def update_all_players_defaults(self):
         # sync new defaults to everyone already in the room
         with self._lock:
+            deck = self.get_deck()
             for p in self.players:
-                p.truth_dare_list.set_custom_defaults(
-                    self.default_truths.copy(),
-                    self.default_dares.copy()
-                )
+                p.truth_dare_list.use_deck(deck)
 
     def add_ai_generated_truth(self, text):
         with self._lock:
-            n = _norm(text)
+            n = normalize_text(text)
             if n not in self._ai_truths_norm:
                 self._ai_truths_norm.add(n)
                 self.ai_generated_truths.append(text)
+                self.truth_index.add(text, n)
                 return True
             return False
 
     def add_ai_generated_dare(self, text):
         with self._lock:
-            n = _norm(text)
+            n = normalize_text(text)
             if n not in self._ai_dares_norm:
                 self._ai_dares_norm.add(n)
                 self.ai_generated_dares.append(text)
+                self.dare_index.add(text, n)
                 return True
             return False
 
+    def add_local_generated(self, item_type, text):
+        with self._lock:
+            n = normalize_text(text)
+            idx = self.content_index(item_type)
+            if idx.has_norm(n):
+                return False
+            self.local_generated[item_type].append(text)
+            idx.add(text, n)
+            return True
+
+    def local_generator(self, item_type):
+        # Markov chain over the room's distinct texts, rebuilt only once they've changed
+        with self._lock:
+            idx = self.content_index(item_type)
+            cached = self._local_gens.get(item_type)
+            if cached is None or cached[0] != idx.version:
+                cached = (idx.version, LocalGenerator(idx.texts()))
+                self._local_gens[item_type] = cached
+            return cached[1]
+
+    def ai_prefetch_wanted(self, item_type):
+        # how many more items of this kind are worth generating ahead: every
+        # player should have enough left for their share of the remaining rounds
+        with self._lock:
+            gs = self.game_state
+            rounds_left = gs.max_rounds - gs.current_round + 1
+            if rounds_left <= 0 or not self.players:
+                return 0
+            share = -(-rounds_left // len(self.players))   # ceil
+            key = item_type + "s"
+            short = sum(max(0, share - p.truth_dare_list.get_count()[key]) for p in self.players)
+            return min(short, self.ai_buffer.free_slots(item_type))
+
+    def content_index(self, item_type):
+        return self.truth_index if item_type == "truth" else self.dare_index
+
+    def has_content(self, item_type, text, norm=None):
+        # O(1): is this text (normalized) anywhere in the room already
+        idx = self.content_index(item_type)
+        return idx.has_norm(normalize_text(text) if norm is None else norm)
+
+    def ai_context(self, item_type):
+        # newest distinct texts in the room for the AI prompt, kept up to date by the index
+        return self.content_index(item_type).recent()
+
+    def is_near_duplicate(self, item_type, text, norm=None):
+        # has_content, plus rewordings close enough to count as the same item
+        idx = self.content_index(item_type)
+        return idx.find_near(text, norm) is not None
+
     def get_all_used_truths(self):
         with self._lock:
             all_truths = self.default_truths.copy()
             all_truths.extend(self.ai_generated_truths)
+            all_truths.extend(self.local_generated["truth"])
             for p in self.players:
                 all_truths.extend([t.text for t in p.truth_dare_list.truths])
             return all_truths
@@ -155,6 +246,7 @@ class Room:
         with self._lock:
             all_dares = self.default_dares.copy()
             all_dares.extend(self.ai_generated_dares)
+            all_dares.extend(self.local_generated["dare"])
             for p in self.players:
                 all_dares.extend([d.text for d in p.truth_dare_list.dares])
             return all_dares
@@ -170,18 +262,29 @@ class Room:
 
     def add_player(self, player: Player):
         with self._lock:
-            if not any(p.socket_id == player.socket_id for p in self.players):
-                player.truth_dare_list.set_custom_defaults(
-                    self.default_truths.copy(),
-                    self.default_dares.copy()
-                )
+            if player.socket_id not in self._players_by_sid:
+                player.truth_dare_list.use_deck(self.get_deck())
+                player.attach_index(self.truth_index, self.dare_index)
                 self.players.append(player)
+                self._players_by_sid[player.socket_id] = player
+                self._players_by_name.setdefault(player.name, player)
             if self.host_sid is None:
                 self.host_sid = player.socket_id
 
     def remove_player(self, socket_id):
         with self._lock:
-            self.players = [p for p in self.players if p.socket_id != socket_id]
+            gone = self._players_by_sid.pop(socket_id, None)
+            if gone is None:
+                return
+            self.players.remove(gone)
+            gone.detach_index()
+            if self._players_by_name.get(gone.name) is gone:
+                # duplicate names are rare, fall back to the next one in join order
+                nxt = next((p for p in self.players if p.name == gone.name), None)
+                if nxt:
+                    self._players_by_name[gone.name] = nxt
+                else:
+                    del self._players_by_name[gone.name]
             if self.host_sid == socket_id:
                 self.host_sid = self.players[0].socket_id if self.players else None
 
@@ -191,11 +294,11 @@ class Room:
 
     def get_player_by_sid(self, socket_id):
         with self._lock:
-            return next((p for p in self.players if p.socket_id == socket_id), None)
+            return self._players_by_sid.get(socket_id)
 
     def get_player_by_name(self, name):
         with self._lock:
-            return next((p for p in self.players if p.name == name), None)
+            return self._players_by_name.get(name)
 
     def is_empty(self):
         with self._lock:
@@ -205,6 +308,18 @@ class Room:
         with self._lock:
             return self.host_sid == socket_id
 
+    def set_phase_timer(self, timer):
+        # swap in the new deadline callback and drop the old one
+        with self._lock:
+            old, self.phase_timer = self.phase_timer, timer
+        if old is not None and old is not timer:
+            old.cancel()
+
+    def cancel_timers(self):
+        # drop every pending phase callback scheduled for this room
+        self.set_phase_timer(None)
+        get_scheduler().cancel_key(self.code)
+
     def add_round_record(self, record):
         with self._lock:
             self.round_history.append(record)
@@ -221,17 +336,15 @@ class Room:
     def reset_for_new_game(self):
         # basically reset scores + lists but keep room
         with self._lock:
+            deck = self.get_deck()
             for p in self.players:
                 p.score = 0
                 p.submissions_this_round = 0
-                p.used_truths = []
-                p.used_dares = []
-                p.truth_dare_list.set_custom_defaults(
-                    self.default_truths.copy(),
-                    self.default_dares.copy()
-                )
+                p.reset_used()
+                p.truth_dare_list.use_deck(deck)
             self.round_history = []
             self.game_state.reset_for_new_game()
+        self.cancel_timers()
 
     def reset_player_round_submissions(self):
         with self._lock:
@@ -0,0 +1,108 @@
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+def _start_thread(target):
+    t = threading.Thread(target=target, daemon=True)
+    t.start()
+    return t
+
+
+_spawn = _start_thread
+
+
+def set_spawner(spawn):
+    # e.g. socketio.start_background_task, so drains are green threads under eventlet
+    global _spawn
+    _spawn = spawn
+
+
+class _Job:
+    __slots__ = ("fn", "args", "done", "result", "error")
+
+    def __init__(self, fn, args, wait=False):
+        self.fn = fn
+        self.args = args
+        self.done = threading.Event() if wait else None
+        self.result = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.result = self.fn(*self.args)
+        except Exception as e:
+            self.error = e
+            if self.done is None:   # nobody is waiting to see it
+                logger.exception(f"Room job {getattr(self.fn, '__name__', self.fn)} failed: {e}")
+        finally:
+            if self.done is not None:
+                self.done.set()
+
+
+class RoomMailbox:
+    """
+    Runs every event for one room (joins, votes, submissions, timer
+    expiries...) one at a time, in the order they arrived.
+
+    There is no thread per room: whoever finds the mailbox idle drains it,
+    either the caller itself (call) or a background task (post).
+    """
+
+    def __init__(self):
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._running = False
+        self._owner = None   # ident of whoever is draining right now
+
+    def post(self, fn, *args):
+        # fire and forget, fn runs later on a background drain
+        with self._lock:
+            self._queue.append(_Job(fn, args))
+            if self._running:
+                return
+            self._running = True
+        _spawn(self._drain)
+
+    def call(self, fn, *args):
+        # run fn in turn with everything else and hand back its result
+        if self._owner == threading.get_ident():
+            return fn(*args)   # already inside this room's loop
+
+        job = _Job(fn, args, wait=True)
+        with self._lock:
+            self._queue.append(job)
+            drain_here = not self._running
+            self._running = True
+
+        if drain_here:
+            self._drain(until=job)
+        else:
+            job.done.wait()
+
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._queue)
+
+    def _drain(self, until=None):
+        self._owner = threading.get_ident()
+        while True:
+            with self._lock:
+                finished = until is not None and until.done.is_set()
+                if finished or not self._queue:
+                    self._owner = None
+                    if not self._queue:
+                        self._running = False
+                        return
+                    break
+                job = self._queue.popleft()
+            job.run()
+
+        # caller got its answer but more work queued up behind it, hand that off
+        _spawn(self._drain)
@@ -0,0 +1,111 @@
+import threading
+
+
+class _Shard:
+    __slots__ = ("rooms", "lock")
+
+    def __init__(self):
+        self.rooms = {}
+        self.lock = threading.Lock()
+
+
+class RoomRegistry:
+    """
+    code -> Room map split into shards by hash(code), one lock per shard.
+
+    Reads (get / in / []) don't lock at all: a single dict lookup is atomic,
+    and writers only ever swap whole entries. Writes and multi-step
+    check-and-set ops take just their shard's lock, so rooms on different
+    shards never wait on each other. Behaves enough like a dict for the
+    rest of the code (and the tests) to not care.
+    """
+
+    def __init__(self, shard_count=32):
+        self._shards = [_Shard() for _ in range(shard_count)]
+
+    def _shard(self, code):
+        return self._shards[hash(code) % len(self._shards)]
+
+    # --- lock-free reads ---
+
+    def get(self, code, default=None):
+        return self._shard(code).rooms.get(code, default)
+
+    def __getitem__(self, code):
+        return self._shard(code).rooms[code]
+
+    def __contains__(self, code):
+        return code in self._shard(code).rooms
+
+    def __len__(self):
+        return sum(len(s.rooms) for s in self._shards)
+
+    # --- writes, each under its shard lock ---
+
+    def __setitem__(self, code, room):
+        sh = self._shard(code)
+        with sh.lock:
+            sh.rooms[code] = room
+
+    def __delitem__(self, code):
+        sh = self._shard(code)
+        with sh.lock:
+            del sh.rooms[code]
+
+    def pop(self, code, default=None):
+        sh = self._shard(code)
+        with sh.lock:
+            return sh.rooms.pop(code, default)
+
+    def add_new(self, code, room):
+        # insert only if the code is free, False on collision
+        sh = self._shard(code)
+        with sh.lock:
+            if code in sh.rooms:
+                return False
+            sh.rooms[code] = room
+            return True
+
+    def get_or_create(self, code, factory):
+        sh = self._shard(code)
+        room = sh.rooms.get(code)
+        if room is not None:
+            return room
+        with sh.lock:
+            room = sh.rooms.get(code)
+            if room is None:
+                room = sh.rooms[code] = factory(code)
+            return room
+
+    def pop_if(self, code, check):
+        # remove code only while check(room) holds, returns the removed room
+        sh = self._shard(code)
+        with sh.lock:
+            room = sh.rooms.get(code)
+            if room is None or not check(room):
+                return None
+            del sh.rooms[code]
+            return room
+
+    def clear(self):
+        for sh in self._shards:
+            with sh.lock:
+                sh.rooms.clear()
+
+    # --- iteration works on per-shard snapshots, never holds more than one lock ---
+
+    def items(self):
+        out = []
+        for sh in self._shards:
+            with sh.lock:
+                out.extend(sh.rooms.items())
+        return out
+
+    def keys(self):
+        return [code for code, _ in self.items()]
+
+    def values(self):
+        return [room for _, room in self.items()]
+
+    def __iter__(self):
+        return iter(self.keys())
@@ -0,0 +1,163 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledTimer:
+    # handle returned by call_later, mostly so callers can cancel it
+    __slots__ = ("when", "fn", "args", "key", "cancelled", "fired", "_scheduler")
+
+    def __init__(self, scheduler, when, fn, args, key=None):
+        self._scheduler = scheduler
+        self.when = when
+        self.fn = fn
+        self.args = args
+        self.key = key      # usually the room code, lets cancel_key drop a whole room
+        self.cancelled = False
+        self.fired = False
+
+    def cancel(self):
+        return self._scheduler.cancel(self)
+
+    def remaining(self):
+        return max(0.0, self.when - time.monotonic())
+
+
+class TimerScheduler:
+    """
+    One heap of deadlines for every room, served by a single worker thread.
+
+    Callbacks run on the worker itself, so they should be quick; anything
+    that may block (network calls etc) has to hand itself off.
+    """
+
+    def __init__(self, spawn=None):
+        self._spawn = spawn or _start_thread   # how the worker gets started
+        self._heap = []
+        self._seq = itertools.count()   # tie breaker so equal deadlines stay FIFO
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._by_key = {}   # key -> set of live timers
+        self._worker = None
+
+    def call_later(self, delay, fn, *args, key=None):
+        t = ScheduledTimer(self, time.monotonic() + max(0.0, delay), fn, args, key)
+        with self._cond:
+            heapq.heappush(self._heap, (t.when, next(self._seq), t))
+            self._pending += 1
+            if key is not None:
+                self._by_key.setdefault(key, set()).add(t)
+            self._ensure_worker()
+            # only need to wake the worker if this is the new earliest deadline
+            if self._heap[0][2] is t:
+                self._cond.notify()
+        return t
+
+    def cancel(self, timer):
+        with self._cond:
+            if timer is None or timer.cancelled or timer.fired:
+                return False
+            timer.cancelled = True
+            self._pending -= 1
+            self._forget(timer)
+            self._maybe_compact()
+            return True
+
+    def cancel_key(self, key):
+        # drop every pending timer for one key right away, returns how many
+        with self._cond:
+            timers = self._by_key.pop(key, None)
+            if not timers:
+                return 0
+            for t in timers:
+                t.cancelled = True
+            self._pending -= len(timers)
+            self._maybe_compact()
+            return len(timers)
+
+    def pending_count(self, key=None):
+        with self._cond:
+            if key is not None:
+                return len(self._by_key.get(key, ()))
+            return self._pending
+
+    def _forget(self, timer):
+        if timer.key is None:
+            return
+        timers = self._by_key.get(timer.key)
+        if timers is not None:
+            timers.discard(timer)
+            if not timers:
+                del self._by_key[timer.key]
+
+    def _maybe_compact(self):
+        # cancelled entries are skipped lazily, compact once they dominate
+        if len(self._heap) > 64 and self._pending < len(self._heap) // 2:
+            self._compact()
+
+    def _compact(self):
+        self._heap = [e for e in self._heap if not e[2].cancelled]
+        heapq.heapify(self._heap)
+
+    def set_spawner(self, spawn):
+        # e.g. socketio.start_background_task so the worker is a green thread
+        # under eventlet; has to happen before the first timer is scheduled
+        with self._cond:
+            self._spawn = spawn
+
+    def _ensure_worker(self):
+        # worker never returns, so starting it once is enough
+        if self._worker is None:
+            self._worker = self._spawn(self._run)
+
+    def _next_due(self):
+        with self._cond:
+            while True:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+
+                when = self._heap[0][0]
+                now = time.monotonic()
+                if when <= now:
+                    t = heapq.heappop(self._heap)[2]
+                    t.fired = True
+                    self._pending -= 1
+                    self._forget(t)
+                    return t
+
+                self._cond.wait(when - now)
+
+    def _run(self):
+        while True:
+            t = self._next_due()
+            try:
+                t.fn(*t.args)
+            except Exception as e:
+                logger.exception(f"Timer callback {getattr(t.fn, '__name__', t.fn)} failed: {e}")
+
+
+def _start_thread(target):
+    t = threading.Thread(target=target, name="timer-scheduler", daemon=True)
+    t.start()
+    return t
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = TimerScheduler()
+    return _scheduler
@@ -1,9 +1,26 @@
+import re
+from functools import cached_property, lru_cache
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=8192)
+def normalize_text(text: str) -> str:
+    # the one normalizer for duplicate checks, the same texts come by over and over
+    return _NON_ALNUM.sub("", text.strip().lower())
+
+
 class TruthDare:
     def __init__(self, text, is_default=False, submitted_by=None):
         self.text = text
         self.is_default = is_default
         self.submitted_by = submitted_by   # who added it (None = default)
 
+    @cached_property
+    def norm(self):
+        # normalized text for duplicate checks, worked out once per item
+        return normalize_text(self.text)
+
     def to_dict(self):
         return {
             "text": self.text,
@@ -0,0 +1,34 @@
+from Model.content_index import ContentIndex
+
+
+class SharedDeck:
+    """
+    A room's default truths and dares, frozen. Every player in the room
+    points at the same deck, so defaults cost memory once per room; editing
+    the defaults builds a new deck (copy-on-write) instead of touching this one.
+    """
+
+    def __init__(self, truths=(), dares=()):
+        self.truths = tuple(truths)
+        self.dares = tuple(dares)
+        self.truth_slots = self._slots(self.truths)   # text -> deck positions
+        self.dare_slots = self._slots(self.dares)
+        self.truth_norms = ContentIndex(t.text for t in self.truths)
+        self.dare_norms = ContentIndex(d.text for d in self.dares)
+
+    @staticmethod
+    def _slots(items):
+        slots = {}
+        for i, item in enumerate(items):
+            slots.setdefault(item.text, []).append(i)
+        return {text: tuple(pos) for text, pos in slots.items()}
+
+    @classmethod
+    def from_texts(cls, truth_texts, dare_texts):
+        # catalog texts reuse the catalog's shared objects
+        from Model.default_catalog import get_default_catalog
+        cat = get_default_catalog()
+        return cls(
+            (cat.default_truth(t) for t in truth_texts),
+            (cat.default_dare(d) for d in dare_texts),
+        )
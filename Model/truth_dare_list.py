@@ -1,61 +1,192 @@
-import json
-import os
-from Model.truth_dare import Truth, Dare
+import random
+
+from Model.truth_dare import Truth, Dare, normalize_text
+from Model.truth_dare_deck import SharedDeck
+from Model.content_index import ContentIndex
+from Model.default_catalog import get_default_catalog
+
+
+class _Pile:
+    """
+    One player's view of one kind (truths or dares): the shared deck plus
+    this player's own submissions, minus whatever they already drew/removed.
+
+    Every item has a slot (deck position, then own items after the deck).
+    Slots sit in a virtual array whose first `live` entries are still up for
+    grabs, so draw and remove are a swap with the last live entry: O(1).
+    The array starts out as the identity and only swapped positions are
+    stored, so an untouched player costs nothing per deck item.
+    """
+
+    __slots__ = ("deck_items", "deck_slots", "own", "own_slots", "own_norms", "room_index",
+                 "live", "_at", "_where")
+
+    def __init__(self, deck_items, deck_slots, room_index=None):
+        self.deck_items = deck_items
+        self.deck_slots = deck_slots   # text -> deck slots, shared with the room
+        self.own = []                  # submitted/AI items, only this player has them
+        self.own_slots = {}            # text -> own slots, all of them still live
+        self.own_norms = ContentIndex()   # normalized own items still queued
+        self.room_index = room_index   # room-wide index, queued own items count as in the room
+        self.live = len(deck_items)
+        self._at = {}      # position -> slot, where it differs from identity
+        self._where = {}   # slot -> position, same deal
+
+    def _slot_at(self, i):
+        return self._at.get(i, i)
+
+    def _pos_of(self, slot):
+        return self._where.get(slot, slot)
+
+    def _put(self, i, slot):
+        # keep the override dicts sparse, identity entries are implied
+        if i == slot:
+            self._at.pop(i, None)
+            self._where.pop(slot, None)
+        else:
+            self._at[i] = slot
+            self._where[slot] = i
+
+    def _swap(self, i, j):
+        if i != j:
+            a, b = self._slot_at(i), self._slot_at(j)
+            self._put(i, b)
+            self._put(j, a)
+
+    def _item(self, slot):
+        d = len(self.deck_items)
+        return self.deck_items[slot] if slot < d else self.own[slot - d]
+
+    def _kill(self, slot):
+        i = self._pos_of(slot)
+        if i >= self.live:
+            return False
+        self.live -= 1
+        self._swap(i, self.live)
+        return True
+
+    def items(self):
+        # insertion order (deck first, then own items), only the live ones
+        total = len(self.deck_items) + len(self.own)
+        if self.live == total:
+            return list(self.deck_items) + self.own
+        live = self.live
+        return [self._item(s) for s in range(total) if self._pos_of(s) < live]
+
+    def add(self, item):
+        slot = len(self.deck_items) + len(self.own)
+        self.own.append(item)
+        self.own_slots.setdefault(item.text, []).append(slot)
+        # new slot lands right after the live region, every live item stays
+        # equally likely to be drawn next
+        self._swap(self._pos_of(slot), self.live)
+        self.live += 1
+        self.own_norms.add(item.text, item.norm)
+        if self.room_index is not None:
+            self.room_index.add(item.text, item.norm)
+
+    def draw(self):
+        if self.live == 0:
+            return None
+        item = self._item(self._slot_at(random.randrange(self.live)))
+        # same as before: drawing a text takes every copy of it off the list
+        self.remove_text(item.text)
+        return item
+
+    def remove_text(self, text):
+        removed = 0
+        for slot in self.deck_slots.get(text, ()):
+            removed += self._kill(slot)
+        d = len(self.deck_items)
+        for slot in self.own_slots.pop(text, ()):
+            removed += self._kill(slot)
+            item = self.own[slot - d]
+            self.own_norms.discard(item.text, item.norm)
+            if self.room_index is not None:
+                self.room_index.discard(item.text, item.norm)
+        return removed
+
+    def queued_own(self):
+        d = len(self.deck_items)
+        return [self.own[s - d] for slots in self.own_slots.values() for s in slots]
+
+    def set_room_index(self, index):
+        # move this pile's queued own items from the old room index to the new one
+        if index is self.room_index:
+            return
+        queued = self.queued_own()
+        if self.room_index is not None:
+            for item in queued:
+                self.room_index.discard(item.text, item.norm)
+        self.room_index = index
+        if index is not None:
+            for item in queued:
+                index.add(item.text, item.norm)
+
+    def __len__(self):
+        return self.live
 
 
 class TruthDareList:
-    def __init__(self):
-        self.truths = []
-        self.dares = []
-        self._load_defs()
-
-    def _load_defs(self):
-        # load from json file, warn if missing 
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            parent_dir = os.path.dirname(current_dir)
-            file_path = os.path.join(parent_dir, "default_truths_dares.json")
-
-            with open(file_path, "r") as f:
-                data = json.load(f)
-
-            for txt in data.get("truths", []):
-                self.truths.append(Truth(txt, is_default=True, submitted_by=None))
-
-            for txt in data.get("dares", []):
-                self.dares.append(Dare(txt, is_default=True, submitted_by=None))
-        except Exception as e:
-            print(f"Warning: Could not load default truths/dares: {e}")
+    def __init__(self, deck=None):
+        # defaults come from a shared deck (the catalog's unless a room hands one over)
+        self._truths = self._dares = None
+        self.use_deck(deck or get_default_catalog().deck)
+
+    def use_deck(self, deck):
+        # start over on a shared deck: nothing consumed, no own items
+        t_idx = d_idx = None
+        if self._truths is not None:
+            t_idx, d_idx = self._truths.room_index, self._dares.room_index
+            self.set_room_index(None, None)   # own items are gone, take them out of the room index
+        self._deck = deck
+        self._truths = _Pile(deck.truths, deck.truth_slots, t_idx)
+        self._dares = _Pile(deck.dares, deck.dare_slots, d_idx)
+
+    def set_room_index(self, truth_index, dare_index):
+        self._truths.set_room_index(truth_index)
+        self._dares.set_room_index(dare_index)
 
     def set_custom_defaults(self, def_truths, def_dares):
-        self.truths = []
-        self.dares = []
+        self.use_deck(SharedDeck.from_texts(def_truths, def_dares))
 
-        for txt in def_truths:
-            self.truths.append(Truth(txt, is_default=True, submitted_by=None))
+    @property
+    def truths(self):
+        return self._truths.items()
 
-        for txt in def_dares:
-            self.dares.append(Dare(txt, is_default=True, submitted_by=None))
+    @property
+    def dares(self):
+        return self._dares.items()
 
     def add_truth(self, text, submitted_by=None):
-        self.truths.append(Truth(text, is_default=False, submitted_by=submitted_by))
+        self._truths.add(Truth(text, is_default=False, submitted_by=submitted_by))
 
     def add_dare(self, text, submitted_by=None):
-        self.dares.append(Dare(text, is_default=False, submitted_by=submitted_by))
+        self._dares.add(Dare(text, is_default=False, submitted_by=submitted_by))
 
     def remove_truth_by_text(self, text):
-        before = len(self.truths)
-        self.truths = [t for t in self.truths if t.text != text]
-        after = len(self.truths)
-        if before != after:
-            print(f"[DEBUG] Removed truth: '{text}' -> Remaining: {after}")
+        if self._truths.remove_text(text):
+            print(f"[DEBUG] Removed truth: '{text}' -> Remaining: {len(self._truths)}")
 
     def remove_dare_by_text(self, text):
-        before = len(self.dares)
-        self.dares = [d for d in self.dares if d.text != text]
-        after = len(self.dares)
-        if before != after:
-            print(f"[DEBUG] Removed dare: '{text}' -> Remaining: {after}")
+        if self._dares.remove_text(text):
+            print(f"[DEBUG] Removed dare: '{text}' -> Remaining: {len(self._dares)}")
+
+    def has_truth(self, text, norm=None):
+        # in this player's defaults or queued for them (drawn or not, for defaults)
+        n = norm or normalize_text(text)
+        return self._deck.truth_norms.has_norm(n) or self._truths.own_norms.has_norm(n)
+
+    def has_dare(self, text, norm=None):
+        n = norm or normalize_text(text)
+        return self._deck.dare_norms.has_norm(n) or self._dares.own_norms.has_norm(n)
+
+    def draw_truth(self):
+        # random remaining truth, taken off the list; None when empty
+        return self._truths.draw()
+
+    def draw_dare(self):
+        return self._dares.draw()
 
     def get_truths(self):
         return [t.to_dict() for t in self.truths]
@@ -64,4 +195,4 @@ class TruthDareList:
         return [d.to_dict() for d in self.dares]
 
     def get_count(self):
-        return {"truths": len(self.truths), "dares": len(self.dares)}
+        return {"truths": len(self._truths), "dares": len(self._dares)}
@@ -1,5 +1,7 @@
 # tests/ai/test_ai_mocked_significant.py
 
+import threading
+
 import pytest
 from Model.ai_generator import AIGenerator
 from Model.truth_dare_list import TruthDareList
@@ -101,3 +103,98 @@ def test_ai_activates_when_player_list_empty(mock_ai_generator):
 
     assert isinstance(generated, str)
     assert generated == "AI Generated Truth"
+
+
+# ======================================================
+# T-AI-007 — Significant AI Test (Mocked)
+# Phase starts right away with a placeholder, the clock
+# only starts once the AI item lands
+# ======================================================
+def test_ai_generation_runs_in_background(mock_ai_generator, game_manager, monkeypatch):
+    import time
+    from Controller.socket_events import helpers
+
+    release = threading.Event()
+    generate_truth = mock_ai_generator.generate_truth
+
+    def held_truth(existing):
+        # hold the call so the placeholder can be checked before the item lands
+        release.wait(5)
+        return generate_truth(existing)
+
+    monkeypatch.setattr(mock_ai_generator, "generate_truth", held_truth)
+    monkeypatch.setattr(helpers, "get_ai_generator", lambda: mock_ai_generator)
+
+    code = game_manager.create_room()
+    room = game_manager.add_player_to_room(code, "s1", "Alice")
+    game_manager.add_player_to_room(code, "s2", "Bob")
+    room.set_defaults([], [])
+    room.update_all_players_defaults()
+    room.game_state.set_selected_player("Alice")
+    room.game_state.set_selected_choice("truth")
+
+    room.mailbox.call(helpers.start_truth_dare_phase_handler, code)
+
+    gs = room.game_state
+    assert gs.phase == gs.PHASE_TRUTH_DARE
+    assert gs.generating and gs.phase_end_time is None
+    assert gs.current_truth_dare["generating"]
+
+    release.set()
+    deadline = time.time() + 5
+    while gs.generating and time.time() < deadline:
+        time.sleep(0.05)
+
+    assert gs.current_truth_dare["text"] == "AI Generated Truth"
+    assert gs.get_seconds_until_deadline() > room.settings["truth_dare_duration"] - 2
+    game_manager.delete_room(code)
+
+
+# ======================================================
+# T-AI-008 — Significant AI Test (Mocked)
+# AI slower than its budget: a local item is served right
+# away, the late AI item goes to the room's buffer
+# ======================================================
+def test_ai_over_budget_falls_back_to_local(mock_ai_generator, game_manager, monkeypatch):
+    import time
+    from Controller.socket_events import helpers
+
+    release = threading.Event()
+
+    def slow_truth(existing):
+        release.wait(5)
+        return "Slow AI Truth"
+
+    monkeypatch.setattr(mock_ai_generator, "generate_truth", slow_truth)
+    monkeypatch.setattr(helpers, "get_ai_generator", lambda: mock_ai_generator)
+    monkeypatch.setattr(helpers, "_cached_ai_items", lambda room, kind, n: [])
+    monkeypatch.setattr(helpers, "_AI_BUDGET_MIN", 0.2)
+    monkeypatch.setattr(helpers, "_AI_BUDGET_MAX", 0.2)
+
+    code = game_manager.create_room()
+    room = game_manager.add_player_to_room(code, "s1", "Alice")
+    game_manager.add_player_to_room(code, "s2", "Bob")
+    room.set_defaults([], [])
+    room.update_all_players_defaults()
+    room.game_state.set_selected_player("Alice")
+    room.game_state.set_selected_choice("truth")
+
+    room.mailbox.call(helpers.start_truth_dare_phase_handler, code)
+    gs = room.game_state
+
+    deadline = time.time() + 3
+    while gs.generating and time.time() < deadline:
+        time.sleep(0.05)
+
+    assert not gs.generating
+    assert gs.current_truth_dare["text"] != "Slow AI Truth"
+    assert gs.current_truth_dare["submitted_by"] == helpers._LOCAL_SOURCE
+    assert room.ai_generated_truths == []
+    assert not gs.current_truth_dare.get("generating")
+
+    release.set()
+    deadline = time.time() + 3
+    while not room.ai_buffer.pop("truth") and time.time() < deadline:
+        time.sleep(0.05)
+    assert time.time() < deadline
+    game_manager.delete_room(code)
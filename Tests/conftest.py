@@ -1,6 +1,12 @@
 # tests/conftest.py
+import os
 import pytest
 
+# plain threads for tests, must be set before app is imported
+os.environ.setdefault("ASYNC_MODE", "threading")
+# AI cache in memory, so tests don't share items through a file
+os.environ.setdefault("AI_CACHE_PATH", ":memory:")
+
 from app import app, socketio, game_manager as global_game_manager
 from Model.room import Room
 from Model.player import Player
@@ -0,0 +1,54 @@
+from Model.ai_buffer import AIBuffer
+from Model.room import Room
+from Model.player import Player
+
+
+# T-061 — US-013: Buffer is bounded per kind and counts in-flight items
+def test_ai_buffer_bounds():
+    buf = AIBuffer(capacity=2)
+    assert buf.push("truth", "T1")
+    buf.in_flight["truth"] = 1
+    assert buf.free_slots("truth") == 0
+    assert buf.push("truth", "T2")
+    assert not buf.push("truth", "T3")
+    assert buf.free_slots("dare") == 2
+
+    assert buf.pop("truth") == "T1"
+    assert buf.pop("dare") is None
+
+
+# T-062 — US-013: Prefetch asks for what players are short for the rounds left
+def test_room_prefetch_wanted():
+    room = Room("PRE01")
+    room.set_defaults(["T1?"], [])
+    room.update_all_players_defaults()
+    room.add_player(Player("s1", "Alice"))
+    room.add_player(Player("s2", "Bob"))
+    room.game_state.max_rounds = 4
+    room.game_state.current_round = 1
+
+    # 4 rounds left over 2 players -> 2 each; 1 truth each, no dares
+    assert room.ai_prefetch_wanted("truth") == 2
+    assert room.ai_prefetch_wanted("dare") == room.ai_buffer.capacity
+
+    room.game_state.current_round = 5
+    assert room.ai_prefetch_wanted("truth") == 0
+
+
+# T-085 — US-013: Buffered items the current player already knows stay buffered
+def test_serve_buffered_keeps_known_items():
+    from Controller.socket_events import helpers
+
+    room = Room("PRE02")
+    alice = Player("s1", "Alice")
+    room.add_player(alice)
+    alice.mark_truth_used("Seen one?")
+    alice.mark_truth_used("Seen two?")
+    for text in ("Seen one?", "Seen two?", "Fresh one?"):
+        room.ai_buffer.push("truth", text)
+
+    assert helpers._serve_buffered_ai_item(room, alice, "truth")
+    assert room.game_state.current_truth_dare["text"] == "Fresh one?"
+    assert room.ai_buffer.pop("truth") == "Seen one?"
+    assert room.ai_buffer.pop("truth") == "Seen two?"
+    assert room.ai_buffer.pop("truth") is None
@@ -0,0 +1,42 @@
+from Model.ai_cache import AIItemCache
+
+
+# T-067 — US-017: Cache keeps one copy per normalized text and survives a reopen
+def test_ai_cache_dedupes_and_persists(tmp_path):
+    path = str(tmp_path / "ai.sqlite3")
+    cache = AIItemCache(path)
+
+    assert cache.add("truth", "What is your dream job?")
+    assert cache.add("truth", "what is your DREAM job") is False
+    assert cache.add("dare", "Do a silly dance")
+    assert cache.count("truth") == 1
+    cache.close()
+
+    reopened = AIItemCache(path)
+    assert reopened.count() == 2
+    assert reopened.pick("dare", 5) == ["Do a silly dance"]
+
+
+# T-068 — US-017: pick skips what the room already has
+def test_ai_cache_pick_excludes_known_items():
+    cache = AIItemCache(":memory:")
+    for t in ("Truth one?", "Truth two?", "Truth three?"):
+        cache.add("truth", t)
+
+    known = {"truthone", "truththree"}
+    assert cache.pick("truth", 3, exclude=lambda text, norm: norm in known) == ["Truth two?"]
+    assert len(cache.pick("truth", 2)) == 2
+    assert cache.pick("dare", 1) == []
+
+
+# T-089 — US-017: Cache stays under its cap by dropping the oldest items
+def test_ai_cache_evicts_oldest():
+    clock = iter(range(100))
+    cache = AIItemCache(":memory:", max_items=3, clock=lambda: next(clock))
+    for i in range(5):
+        cache.add("truth", f"Truth number {i}?")
+    cache.add("dare", "Do a silly dance")
+
+    assert cache.count("truth") == 3 and cache.count("dare") == 1
+    assert set(cache.pick("truth", 5)) == {"Truth number 2?", "Truth number 3?", "Truth number 4?"}
+    assert cache.recent("truth", 1) == ["Truth number 4?"]
@@ -0,0 +1,18 @@
+from Model.ai_content_pool import SharedAIContent
+from Model.room import Room
+
+
+# T-070 — US-018: Shared pool dedupes, evicts oldest, and skips what a room has taken
+def test_shared_pool_pick_skips_room_items():
+    pool = SharedAIContent(capacity=3)
+    for t in ("One truth?", "one TRUTH", "Two truth?", "Three truth?", "Four truth?"):
+        pool.add("truth", t)
+    assert len(pool) == 3   # "One truth?" evicted, duplicate ignored
+
+    room = Room("ROOM1")
+    room.add_ai_generated_truth("Two truth?")
+    room.add_ai_generated_truth("Three truth?")
+
+    picks = pool.pick("truth", 3, exclude=lambda text, norm: room.has_content("truth", text, norm))
+    assert picks == ["Four truth?"]
+    assert pool.pick("dare", 1) == []
@@ -19,3 +19,54 @@ def test_ai_generation_mock_fixture(mock_ai_generator):
 
     assert truth == "AI Generated Truth"
     assert dare == "AI Generated Dare"
+
+
+# T-015c — US-018: Batch generation parses one JSON reply and drops duplicates/junk
+def test_generate_mixed_batch(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "fake-key")
+    ai = AIGenerator()
+
+    class _Resp:
+        text = '```json\n{"truths": ["What is your dream job", "what is your DREAM job?", "Hi", "Old one?"],' \
+               ' "dares": ["Do a silly dance", "Sing the alphabet backwards"]}\n```'
+
+    calls = []
+
+    class _Models:
+        def generate_content(self, **kw):
+            calls.append(kw)
+            return _Resp()
+
+    monkeypatch.setattr(ai, "client", type("C", (), {"models": _Models()})())
+
+    out = ai.generate_mixed(3, 1, ["Old one?"], [])
+
+    assert len(calls) == 1
+    assert out["truths"] == ["What is your dream job?"]
+    assert out["dares"] == ["Do a silly dance"]
+    assert ai.generate_dares(5, ["do a SILLY dance"]) == ["Sing the alphabet backwards"]
+
+
+# T-015d — US-018: API failures trip the breaker, then calls fail fast without hitting the API
+def test_generator_breaker_fails_fast(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "fake-key")
+    monkeypatch.setenv("AI_BREAKER_FAILURES", "2")
+    ai = AIGenerator()
+
+    calls = []
+
+    class _Models:
+        def generate_content(self, **kw):
+            calls.append(kw)
+            raise RuntimeError("429 quota exceeded")
+
+    monkeypatch.setattr(ai, "client", type("C", (), {"models": _Models()})())
+
+    assert ai.generate_truth([]) is None
+    assert ai.generate_dare([]) is None
+    assert ai.accepting_requests() is False
+    assert ai.generate_truth([]) is None
+    assert ai.generate_mixed(2, 2, [], []) == {"truths": [], "dares": []}
+
+    assert len(calls) == 2
+    assert ai.get_status()["circuit_breaker"]["state"] == "open"
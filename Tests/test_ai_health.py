@@ -0,0 +1,72 @@
+from Model.ai_health import AIHealth, AIHealthProber
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+# T-077 — US-022: Snapshot reports latency percentiles, success rate and the last error
+def test_ai_health_snapshot():
+    health = AIHealth(window=10)
+    for ms in (100, 200, 300, 400):
+        health.record(ms / 1000, True)
+    health.record(5.0, False, RuntimeError("503"))
+
+    snap = health.snapshot()
+    assert snap["calls"] == 5
+    assert snap["success_rate"] == 0.8
+    assert snap["latency_ms"]["p50"] in (200, 300)
+    assert snap["latency_ms"]["p99"] == 400
+    assert snap["last_error"] == "503"
+
+
+# T-078 — US-022: Prober only makes a test call when traffic is quiet or it's poked
+def test_ai_health_prober_skips_while_traffic_is_fresh():
+    clock = _Clock()
+
+    class _Gen:
+        enabled = True
+        health = AIHealth(clock=clock)
+        probes = 0
+
+        def test_generation(self):
+            self.probes += 1
+            return {"success": True, "sample_output": "Hi?"}
+
+    gen = _Gen()
+    prober = AIHealthProber(gen, interval=60, clock=clock)
+
+    assert prober.probe_once()["success"]      # nothing recorded yet
+    gen.health.record(0.1, True)
+    clock.now += 30
+    assert prober.probe_once() is None         # real call 30s ago is fresh enough
+    assert prober.probe_once(forced=True)
+    assert gen.probes == 2
+    assert gen.health.snapshot()["last_probe"]["sample_output"] == "Hi?"
+
+
+# T-086 — US-022: Probes skip the rate limiter and aren't charged to AI usage
+def test_ai_probe_not_rate_limited_or_charged(monkeypatch):
+    from Model import ai_usage
+    from Model.ai_generator import AIGenerator
+    from Model.ai_usage import AIUsage
+    from Model.fake_gemini import FakeGeminiClient
+
+    monkeypatch.setenv("GEMINI_API_KEY", "fake-key")
+    ai = AIGenerator()
+    monkeypatch.setattr(ai, "client", FakeGeminiClient(seed=3))
+    tokens = ai.bucket.available()
+    calls = ai_usage.process_usage.calls
+
+    room_usage = AIUsage()
+    with ai_usage.usage_scope(room_usage):
+        assert ai.test_generation()["success"]
+
+    assert ai.bucket.available() >= tokens
+    assert ai_usage.process_usage.calls == calls
+    assert room_usage.calls == 0
+    assert ai.health.snapshot()["calls"] == 1
@@ -0,0 +1,57 @@
+import threading
+import time
+
+import pytest
+
+from Model.ai_pool import AIRequestPool, AIPoolFull
+
+
+def _wait_queued(pool, code, n):
+    deadline = time.time() + 2
+    while pool.stats()["waiting"].get(code, 0) < n and time.time() < deadline:
+        time.sleep(0.005)
+
+
+# T-063 — US-015: Freed AI slots go to waiting rooms round-robin
+def test_ai_pool_round_robin_between_rooms():
+    pool = AIRequestPool(concurrency=1, max_queue_per_room=5)
+    assert pool.acquire("BUSY")
+
+    order = []
+
+    def worker(code, tag):
+        with pool.slot(code):
+            order.append(tag)
+
+    threads = []
+    for code, tag in (("A", "a1"), ("A", "a2"), ("A", "a3"), ("B", "b1")):
+        t = threading.Thread(target=worker, args=(code, tag))
+        t.start()
+        threads.append(t)
+        _wait_queued(pool, code, int(tag[1:]) if code == "A" else 1)
+
+    pool.release()
+    for t in threads:
+        t.join(2)
+
+    assert order == ["a1", "b1", "a2", "a3"]
+    assert pool.stats() == {"concurrency": 1, "active": 0, "waiting": {}}
+
+
+# T-064 — US-015: A room can't queue more than its limit, waiting can time out
+def test_ai_pool_queue_limit_and_timeout():
+    pool = AIRequestPool(concurrency=1, max_queue_per_room=1)
+    assert pool.acquire("A")
+
+    t = threading.Thread(target=pool.acquire, args=("B", 1))
+    t.start()
+    _wait_queued(pool, "B", 1)
+
+    with pytest.raises(AIPoolFull):
+        pool.acquire("B")
+    assert pool.acquire("C", timeout=0.05) is False
+    assert "C" not in pool.stats()["waiting"]
+
+    pool.release()   # goes to B
+    t.join(2)
+    assert pool.stats()["active"] == 1
@@ -0,0 +1,49 @@
+from Model.ai_throttle import TokenBucket, CircuitBreaker
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+# T-065 — US-016: Token bucket allows a burst, then refills at the quota rate
+def test_token_bucket_burst_and_refill():
+    clock = _Clock()
+    bucket = TokenBucket(rate_per_min=60, burst=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.take() and bucket.take()
+    assert bucket.take() is False            # empty, won't wait
+    assert bucket.take(timeout=0.5) is False  # next token is 1s away
+    assert bucket.take(timeout=2) is True     # waits for it
+    assert clock.now == 1.0
+
+
+# T-066 — US-016: Breaker trips, fails fast while open, then lets one probe through
+def test_circuit_breaker_open_and_half_open_probe():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.allow() is False
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow() is True
+    assert breaker.allow() is False          # only one probe at a time
+    breaker.record_failure()
+    assert breaker.status()["state"] == "open"
+    assert breaker.status()["trips"] == 2
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
@@ -0,0 +1,43 @@
+from Model import ai_usage
+from Model.ai_generator import AIGenerator
+from Model.ai_usage import AIBudget, AIUsage
+from Model.fake_gemini import FakeGeminiClient
+
+
+# T-083 — US-025: Calls made inside a room's scope are charged to the room and the process
+def test_ai_calls_charged_to_room_and_process(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "fake-key")
+    ai = AIGenerator()
+    monkeypatch.setattr(ai, "client", FakeGeminiClient(seed=5))
+
+    room_usage = AIUsage()
+    before = ai_usage.process_usage.calls
+    with ai_usage.usage_scope(room_usage):
+        assert ai.generate_truth(["What is your dream job?"])
+        ai.generate_mixed(2, 2, [], [])
+    ai.generate_dare([])   # outside any room
+
+    snap = room_usage.snapshot()
+    assert snap["calls"] == 2
+    assert snap["prompt_tokens"] > 100 and snap["response_tokens"] > 0
+    assert snap["tokens"] == snap["prompt_tokens"] + snap["response_tokens"]
+    assert ai_usage.process_usage.calls - before == 3
+    assert ai.get_status()["usage"]["process"]["calls"] >= 3
+
+
+# T-084 — US-025: Room and global budgets switch AI calls off once used up
+def test_ai_budgets(monkeypatch):
+    monkeypatch.setattr(ai_usage, "room_budget", AIBudget(max_calls=2))
+    monkeypatch.setattr(ai_usage, "global_budget", AIBudget())
+
+    usage = AIUsage()
+    usage.record_call(50, 10, 0.2)
+    assert not ai_usage.over_budget(usage)
+    usage.record_call(50, 10, 0.2)
+    assert ai_usage.over_budget(usage)
+    assert not ai_usage.over_budget(AIUsage())
+
+    spent = ai_usage.process_usage.tokens
+    monkeypatch.setattr(ai_usage, "global_budget", AIBudget(max_tokens=spent))
+    assert ai_usage.over_budget(AIUsage())
+    assert ai_usage.status()["global_over_budget"]
@@ -0,0 +1,48 @@
+from Model.content_index import ContentIndex
+from Model.room import Room
+from Model.player import Player
+
+
+# T-059 — US-011: Index counts every copy and normalizes before comparing
+def test_content_index_is_a_normalized_multiset():
+    idx = ContentIndex(["What's up?"])
+    idx.add("whats UP")
+
+    assert "Whats up" in idx
+    idx.discard("what's up?")
+    assert "whats up" in idx   # one copy left
+    idx.discard("WHATS UP!!")
+    assert "whats up" not in idx
+    assert len(idx) == 0
+
+
+# T-060 — US-011: Room index follows submissions, draws, edits and leaving players
+def test_room_index_tracks_room_content():
+    room = Room("IDX01")
+    room.set_defaults(["Default truth?"], ["Default dare"])
+    room.update_all_players_defaults()
+    alice, bob = Player("s1", "Alice"), Player("s2", "Bob")
+    room.add_player(alice)
+    room.add_player(bob)
+
+    assert room.has_content("truth", "default TRUTH")
+    assert not room.has_content("truth", "Queued truth?")
+
+    bob.truth_dare_list.add_truth("Queued truth?", submitted_by="Alice")
+    assert room.has_content("truth", "queued truth")
+    assert bob.knows_truth("Queued truth?") and not alice.knows_truth("Queued truth?")
+
+    # drawn -> used, still in the room
+    while True:
+        item = bob.truth_dare_list.draw_truth()
+        if item is None:
+            break
+        bob.mark_truth_used(item.text, item.norm)
+    assert room.has_content("truth", "Queued truth?")
+
+    room.edit_default_truth("Default truth?", "Edited truth?")
+    assert room.has_content("truth", "Edited truth?")
+
+    room.remove_player("s2")
+    assert not room.has_content("truth", "Queued truth?")
+    assert not room.has_content("truth", "Default truth?")
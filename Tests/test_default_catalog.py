@@ -0,0 +1,33 @@
+import json
+import os
+
+from Model import default_catalog
+from Model.player import Player
+
+
+# T-057 — US-008: Default catalog is parsed once and shared by every player
+def test_catalog_shared_between_players():
+    p1 = Player("s1", "Alice")
+    p2 = Player("s2", "Bob")
+
+    assert p1.truth_dare_list.truths[0] is p2.truth_dare_list.truths[0]
+    assert default_catalog.get_default_catalog() is default_catalog.get_default_catalog()
+
+
+# T-058 — US-008: Catalog reloads only when the file's mtime changes
+def test_catalog_reloads_on_mtime_change(tmp_path, monkeypatch):
+    path = tmp_path / "defaults.json"
+    path.write_text(json.dumps({"truths": ["T1"], "dares": ["D1"]}))
+    monkeypatch.setattr(default_catalog, "CATALOG_PATH", str(path))
+    monkeypatch.setattr(default_catalog, "_catalog", None)
+
+    first = default_catalog.get_default_catalog()
+    assert first.truth_texts == ("T1",)
+    assert default_catalog.get_default_catalog() is first
+
+    path.write_text(json.dumps({"truths": ["T1", "T2"], "dares": []}))
+    os.utime(path, (first.mtime + 5, first.mtime + 5))
+
+    second = default_catalog.get_default_catalog()
+    assert second is not first
+    assert second.truth_texts == ("T1", "T2")
@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+import pytest
+
+from Model.ai_generator import AIGenerator
+from Model.fake_gemini import FakeGeminiClient, FakeGeminiError
+
+
+def _generator(monkeypatch, client):
+    monkeypatch.setenv("GEMINI_API_KEY", "fake-key")
+    monkeypatch.setenv("AI_RATE_PER_MIN", "6000")
+    monkeypatch.setenv("AI_RATE_BURST", "50")
+    ai = AIGenerator()
+    monkeypatch.setattr(ai, "client", client)
+    return ai
+
+
+# T-073 — US-020: Async calls overlap on one event loop and are charged like blocking ones
+def test_async_generation_runs_concurrently(monkeypatch):
+    from Model import ai_usage
+    from Model.ai_usage import AIUsage
+
+    client = FakeGeminiClient(latency=0.2, seed=1)
+    ai = _generator(monkeypatch, client)
+    room_usage = AIUsage()
+
+    async def run():
+        with ai_usage.usage_scope(room_usage):
+            return await asyncio.gather(
+                *[ai.agenerate_truth([]) for _ in range(10)],
+                ai.agenerate_dare([]),
+                ai.agenerate_mixed(2, 1, [], []),
+            )
+
+    start = time.monotonic()
+    results = asyncio.run(run())
+    elapsed = time.monotonic() - start
+
+    truths, dare, batch = results[:10], results[10], results[11]
+    assert elapsed < 1.0
+    assert len(set(truths)) == 10 and all(t.endswith("?") for t in truths)
+    assert dare and not dare.endswith("?")
+    assert len(batch["truths"]) == 2 and len(batch["dares"]) == 1
+    assert client.calls == 12
+    assert room_usage.calls == 12 and room_usage.response_tokens > 0
+    assert ai.health.snapshot()["calls"] == 12
+
+
+# T-074 — US-020: Fake backend errors count against the breaker on the async path too
+def test_async_generation_errors_trip_breaker(monkeypatch):
+    monkeypatch.setenv("AI_BREAKER_FAILURES", "3")
+    client = FakeGeminiClient(error_rate=1.0, seed=2)
+    ai = _generator(monkeypatch, client)
+
+    async def run():
+        return [await ai.agenerate_truth([]) for _ in range(5)]
+
+    assert asyncio.run(run()) == [None] * 5
+    assert client.calls == 3
+    assert ai.get_status()["circuit_breaker"]["state"] == "open"
+    assert ai.health.snapshot()["last_error"].startswith("503")
+
+
+# T-079 — US-023: AI_BACKEND=fake turns the AI on with no key and no network
+def test_fake_backend_selected_by_env(monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.setenv("AI_BACKEND", "fake")
+    monkeypatch.setenv("AI_FAKE_LATENCY", "0")
+    ai = AIGenerator()
+
+    assert ai.enabled and isinstance(ai.client, FakeGeminiClient)
+    assert ai.get_status()["backend"] == "fake"
+    assert "seconds" in ai.generate_dare([])
+
+    monkeypatch.setenv("AI_BACKEND", "nope")
+    assert AIGenerator().enabled is False
+
+
+# T-080 — US-023: Fake backend repeats items and enforces its throughput cap
+def test_fake_backend_duplicates_and_rate_cap():
+    client = FakeGeminiClient(duplicate_rate=1.0, max_rps=3, seed=4)
+    first = client.models.generate_content(contents="truth please").text
+    assert client.models.generate_content(contents="truth please").text == first
+    client.models.generate_content(contents="truth please")
+
+    with pytest.raises(FakeGeminiError, match="429"):
+        client.models.generate_content(contents="truth please")
+    assert client.throttled == 1
+
+
+# T-090 — US-023: Fresh fake items read as different items, not rewordings of each other
+def test_fake_items_are_not_near_duplicates():
+    from Model.near_duplicate import NearDuplicateIndex
+    from Model.truth_dare import normalize_text
+
+    client = FakeGeminiClient(seed=6)
+    for kind in ("truth", "dare"):
+        idx = NearDuplicateIndex()
+        for _ in range(500):
+            text = client._item(kind)
+            norm = normalize_text(text)
+            assert idx.find(text, norm) is None
+            idx.add(text, norm)
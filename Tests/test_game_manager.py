@@ -35,3 +35,34 @@ def test_add_and_remove_player(game_manager):
     room = game_manager.get_room(code)
     # After removal, room should be deleted because it is empty
     assert room is None
+
+
+# T-004 — US-021: Destroying a room bumps its epoch and frees its pending timers
+def test_delete_room_cancels_timers(game_manager):
+    from Model.scheduler import get_scheduler
+
+    code = game_manager.create_room()
+    room = game_manager.get_room(code)
+    epoch = room.game_state.epoch
+    get_scheduler().call_later(60, lambda: None, key=code)
+
+    game_manager.delete_room(code)
+
+    assert room.game_state.epoch > epoch
+    assert get_scheduler().pending_count(code) == 0
+
+
+# T-002b — US-021: Disconnect only touches the rooms that sid is in
+def test_remove_player_from_all_rooms_uses_sid_index(game_manager):
+    a = game_manager.create_room()
+    b = game_manager.create_room()
+    game_manager.add_player_to_room(a, "s1", "Alice")
+    game_manager.add_player_to_room(a, "s2", "Bob")
+    game_manager.add_player_to_room(b, "s1", "Alice")
+    game_manager.add_player_to_room(b, "s3", "Cara")
+
+    updated = game_manager.remove_player_from_all_rooms("s1")
+
+    assert sorted(updated) == sorted([a, b])
+    assert game_manager.get_room(a).get_player_by_sid("s1") is None
+    assert game_manager.remove_player_from_all_rooms("s1") == []
@@ -37,3 +37,15 @@ def test_skip_vote_logic():
 
     gs.activate_skip()
     assert gs.skip_activated
+
+
+# T-012b — US-015: Reducing the timer moves the deadline the end-of-round callback is armed on
+def test_seconds_until_deadline_follows_reduce_timer():
+    gs = GameState()
+    assert gs.get_seconds_until_deadline() is None
+
+    gs.start_truth_dare(60)
+    assert 59 <= gs.get_seconds_until_deadline() <= 60
+
+    gs.reduce_timer(5)
+    assert 4 <= gs.get_seconds_until_deadline() <= 5
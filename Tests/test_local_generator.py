@@ -0,0 +1,53 @@
+import random
+
+from Model.local_generator import LocalGenerator
+from Model.truth_dare import normalize_text
+
+
+CATALOG = [
+    "What is the scariest movie you have ever watched?",
+    "What is the best gift you have ever received?",
+    "What is the worst meal you have ever cooked?",
+    "What is the longest walk you have ever taken?",
+]
+
+
+# T-071 — US-019: Local generator recombines the catalog into something new
+def test_local_generator_recombines_catalog():
+    gen = LocalGenerator(CATALOG, rng=random.Random(3))
+    known = {normalize_text(t) for t in CATALOG}
+
+    txt = gen.generate("truth", exclude=lambda t, n: n in known)
+
+    assert txt and txt.endswith("?")
+    assert normalize_text(txt) not in known
+    assert txt.startswith("What is the")
+
+
+# T-072 — US-019: Falls back to templates when there's nothing to recombine
+def test_local_generator_templates_without_catalog():
+    gen = LocalGenerator([], rng=random.Random(1))
+    seen = set()
+    for _ in range(5):
+        txt = gen.generate("dare", exclude=lambda t, n: n in seen)
+        assert txt
+        seen.add(normalize_text(txt))
+    assert len(seen) == 5
+
+
+# T-091 — US-019: Local items are room content but not credited to the AI
+def test_room_local_items_kept_apart_from_ai():
+    from Model.room import Room
+
+    room = Room("LOCAL1")
+    room.set_defaults(CATALOG, [])
+    gen = room.local_generator("truth")
+    assert room.local_generator("truth") is gen          # cached while content is unchanged
+
+    txt = gen.generate("truth", exclude=lambda t, n: room.has_content("truth", t, n))
+    assert room.add_local_generated("truth", txt)
+    assert not room.add_local_generated("truth", txt)
+    assert room.has_content("truth", txt)
+    assert room.local_generated["truth"] == [txt]
+    assert room.ai_generated_truths == []
+    assert room.local_generator("truth") is not gen      # rebuilt with the new item
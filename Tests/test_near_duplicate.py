@@ -0,0 +1,108 @@
+from Model.content_index import ContentIndex
+from Model.near_duplicate import NearDuplicateIndex
+from Model.room import Room
+from Model.truth_dare import normalize_text
+
+
+# T-075 — US-021: Rewordings are caught, unrelated texts and removed items are not
+def test_near_duplicate_index_find_and_remove():
+    idx = NearDuplicateIndex(threshold=0.7)
+    for text in ("What is your biggest fear?", "Do 10 pushups"):
+        idx.add(text, normalize_text(text))
+
+    def find(text):
+        return idx.find(text, normalize_text(text))
+
+    assert find("What's your biggest fear?") == "whatisyourbiggestfear"
+    assert find("What is your biggest fear ever?") is not None
+    assert find("Sing a song loudly") is None
+    assert find("Do 20 pushups") is None
+
+    idx.remove("whatisyourbiggestfear")
+    assert find("What's your biggest fear?") is None
+    assert len(idx) == 1
+
+
+# T-076 — US-021: Room index tracks near-duplicates as content comes and goes
+def test_room_near_duplicate_follows_content():
+    room = Room("ROOMND")
+    room.set_defaults(["What is your biggest fear?"], ["Do 10 pushups"])
+
+    assert room.is_near_duplicate("truth", "What's your biggest fear")
+    assert not room.has_content("truth", "What's your biggest fear")
+    assert not room.is_near_duplicate("dare", "What's your biggest fear")
+
+    room.set_defaults([], ["Do 10 pushups"])
+    assert not room.is_near_duplicate("truth", "What's your biggest fear")
+
+    plain = ContentIndex(["What is your biggest fear?"])
+    assert plain.find_near("What's your biggest fear") is None   # near lookups are opt-in
+
+
+# T-087 — US-021: A reworded question with the same content words is a near-duplicate
+def test_near_duplicate_matches_rewording():
+    room = Room("ROOMRW")
+    room.set_defaults(["What's your biggest fear?"], [])
+
+    assert room.is_near_duplicate("truth", "What is the thing you fear most?")
+
+
+# T-088 — US-021: Long questions that differ in one content word are different questions
+def test_near_duplicate_keeps_one_word_difference():
+    room = Room("ROOMOW")
+    room.set_defaults(
+        ["What is the most embarrassing thing you have ever done at school in front of your friends?"], [])
+
+    assert not room.is_near_duplicate(
+        "truth", "What is the most embarrassing thing you have ever done at work in front of your friends?")
+    assert room.is_near_duplicate(
+        "truth", "What's the most embarrassing thing you've done at school in front of friends?")
+
+
+# T-092 — US-021: Lookups from background tasks are safe while the room adds and removes
+def test_near_duplicate_concurrent_find():
+    import threading
+
+    room = Room("ROOMTS")
+    texts = [f"What is the weirdest {w} you ate at {p}?"
+             for w in ("snack", "fruit", "soup", "cake", "pie", "candy")
+             for p in ("school", "home", "camp", "work", "a party")]
+    stop = threading.Event()
+    errors = []
+
+    def churn():
+        while not stop.is_set():
+            for t in texts:
+                room.truth_index.add(t)
+            for t in texts:
+                room.truth_index.discard(t)
+
+    def look():
+        try:
+            for _ in range(3000):
+                room.is_near_duplicate("truth", "What's the weirdest soup you ate at camp?")
+        except Exception as e:
+            errors.append(e)
+
+    writer = threading.Thread(target=churn)
+    readers = [threading.Thread(target=look) for _ in range(2)]
+    writer.start()
+    for r in readers:
+        r.start()
+    for r in readers:
+        r.join()
+    stop.set()
+    writer.join()
+    assert errors == []
+
+
+# T-093 — US-021: The configured threshold moves the bar for long texts as well
+def test_near_duplicate_threshold_applies_to_long_texts():
+    from Model.near_duplicate import is_near, word_shingles
+
+    a = word_shingles("What is the most embarrassing thing you have ever done at school in front of your friends?")
+    b = word_shingles("What is the most embarrassing thing you have ever done at work in front of your friends?")
+
+    assert not is_near(a, b, 0.7)
+    assert is_near(a, b, 0.5)
+    assert not is_near(a, b, 0.9)
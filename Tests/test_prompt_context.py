@@ -0,0 +1,60 @@
+from Model.ai_generator import _existing_block
+from Model.prompt_context import PromptWindow
+from Model.room import Room
+
+
+# T-081 — US-024: Window keeps the newest distinct texts and skips near copies
+def test_prompt_window_newest_first_and_bounded():
+    w = PromptWindow(size=3)
+    for t in ("Truth one about pets?", "Truth two about school?", "Truth three about food?"):
+        w.add(t)
+    snap = w.items()
+    assert w.items() is snap                                 # unchanged -> same tuple
+
+    w.add("Truth one about pets??")                          # near copy, left out
+    assert w.items() == ("Truth one about pets??", "Truth three about food?", "Truth two about school?")
+    w.add("Something else entirely?")
+    assert w.items() == ("Something else entirely?", "Truth one about pets??", "Truth three about food?")
+
+    w.add("Something else entirely??")
+    assert w.items()[0] == "Something else entirely??"
+    assert len(w.items()) == 3 and "Something else entirely?" not in w.items()
+
+
+# T-082 — US-024: Room context follows new content and the rendered list is reused
+def test_room_ai_context_tracks_new_items():
+    room = Room("CTX1")
+    room.set_defaults(["What is your favourite movie?"], ["Do 10 pushups"])
+    assert room.ai_context("truth") == ("What is your favourite movie?",)   # seeded from the defaults
+
+    room.add_ai_generated_truth("Who do you text the most?")
+    room.add_default_truth("What is your dream job?")
+
+    ctx = room.ai_context("truth")
+    assert ctx == ("What is your dream job?", "Who do you text the most?", "What is your favourite movie?")
+    assert room.ai_context("truth") is ctx
+
+    first = _existing_block("Existing truth questions", ctx)
+    assert _existing_block("Existing truth questions", room.ai_context("truth")) is first
+
+
+# T-094 — US-024: Drawn defaults go to the front of the prompt context
+def test_room_ai_context_keeps_used_defaults():
+    from Model.player import Player
+
+    defaults = [f"What is the {w} you have ever {v}?"
+                for w in ("weirdest food", "oldest photo", "strangest gift", "loudest song",
+                          "funniest joke", "worst haircut", "smallest lie", "coldest room")
+                for v in ("kept", "shared", "lost", "bought", "found")]
+    room = Room("CTX2")
+    room.set_defaults(defaults, [])
+    alice = Player("s1", "Alice")
+    room.add_player(alice)
+    assert len(room.ai_context("truth")) == 30               # seed: a sample of the 40 defaults
+
+    for t in defaults:                                       # defaults already count once in the room
+        alice.mark_truth_used(t)
+
+    ctx = room.ai_context("truth")
+    assert len(ctx) == 30
+    assert ctx[:3] == (defaults[-1], defaults[-2], defaults[-3])
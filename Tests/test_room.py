@@ -26,3 +26,24 @@ def test_host_reassignment():
     room.remove_player("s1")
     # Host should be reassigned to the remaining player
     assert room.host_sid == "s2"
+
+
+# T-024b — US-024: Sid/name lookups stay in sync with joins and leaves
+def test_player_indexes_follow_add_remove():
+    room = Room("IDX001")
+
+    first = Player("s1", "Sam")
+    second = Player("s2", "Sam")   # same display name
+    room.add_player(first)
+    room.add_player(second)
+
+    assert room.get_player_by_sid("s2") is second
+    assert room.get_player_by_name("Sam") is first
+
+    room.remove_player("s1")
+    assert room.get_player_by_sid("s1") is None
+    assert room.get_player_by_name("Sam") is second
+
+    room.remove_player("s2")
+    assert room.get_player_by_name("Sam") is None
+    assert room.is_empty()
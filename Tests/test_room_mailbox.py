@@ -0,0 +1,31 @@
+import threading
+
+import pytest
+
+from Model.room_mailbox import RoomMailbox
+
+
+# T-053 — US-005: Posted and called room events run one at a time, in arrival order
+def test_mailbox_runs_events_in_order():
+    mb = RoomMailbox()
+    seen = []
+    release = threading.Event()
+
+    mb.post(release.wait, 2)   # hold the mailbox busy for a moment
+    for i in range(5):
+        mb.post(seen.append, i)
+
+    release.set()
+    assert mb.call(lambda: list(seen)) == [0, 1, 2, 3, 4]
+
+
+# T-054 — US-005: call() hands back results/errors and is safe to nest inside a room event
+def test_mailbox_call_result_and_nesting():
+    mb = RoomMailbox()
+
+    assert mb.call(lambda: mb.call(lambda: 42)) == 42
+
+    with pytest.raises(ValueError):
+        mb.call(int, "not a number")
+
+    assert mb.pending_count() == 0
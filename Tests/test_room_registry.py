@@ -0,0 +1,33 @@
+from Model.room import Room
+from Model.room_registry import RoomRegistry
+
+
+# T-055 — US-001: Sharded registry behaves like the old rooms dict
+def test_registry_dict_behaviour():
+    reg = RoomRegistry(shard_count=4)
+    codes = [f"ROOM{i:02d}" for i in range(10)]
+    for c in codes:
+        assert reg.add_new(c, Room(c))
+
+    assert not reg.add_new("ROOM00", Room("ROOM00"))   # collision refused
+    assert len(reg) == 10
+    assert "ROOM03" in reg
+    assert reg["ROOM03"].code == "ROOM03"
+    assert sorted(reg.keys()) == codes
+
+    del reg["ROOM03"]
+    assert reg.get("ROOM03") is None
+
+    reg.clear()
+    assert len(reg) == 0
+
+
+# T-056 — US-021: pop_if only removes the room while the check still holds
+def test_registry_pop_if():
+    reg = RoomRegistry()
+    room = reg.get_or_create("ABC123", Room)
+    assert reg.get_or_create("ABC123", Room) is room
+
+    assert reg.pop_if("ABC123", lambda r: not r.is_empty()) is None
+    assert reg.pop_if("ABC123", lambda r: r.is_empty()) is room
+    assert "ABC123" not in reg
@@ -0,0 +1,50 @@
+import threading
+
+from Model.scheduler import TimerScheduler
+
+
+# T-050 — US-005: Timers fire in deadline order from the shared worker
+def test_timers_fire_in_order():
+    sched = TimerScheduler()
+    fired = []
+    done = threading.Event()
+
+    sched.call_later(0.10, lambda: (fired.append("late"), done.set()))
+    sched.call_later(0.02, fired.append, "early")
+
+    assert done.wait(2)
+    assert fired == ["early", "late"]
+    assert sched.pending_count() == 0
+
+
+# T-051 — US-005: Cancelled timers never fire and stop counting as pending
+def test_cancel_timer():
+    sched = TimerScheduler()
+    fired = []
+    done = threading.Event()
+
+    t = sched.call_later(0.05, fired.append, "cancelled")
+    sched.call_later(0.10, done.set)
+    assert sched.pending_count() == 2
+
+    assert t.cancel()
+    assert not t.cancel()   # second cancel is a no-op
+    assert sched.pending_count() == 1
+
+    assert done.wait(2)
+    assert fired == []
+
+
+# T-052 — US-021: Cancelling a key drops every timer for that room at once
+def test_cancel_key_drops_room_timers():
+    sched = TimerScheduler()
+    fired = []
+
+    sched.call_later(30, fired.append, "a", key="ROOM01")
+    sched.call_later(30, fired.append, "b", key="ROOM01")
+    sched.call_later(30, fired.append, "c", key="ROOM02")
+    assert sched.pending_count("ROOM01") == 2
+
+    assert sched.cancel_key("ROOM01") == 2
+    assert sched.pending_count("ROOM01") == 0
+    assert sched.pending_count() == 1
@@ -39,3 +39,39 @@ def test_set_custom_defaults():
 
     assert texts_truths == custom_truths
     assert texts_dares == custom_dares
+
+
+# T-009b — US-012: Lists on one shared deck consume independently and share default objects
+def test_shared_deck_is_copy_on_write():
+    from Model.truth_dare_deck import SharedDeck
+
+    deck = SharedDeck.from_texts(["T1", "T2", "T3"], ["D1"])
+    a = TruthDareList(deck)
+    b = TruthDareList(deck)
+
+    a.remove_truth_by_text("T2")
+    a.add_truth("Mine", "Bob")
+
+    assert [t.text for t in a.truths] == ["T1", "T3", "Mine"]
+    assert [t.text for t in b.truths] == ["T1", "T2", "T3"]
+    assert a.truths[0] is b.truths[0]
+    assert deck.truths[1].text == "T2"   # the deck itself is never touched
+
+
+# T-009c — US-012: Draws hand out every remaining item exactly once, submissions included
+def test_draw_until_empty():
+    lst = TruthDareList()
+    lst.set_custom_defaults([f"T{i}" for i in range(50)], [])
+    lst.add_truth("Submitted", "Alice")
+    lst.remove_truth_by_text("T7")
+
+    drawn = []
+    while True:
+        t = lst.draw_truth()
+        if t is None:
+            break
+        drawn.append(t.text)
+        assert lst.get_count()["truths"] == 50 - len(drawn)
+
+    assert sorted(drawn) == sorted([f"T{i}" for i in range(50) if i != 7] + ["Submitted"])
+    assert lst.truths == []
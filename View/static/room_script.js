@@ -308,6 +308,8 @@ function updateGameUI() {
     
     if (gameState.current_truth_dare) {
       challengeText.textContent = gameState.current_truth_dare.text;
+      // AI item still on its way
+      challengeText.style.fontStyle = gameState.generating ? 'italic' : 'normal';
       
       // Add warning styling if list was empty
       if (gameState.list_empty) {
@@ -1,3 +1,15 @@
+import os
+
+# Concurrency model, picked once at startup: "eventlet" (default, green threads,
+# also what gunicorn -k eventlet expects) or "threading" (real OS threads).
+# Eventlet has to patch the stdlib before anything else imports socket/threading/time.
+ASYNC_MODE = os.environ.get("ASYNC_MODE", "eventlet").strip().lower()
+if ASYNC_MODE == "eventlet":
+    import eventlet
+    eventlet.monkey_patch()
+elif ASYNC_MODE != "threading":
+    raise ValueError(f"Unsupported ASYNC_MODE '{ASYNC_MODE}' (use threading or eventlet)")
+
 from flask import Flask
 from flask_socketio import SocketIO
 
@@ -10,11 +22,11 @@ app = Flask(__name__, template_folder='View', static_folder='View/static')
 app.config['SECRET_KEY'] = 'prts-is-watching-you'  # might to move this to env later
 
 # Initialize Socket.IO with cross-origin enabled
-socketio = SocketIO(app, cors_allowed_origins='*')
+socketio = SocketIO(app, cors_allowed_origins='*', async_mode=ASYNC_MODE)
 
 # Create main game manager object
 game_manager = GameManager()
-print(f"[INIT] GameManager instance created (id={id(game_manager)})")
+print(f"[INIT] GameManager instance created (id={id(game_manager)}, async_mode={socketio.async_mode})")
 
 # Attach routes and socket handlers
 register_routes(app, game_manager)